@@ -1,231 +1,100 @@
-import cv2
-import mediapipe as mp
+import numpy as np
 import pygame
-import sys
+import os
 import random
 import math
-
-# Initialize Pygame and screen settings
-pygame.init()
-screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN | pygame.DOUBLEBUF | pygame.HWSURFACE)
-SCREEN_WIDTH = screen.get_width()
-SCREEN_HEIGHT = screen.get_height()
-pygame.display.set_caption("Mario Game - Gesture Controlled")
-
-# Texture generation functions for Jump King style blocks
-def create_stone_texture(width, height, base_color=(120, 100, 80)):
-    """Create a stone texture similar to Jump King with better seamless tiling"""
-    texture = pygame.Surface((width, height))
-    
-    # Base color fill
-    texture.fill(base_color)
-    
-    # Add noise and variation with position-based smoothing for seamless tiling
-    for y in range(height):
-        for x in range(width):
-            # Create stone-like variation with smoother transitions
-            position_noise = math.sin(x * 0.4) * math.cos(y * 0.3) * 12
-            random_noise_r = random.randint(-15, 15)
-            random_noise_g = random.randint(-12, 12)  
-            random_noise_b = random.randint(-10, 10)
-            
-            total_noise_r = int(position_noise + random_noise_r)
-            total_noise_g = int(position_noise * 0.8 + random_noise_g)
-            total_noise_b = int(position_noise * 0.6 + random_noise_b)
-            
-            r = max(0, min(255, base_color[0] + total_noise_r))
-            g = max(0, min(255, base_color[1] + total_noise_g))
-            b = max(0, min(255, base_color[2] + total_noise_b))
-            
-            # Add some stone patterns (less frequent for subtlety)
-            if random.random() < 0.08:  # Stone grain
-                r = max(0, r - 25)
-                g = max(0, g - 20)
-                b = max(0, b - 15)
-            elif random.random() < 0.06:  # Lighter spots
-                r = min(255, r + 30)
-                g = min(255, g + 25)
-                b = min(255, b + 20)
-                
-            texture.set_at((x, y), (r, g, b))
-    
-    # Add fewer, more subtle crack lines
-    for _ in range(random.randint(1, 3)):
-        start_x = random.randint(0, width-1)
-        start_y = random.randint(0, height-1)
-        end_x = start_x + random.randint(-15, 15)
-        end_y = start_y + random.randint(-8, 8)
-        end_x = max(0, min(width-1, end_x))
-        end_y = max(0, min(height-1, end_y))
-        
-        crack_color = (max(0, base_color[0] - 25), max(0, base_color[1] - 20), max(0, base_color[2] - 15))
-        pygame.draw.line(texture, crack_color, (start_x, start_y), (end_x, end_y), 1)
-    
-    return texture
-
-def create_grass_ground_texture(width, height):
-    """Create grass-topped ground texture with better seamless tiling"""
-    texture = pygame.Surface((width, height))
-    
-    # Dirt base with more natural variation
-    dirt_color = (101, 67, 33)
-    texture.fill(dirt_color)
-    
-    # Add dirt variation with smoother transitions
-    for y in range(height):
-        for x in range(width):
-            if y > 4:  # Below grass line
-                # Create smoother noise using position-based variation
-                noise_factor = (math.sin(x * 0.3) + math.cos(y * 0.2)) * 8
-                base_noise = random.randint(-8, 8)
-                total_noise = int(noise_factor + base_noise)
-                
-                r = max(0, min(255, dirt_color[0] + total_noise))
-                g = max(0, min(255, dirt_color[1] + total_noise))
-                b = max(0, min(255, dirt_color[2] + total_noise))
-                texture.set_at((x, y), (r, g, b))
-    
-    # Create more natural grass top layer
-    grass_height = 6
-    for y in range(min(grass_height, height)):
-        for x in range(width):
-            # Use position-based variation for seamless tiling
-            grass_variation = math.sin(x * 0.2) * math.cos(y * 0.4) * 15
-            
-            if y < 2:  # Top grass layer
-                base_green = (45 + int(grass_variation), 120 + int(grass_variation * 0.8), 35 + int(grass_variation * 0.5))
-            elif y < 4:  # Mid grass layer  
-                base_green = (40 + int(grass_variation * 0.7), 100 + int(grass_variation * 0.6), 30 + int(grass_variation * 0.4))
-            else:  # Grass/dirt transition
-                base_green = (60 + int(grass_variation * 0.5), 80 + int(grass_variation * 0.4), 35 + int(grass_variation * 0.3))
-                
-            # Add subtle random variation
-            noise_r = random.randint(-5, 5)
-            noise_g = random.randint(-8, 12)
-            noise_b = random.randint(-5, 5)
-            
-            r = max(0, min(255, base_green[0] + noise_r))
-            g = max(0, min(255, base_green[1] + noise_g))
-            b = max(0, min(255, base_green[2] + noise_b))
-            
-            # Add occasional grass blade highlights (less frequent for subtlety)
-            if random.random() < 0.1:
-                g = min(255, g + 20)
-                r = max(0, r - 5)
-                
-            texture.set_at((x, y), (r, g, b))
-    
-    # Add some small dirt spots for realism
-    for _ in range(random.randint(3, 7)):
-        spot_x = random.randint(0, width-3)
-        spot_y = random.randint(grass_height-2, height-1)
-        spot_size = random.randint(1, 2)
-        
-        dirt_spot_color = (dirt_color[0] + random.randint(-10, 10),
-                          dirt_color[1] + random.randint(-10, 10), 
-                          dirt_color[2] + random.randint(-10, 10))
-        
-        for dy in range(spot_size):
-            for dx in range(spot_size):
-                if (spot_x + dx < width and spot_y + dy < height):
-                    texture.set_at((spot_x + dx, spot_y + dy), dirt_spot_color)
-    
-    return texture
-
-def draw_textured_rect(surface, texture, rect, offset_x=0):
-    """Draw a rectangle with tiled texture, with optional horizontal offset for scrolling"""
-    if texture:
-        texture_width = texture.get_width()
-        texture_height = texture.get_height()
-        
-        # Fix the offset calculation to handle negative values properly
-        # This ensures seamless tiling when scrolling in both directions
-        offset_mod = offset_x % texture_width
-        start_x = rect.x - texture_width + offset_mod
-        
-        # Tile the texture across the rectangle with extra coverage
-        for x in range(start_x, rect.x + rect.width + texture_width, texture_width):
-            for y in range(rect.y, rect.y + rect.height, texture_height):
-                # Calculate how much of the texture to draw
-                draw_x = max(rect.x, x)
-                draw_y = max(rect.y, y)
-                
-                # Only draw if the tile overlaps with the target rectangle
-                if draw_x < rect.x + rect.width and draw_y < rect.y + rect.height:
-                    clip_width = min(texture_width - (draw_x - x), rect.x + rect.width - draw_x)
-                    clip_height = min(texture_height - (draw_y - y), rect.y + rect.height - draw_y)
-                    
-                    if clip_width > 0 and clip_height > 0:
-                        # Calculate texture clip area
-                        tex_clip_x = max(0, draw_x - x)
-                        tex_clip_y = max(0, draw_y - y)
-                        texture_clip = pygame.Rect(tex_clip_x, tex_clip_y, clip_width, clip_height)
-                        surface.blit(texture, (draw_x, draw_y), texture_clip)
-
-# Generate textures with better sizes for seamless tiling
-stone_texture = create_stone_texture(32, 32, (120, 100, 80))
-platform_texture = create_stone_texture(32, 32, (90, 90, 120))  # Bluer platforms  
-
-# Create variety of platform textures for visual interest
-platform_textures = [
-    create_stone_texture(32, 32, (90, 90, 120)),   # Blue stone
-    create_stone_texture(32, 32, (100, 80, 120)),  # Purple stone  
-    create_stone_texture(32, 32, (80, 100, 90)),   # Green stone
-    create_stone_texture(32, 32, (120, 90, 80)),   # Brown stone
-]
+import time
+
+from assets import GAME_ASSETS, shared_assets
+from boss_warning import BossWarningFrames
+from camera_preview import CameraPreview
+from gestures import classify_gestures
+from platform_cache import PlatformSurfaceCache
+from pose_input import create_pose_input
+from pose_roi import PoseROITracker
+from pose_scheduler import InferenceScheduler
+from pose_tuner import PoseTuner
+from profiler import FrameProfiler, NullProfiler
+from projectiles import ProjectilePool
+from recording import LandmarkRecorder, pack_keys, read_recording_info, unpack_keys
+from text_cache import FontRegistry, TextCache
+from texture_cache import TextureCache
+from textures import create_stone_texture
+from world import World
+
+# Landmark recording: MARIO_RECORD=file saves every frame's landmarks, keys and simulation steps,
+# MARIO_REPLAY=file plays a recording back frame for frame (headless, uncapped, no camera or MediaPipe)
+RECORD_PATH = os.environ.get('MARIO_RECORD')
+REPLAY_PATH = os.environ.get('MARIO_REPLAY')
+
+# Frame profiler: MARIO_PROFILE=file.csv (or 1 for frame_profile.csv) times every loop stage,
+# F3 toggles the on-screen graph and the per-stage p50/p95/p99 are written to the CSV on exit
+PROFILE_PATH = os.environ.get('MARIO_PROFILE')
+if PROFILE_PATH == '1':
+    PROFILE_PATH = 'frame_profile.csv'
+
+# Headless mode: MARIO_HEADLESS_MINUTES=N simulates N minutes of play with no display, camera or
+# audio device, as fast as the CPU allows, then prints the game logic throughput and exits
+HEADLESS_MINUTES = float(os.environ.get('MARIO_HEADLESS_MINUTES', '0'))
+HEADLESS = HEADLESS_MINUTES > 0 or REPLAY_PATH is not None
+HEADLESS_STEPS_PER_FRAME = 4  # Simulation steps between rendered frames (a 30 FPS render of the 120 Hz sim)
+if HEADLESS:
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+# Level seed - same seed and screen size, same level. Replays use the recorded ones, headless runs default to 0
+HEADLESS_SCREEN_SIZE = (1920, 1080)
+if REPLAY_PATH:
+    GAME_SEED, HEADLESS_SCREEN_SIZE = read_recording_info(REPLAY_PATH)
+elif HEADLESS or 'MARIO_SEED' in os.environ:
+    GAME_SEED = int(os.environ.get('MARIO_SEED', '0'))
+else:
+    GAME_SEED = random.randrange(2 ** 32)
+
+# Pose backend: "inline" (blocks the loop), "thread", "process" (separate worker process)
+# or "scripted" (synthetic player, the headless default)
+POSE_BACKEND = os.environ.get('MARIO_POSE_BACKEND', 'scripted' if HEADLESS else 'thread')
+
+# Camera: MARIO_CAMERA is a camera index or a video file to play instead (for testing),
+# MARIO_CAMERA_SIZE / MARIO_CAMERA_FPS what to ask the webcam for (MJPG, one-frame queue)
+CAMERA_SOURCE = os.environ.get('MARIO_CAMERA', '0')
+if CAMERA_SOURCE.isdigit():
+    CAMERA_SOURCE = int(CAMERA_SOURCE)
+camera_width, camera_height = os.environ.get('MARIO_CAMERA_SIZE', '640x480').split('x')
+CAMERA_SETTINGS = {'width': int(camera_width), 'height': int(camera_height),
+                   'fps': int(os.environ.get('MARIO_CAMERA_FPS', '30'))}
+# MARIO_POSE_ROI=1 runs pose on a downscaled crop around the player instead of the whole frame
+POSE_ROI = os.environ.get('MARIO_POSE_ROI', '0') == '1'
+# When to run pose inference: "always", "motion" (skip still frames) or "adaptive" (also slow down on game over).
+# Gating saves CPU but sees a gesture that starts from rest a few frames late, so it is opt-in
+POSE_SCHEDULE = os.environ.get('MARIO_POSE_SCHEDULE', 'always')
+# Pose model complexity and input size are calibrated per machine to fit this inference budget (MARIO_POSE_TUNE=0 keeps
+# MediaPipe's defaults)
+POSE_TUNE = os.environ.get('MARIO_POSE_TUNE', '1') == '1'
+POSE_BUDGET_MS = float(os.environ.get('MARIO_POSE_BUDGET_MS', '25'))
+
+# Everything that shapes the game (level, bosses) draws from game_random, never from the global random -
+# the launcher's menu uses that between rounds, and a replay has no menu
+game_random = random.Random(GAME_SEED)
+shake_random = random.Random()  # Render-only randomness, kept off the seeded game RNG
+CONTROLS_TEXT = "Controls: Gestures (Move hands, Raise arms=Jump, Point forward=Shoot) | Keys: WASD/Arrows, X/Ctrl"
 
 
 clock = pygame.time.Clock()
 
-# Load Mario character and set initial position
-mario_img = pygame.image.load('mario.png').convert_alpha()
-mario_img = pygame.transform.scale(mario_img, (100, 100))  # Double the size
-obstacle_img = pygame.image.load('obstacle.png').convert_alpha()  # Replace with your image file name
-obstacle_img = pygame.transform.scale(obstacle_img, (45, 45))  # 1.5x the original size (halfway between original and tripled)
-# Load Boss image (single frame) and scale
-try:
-    boss_img_raw = pygame.image.load('boss_image.png').convert_alpha()
-    # Scale boss to thrice the current size
-    boss_img = pygame.transform.scale(boss_img_raw, (540, 540))  # Tripled from 180
-except Exception:
-    boss_img = pygame.Surface((540, 540), pygame.SRCALPHA)
-    boss_img.fill((200,0,0))
-
-    boss_x = SCREEN_WIDTH - boss_img.get_width()   # Update boss spawn position
-    boss_y = 50
-
-# Load bullet image
-try:
-    bullet_img_raw = pygame.image.load('bullet.png').convert_alpha()
-    bullet_img = pygame.transform.scale(bullet_img_raw, (40, 40))  # Much bigger bullets
-except Exception:
-    bullet_img = pygame.Surface((40, 40), pygame.SRCALPHA)
-    bullet_img.fill((255, 255, 0))  # Yellow fallback
-
-# Load boss face images (placeholders for now)
-try:
-    boss_face_neutral_raw = pygame.image.load('boss_face_neutral.png').convert_alpha()
-    boss_face_neutral = pygame.transform.scale(boss_face_neutral_raw, (180, 180))  # Tripled size
-except Exception:
-    # Placeholder: calm blue face (tripled size)
-    boss_face_neutral = pygame.Surface((180, 180), pygame.SRCALPHA)
-    pygame.draw.circle(boss_face_neutral, (100, 150, 255), (90, 90), 75)  # Tripled
-    pygame.draw.circle(boss_face_neutral, (50, 50, 50), (66, 75), 9)  # Left eye (tripled)
-    pygame.draw.circle(boss_face_neutral, (50, 50, 50), (114, 75), 9)  # Right eye (tripled)
-    pygame.draw.arc(boss_face_neutral, (50, 50, 50), (60, 105, 60, 30), 0, 3.14, 6)  # Smile (tripled)
-
-try:
-    boss_face_angry_raw = pygame.image.load('boss_face_angry.png').convert_alpha()
-    boss_face_angry = pygame.transform.scale(boss_face_angry_raw, (180, 180))  # Tripled size
-except Exception:
-    # Placeholder: angry red face (tripled size)
-    boss_face_angry = pygame.Surface((180, 180), pygame.SRCALPHA)
-    pygame.draw.circle(boss_face_angry, (255, 100, 100), (90, 90), 75)  # Tripled
-    pygame.draw.circle(boss_face_angry, (200, 0, 0), (66, 75), 9)  # Left eye (tripled)
-    pygame.draw.circle(boss_face_angry, (200, 0, 0), (114, 75), 9)  # Right eye (tripled)
-    pygame.draw.arc(boss_face_angry, (200, 0, 0), (60, 120, 60, 24), 3.14, 6.28, 6)  # Frown (tripled)
-# Mario settings
-mario_start_x, mario_start_y = 100, SCREEN_HEIGHT - 200  # Start higher to accommodate larger Mario
+# Fixed-timestep simulation: game state advances in SIM_DT steps however fast frames render.
+# A step is one frame of the old 120 FPS loop, so per-step speeds and gravity keep their tuning.
+SIM_DT = 1.0 / 120  # Seconds per simulation step
+SIM_STEP_MS = SIM_DT * 1000
+MAX_STEPS_PER_FRAME = 8  # After a long stall, drop the backlog instead of trying to catch up all at once
+RENDER_FPS = 120  # Render cap - dropping below it no longer slows the game down
+sim_time = 0.0  # Simulation clock in ms, used by game logic instead of pygame.time.get_ticks()
+sim_accumulator = 0.0  # Real time not yet simulated, in ms
+sim_wall_seconds = 0.0  # Wall time spent inside simulation_step, for the throughput report
+sim_steps = 0
+
+# Mario settings - the start height depends on the screen, see start()
+mario_start_x, mario_start_y = 100, 0
 mario_x, mario_y = mario_start_x, mario_start_y
 mario_speed_x = 5 
 gravity = 1.5  # Increased gravity for less floaty feeling
@@ -234,110 +103,209 @@ mario_velocity_y = 0
 on_ground = False
 scroll_offset = 0
 
-# Load background image for extended map
-try:
-    background_img = pygame.image.load('im2.png').convert()
-    background_img = pygame.transform.scale(background_img, (SCREEN_WIDTH * 2, SCREEN_HEIGHT))
-except:
-    background_img = None
-
-# Load background music
-try:
-    pygame.mixer.music.load('background_music.mp3')
-    pygame.mixer.music.play(-1)
-except:
-    print("Background music file not found")
-
-# Load boss spawn sound effect
-try:
-    angry_sound = pygame.mixer.Sound('angry_sound.mp3')
-except:
-    print("Angry sound file not found")
-    angry_sound = None
-
-# Load boss death sound effect
-try:
-    luigi_scream = pygame.mixer.Sound('luigi-woaaahh-scream.mp3')
-except:
-    print("Luigi scream sound file not found")
-    luigi_scream = None
-
-# Load sad meow sound effect for player death
-try:
-    sad_meow = pygame.mixer.Sound('sad-meow-song.mp3')
-except:
-    print("Sad meow sound file not found")
-    sad_meow = None
-
-# Initialize platforms list with more random variety
-def generate_random_platforms():
-    """Generate random initial platforms relative to ground"""
-    initial_platforms = []
-    x_positions = [500, 1000, 1500]  # Base positions
-    for i, base_x in enumerate(x_positions):
-        # Add some randomness to position and size
-        x = base_x + random.randint(-100, 100)
-        # Platform Y positions relative to ground (150-300 pixels above ground for higher Mario jump)
-        y = (SCREEN_HEIGHT - 50) - random.randint(150, 300)  # Higher platforms for bigger Mario
-        width = random.choice([200, 250, 300, 350, 400])  # Larger platform widths
-        height = random.choice([20, 25, 30])  # Slightly thicker platforms
-        texture_id = random.randint(0, len(platform_textures) - 1)
-        
-        platform = {'rect': pygame.Rect(x, y, width, height), 'texture_id': texture_id}
-        initial_platforms.append(platform)
-        
-        # Sometimes add an extra platform nearby
-        if random.random() < 0.4:  # 40% chance
-            extra_x = x + random.randint(200, 400)
-            extra_y = y + random.randint(-80, 80)  # More vertical variation
-            # Keep platforms reasonable distance from ground
-            extra_y = max(SCREEN_HEIGHT - 350, min(SCREEN_HEIGHT - 120, extra_y))  # Adjusted bounds
-            extra_width = random.choice([180, 220, 250])  # Larger extra platforms
-            extra_platform = {'rect': pygame.Rect(extra_x, extra_y, extra_width, 20), 
-                            'texture_id': random.randint(0, len(platform_textures) - 1)}
-            initial_platforms.append(extra_platform)
-    
-    return initial_platforms
-
-# Ground settings (define after screen is initialized)
-ground_y = SCREEN_HEIGHT - 50
-ground_rect = pygame.Rect(0, ground_y, SCREEN_WIDTH, 50)
-
-# Generate platforms after screen dimensions are available
-platforms = generate_random_platforms()
-
-# Initialize obstacles (after ground_y is defined) - 1.5x size
-obstacles = [
-    pygame.Rect(SCREEN_WIDTH + 200, ground_y - 45, 45, 45),    # First obstacle off-screen to the right (1.5x size)
-    pygame.Rect(SCREEN_WIDTH + 600, ground_y - 45, 45, 45),    # Second obstacle further right (1.5x size)
-    pygame.Rect(SCREEN_WIDTH + 1000, ground_y - 45, 45, 45)    # Third obstacle even further (1.5x size)
-]
-
-# Infinite spawning settings
-obstacle_gap = 400
-platform_gap = 500
-
-obstacle_speeds = []
-obstacle_directions = []
-obstacle_movement_ranges = []
-
-# Setup initial obstacle movement
-for obs in obstacles:
-    speed = random.uniform(2, 4)
-    direction = random.choice([-1, 1])
-    range_limit = random.randint(100, 300)
-    obstacle_speeds.append(speed)
-    obstacle_directions.append(direction)
-    obstacle_movement_ranges.append({
-        'start': obs.x - range_limit,
-        'end': obs.x + range_limit,
-        'initial_x': obs.x
-    })
+started = False  # start() has run - display, assets, world and pose pipeline are ready
+profiler = NullProfiler()
+recorder = None
+round_reset = False  # reset() ran and the next recorded frame hasn't been written yet
+
+
+def create_game_pose_input():
+    """The pose backend picked by the MARIO_* settings, configured but not started"""
+    if REPLAY_PATH:
+        pose_input = create_pose_input('replay', path=REPLAY_PATH)
+    else:
+        pose_input = create_pose_input(POSE_BACKEND, CAMERA_SOURCE, camera_settings=CAMERA_SETTINGS)
+        if POSE_ROI:
+            pose_input.roi = PoseROITracker()
+        pose_input.scheduler = InferenceScheduler(POSE_SCHEDULE)
+        if POSE_TUNE:
+            pose_input.tuner = PoseTuner(POSE_BUDGET_MS)
+    return pose_input
+
+
+def keyboard_only_input():
+    """Stand-in pose backend when there's no camera or MediaPipe - the keyboard controls still work"""
+    print("Camera / pose detection unavailable - keyboard controls only")
+    return create_pose_input('keyboard')
+
+
+def open_pose_input():
+    """Create and start the camera pose backend - the keyboard-only stand-in if it fails to start"""
+    pose_input = create_game_pose_input()
+    try:
+        pose_input.start()
+    except Exception as e:
+        print(f"Pose input failed to start: {e}")
+        pose_input.failed = True
+    if pose_input.failed:
+        pose_input.stop()
+        return keyboard_only_input()
+    return pose_input
+
+
+def start_music():
+    """(Re)start the background music from the top"""
+    try:
+        pygame.mixer.music.stop()  # load() waits for a fade-out in progress (the menu's) to finish
+        pygame.mixer.music.load(shared_assets().path('music'))
+        pygame.mixer.music.play(-1)
+    except:
+        print("Background music file not found")
+
+
+def start(display=None, warm_pose_input=None):
+    """Open the display, load the assets and build the world and pose pipeline.
+
+    Runs once per process - later calls return straight away, so the launcher can
+    play round after round on the same display, mixer and pose pipeline. display
+    is an existing display surface to play on instead of going fullscreen, and
+    warm_pose_input an already started pose backend (see pose_warmup.py).
+    """
+    global started, screen, SCREEN_WIDTH, SCREEN_HEIGHT, texture_cache, stone_texture, platform_texture, platform_textures
+    global platform_cache, fonts, text_cache, boss_warning_frames, mario_img, obstacle_img, boss_img, bullet_img
+    global boss_face_neutral, boss_face_angry, mario_start_y, mario_y, background_img, angry_sound, luigi_scream, sad_meow
+    global ground_y, ground_rect, world, platforms, obstacles, pose_input, camera_preview, profiler, recorder, run_start
+    global assets
+    if started:
+        return
+    started = True
+
+    # Initialize Pygame and screen settings
+    pygame.init()
+    # Images and sounds decode on a thread pool while the display and textures are set up
+    # (the launcher's menu has usually started them already)
+    assets = shared_assets().preload(GAME_ASSETS)
+    if display is not None:
+        screen = display
+    elif HEADLESS:
+        screen = pygame.display.set_mode(HEADLESS_SCREEN_SIZE)
+    else:
+        screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN | pygame.DOUBLEBUF | pygame.HWSURFACE)
+    SCREEN_WIDTH = screen.get_width()
+    SCREEN_HEIGHT = screen.get_height()
+    pygame.display.set_caption("Mario Game - Gesture Controlled")
+
+    # Generate textures with better sizes for seamless tiling
+    # Fixed seeds so the textures can be loaded from the on-disk cache on later launches
+    texture_cache = TextureCache()
+    stone_texture = texture_cache.get(create_stone_texture, 32, 32, (120, 100, 80), seed=1)
+    platform_texture = texture_cache.get(create_stone_texture, 32, 32, (90, 90, 120), seed=2)  # Bluer platforms
+
+    # Create variety of platform textures for visual interest
+    platform_textures = [
+        texture_cache.get(create_stone_texture, 32, 32, (90, 90, 120), seed=3),   # Blue stone
+        texture_cache.get(create_stone_texture, 32, 32, (100, 80, 120), seed=4),  # Purple stone
+        texture_cache.get(create_stone_texture, 32, 32, (80, 100, 90), seed=5),   # Green stone
+        texture_cache.get(create_stone_texture, 32, 32, (120, 90, 80), seed=6),   # Brown stone
+    ]
+
+    # Finished platforms (texture, border, highlight) are baked once per size/texture
+    platform_cache = PlatformSurfaceCache(platform_textures)
+
+    # Fonts are loaded once per name/size, HUD text is rendered again only when it changes
+    fonts = FontRegistry()
+    text_cache = TextCache(fonts)
+    # Boss warning text and tint are baked once and reused; the shake is just a drawing offset
+    boss_warning_frames = BossWarningFrames(fonts, (SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    # Load Mario character and set initial position
+    mario_img = assets.scaled('mario', (100, 100))  # Double the size
+    obstacle_img = assets.scaled('obstacle', (45, 45))  # 1.5x the original size (halfway between original and tripled)
+    # Load Boss image (single frame) and scale
+    try:
+        # Scale boss to thrice the current size
+        boss_img = assets.scaled('boss', (540, 540))  # Tripled from 180
+    except Exception:
+        boss_img = pygame.Surface((540, 540), pygame.SRCALPHA)
+        boss_img.fill((200,0,0))
+
+        boss_x = SCREEN_WIDTH - boss_img.get_width()   # Update boss spawn position
+        boss_y = 50
+
+    # Load bullet image
+    try:
+        bullet_img = assets.scaled('bullet', (40, 40))  # Much bigger bullets
+    except Exception:
+        bullet_img = pygame.Surface((40, 40), pygame.SRCALPHA)
+        bullet_img.fill((255, 255, 0))  # Yellow fallback
+
+    # Load boss face images (placeholders for now)
+    try:
+        boss_face_neutral = assets.scaled('boss_face_neutral', (180, 180))  # Tripled size
+    except Exception:
+        # Placeholder: calm blue face (tripled size)
+        boss_face_neutral = pygame.Surface((180, 180), pygame.SRCALPHA)
+        pygame.draw.circle(boss_face_neutral, (100, 150, 255), (90, 90), 75)  # Tripled
+        pygame.draw.circle(boss_face_neutral, (50, 50, 50), (66, 75), 9)  # Left eye (tripled)
+        pygame.draw.circle(boss_face_neutral, (50, 50, 50), (114, 75), 9)  # Right eye (tripled)
+        pygame.draw.arc(boss_face_neutral, (50, 50, 50), (60, 105, 60, 30), 0, 3.14, 6)  # Smile (tripled)
+
+    try:
+        boss_face_angry = assets.scaled('boss_face_angry', (180, 180))  # Tripled size
+    except Exception:
+        # Placeholder: angry red face (tripled size)
+        boss_face_angry = pygame.Surface((180, 180), pygame.SRCALPHA)
+        pygame.draw.circle(boss_face_angry, (255, 100, 100), (90, 90), 75)  # Tripled
+        pygame.draw.circle(boss_face_angry, (200, 0, 0), (66, 75), 9)  # Left eye (tripled)
+        pygame.draw.circle(boss_face_angry, (200, 0, 0), (114, 75), 9)  # Right eye (tripled)
+        pygame.draw.arc(boss_face_angry, (200, 0, 0), (60, 120, 60, 24), 3.14, 6.28, 6)  # Frown (tripled)
+
+    mario_start_y = SCREEN_HEIGHT - 200  # Start higher to accommodate larger Mario
+    mario_y = mario_start_y
+
+    # Load background image for extended map
+    try:
+        # Kept on disk for this resolution - scaling to twice the screen width is the slowest load step
+        background_img = assets.scaled('background', (SCREEN_WIDTH * 2, SCREEN_HEIGHT), persist=True)
+    except:
+        background_img = None
+
+    start_music()
+
+    # Load boss spawn sound effect
+    try:
+        angry_sound = assets.sound('angry_sound')
+    except:
+        print("Angry sound file not found")
+        angry_sound = None
+
+    # Load boss death sound effect
+    try:
+        luigi_scream = assets.sound('luigi_scream')
+    except:
+        print("Luigi scream sound file not found")
+        luigi_scream = None
+
+    # Load sad meow sound effect for player death
+    try:
+        sad_meow = assets.sound('sad_meow')
+    except:
+        print("Sad meow sound file not found")
+        sad_meow = None
+
+    # Ground settings (define after screen is initialized)
+    ground_y = SCREEN_HEIGHT - 50
+    ground_rect = pygame.Rect(0, ground_y, SCREEN_WIDTH, 50)
+
+    # Platforms and obstacles, streamed in chunks around the camera
+    world = World(SCREEN_WIDTH, SCREEN_HEIGHT, ground_y, len(platform_textures), game_random)
+    platforms = world.platforms
+    obstacles = world.obstacles
+
+    # Initialize webcam + MediaPipe pose detection, unless the launcher already did
+    if warm_pose_input is None:
+        pose_input = open_pose_input()
+    elif warm_pose_input.failed:
+        warm_pose_input.stop()
+        pose_input = keyboard_only_input()
+    else:
+        pose_input = warm_pose_input
+    camera_preview = CameraPreview((200, 150))  # HUD thumbnail in the top-left corner
+    profiler = FrameProfiler() if PROFILE_PATH else NullProfiler()
+    pose_input.profiler = profiler if PROFILE_PATH else None
+    recorder = LandmarkRecorder(RECORD_PATH, GAME_SEED, (SCREEN_WIDTH, SCREEN_HEIGHT)) if RECORD_PATH else None
+    run_start = time.perf_counter()
 
-# Initialize MediaPipe for pose detection
-mp_pose = mp.solutions.pose
-pose = mp_pose.Pose()
-cap = cv2.VideoCapture(0)
 
 # Initialize score and distance tracking
 score = 0
@@ -355,8 +323,8 @@ BOSS_WARNING_THRESHOLD = 20  # Show warning 20 points before boss spawn
 
 # Boss & fireball containers
 bosses = []  # Each: {'rect':Rect,'spawn_time':ms,'bob_phase':float,'last_fire_time':ms,'fire_interval':int,'health':int,'max_health':int,'burst_count':int,'burst_cooldown_end':ms,'face_angry_until':ms}
-fireballs = []  # Each: {'rect':Rect,'vx':float,'vy':float}
-bullets = []  # Each: {'rect':Rect,'vx':float,'vy':float}
+fireballs = ProjectilePool(256, 20, 20)  # Boss fireballs, preallocated slots
+bullets = ProjectilePool(64, 40, 40)  # Mario's bullets, preallocated slots
 BOSS_SPAWN_AHEAD = 600  # how far ahead of player to place new boss (reduced for better visibility)
 BOSS_BURST_SHOTS = 5  # Number of shots in each burst
 BOSS_SHOT_INTERVAL = 200  # ms between shots within a burst
@@ -370,11 +338,11 @@ def spawn_boss(world_x):
     h = boss_img.get_height()
     w = boss_img.get_width()
     rect = pygame.Rect(world_x, ground_y - h, w, h)
-    now = pygame.time.get_ticks()
+    now = sim_time
     bosses.append({
         'rect': rect,
         'spawn_time': now,
-        'bob_phase': random.uniform(0, math.tau),
+        'bob_phase': game_random.uniform(0, math.tau),
         'last_fire_time': now - BOSS_BURST_COOLDOWN,  # Ready to start burst immediately
         'burst_count': 0,  # Number of shots fired in current burst
         'burst_cooldown_end': 0,  # When current burst cooldown ends
@@ -394,13 +362,12 @@ def shoot_bullet(mario_world_rect):
     # Spawn bullet from Mario's upper chest area (higher up on his body)
     bullet_x = mario_world_rect.centerx - 20  # Slightly left of center so it looks like it's coming from his body
     bullet_y = mario_world_rect.centery - 15  # Higher up, around chest level
-    bullet_rect = pygame.Rect(bullet_x, bullet_y, 40, 40)  # Match bigger bullet size
-    bullets.append({'rect': bullet_rect, 'vx': BULLET_SPEED, 'vy': 0})
+    bullets.spawn(bullet_x, bullet_y, BULLET_SPEED, 0)  # 40x40 slots to match bigger bullet size
     print("Mario shot a bullet!")
 
 def update_bosses_fireballs_and_bullets(mario_world_rect):
     global game_over, score
-    now = pygame.time.get_ticks()
+    now = sim_time
     
     # Update bosses (bobbing + burst shooting)
     for b in bosses[:]:
@@ -428,8 +395,7 @@ def update_bosses_fireballs_and_bullets(mario_world_rect):
                 direction = 1 if mario_world_rect.centerx > b['rect'].centerx else -1
                 speed = 9
                 vy = (mario_world_rect.centery - b['rect'].centery) / 80.0
-                fire_rect = pygame.Rect(b['rect'].centerx, b['rect'].centery, 20, 20)
-                fireballs.append({'rect': fire_rect, 'vx': speed * direction, 'vy': vy})
+                fireballs.spawn(b['rect'].centerx, b['rect'].centery, speed * direction, vy)
                 
                 # Update boss state
                 b['last_fire_time'] = now
@@ -444,61 +410,60 @@ def update_bosses_fireballs_and_bullets(mario_world_rect):
                     b['burst_count'] = 0  # Reset for next burst
                     print("Boss burst complete, entering cooldown...")
     
-    # Update bullets and check boss collisions
-    for bullet in bullets[:]:
-        bullet['rect'].x += int(bullet['vx'])
-        bullet['rect'].y += int(bullet['vy'])
-        
-        # Check collision with bosses
-        for b in bosses[:]:
-            if bullet['rect'].colliderect(b['rect']):
-                # Damage the boss
-                b['health'] -= 1
-                bullets.remove(bullet)
-                print(f"Boss hit! Health: {b['health']}/{b['max_health']}")
-                
-                # Remove boss if health reaches 0
-                if b['health'] <= 0:
-                    bosses.remove(b)
-                    score += 100  # Bonus points for killing boss
-                    
-                    # Play Luigi scream when boss dies
-                    if luigi_scream:
-                        luigi_scream.play()
-                    
-                    print("Boss defeated!")
-                break
-        
-        # Remove bullets that are off screen
-        if bullet['rect'].x > mario_world_rect.x + 1000 or bullet['rect'].x < mario_world_rect.x - 200:
-            if bullet in bullets:
-                bullets.remove(bullet)
-    
+    # Update bullets and check boss collisions - every bullet against each boss at once
+    bullets.advance()
+    spent = np.zeros(len(bullets), dtype=bool)
+    for b in bosses[:]:
+        # Each bullet damages at most one boss, and only as many as it takes to kill it
+        hits = np.flatnonzero(bullets.overlaps(b['rect']) & ~spent)[:b['health']]
+        if len(hits) == 0:
+            continue
+        spent[hits] = True
+        b['health'] -= len(hits)
+        print(f"Boss hit! Health: {b['health']}/{b['max_health']}")
+
+        # Remove boss if health reaches 0
+        if b['health'] <= 0:
+            bosses.remove(b)
+            score += 100  # Bonus points for killing boss
+
+            # Play Luigi scream when boss dies
+            if luigi_scream:
+                luigi_scream.play()
+
+            print("Boss defeated!")
+
+    # Remove bullets that hit a boss or are off screen
+    bullet_x = bullets.x[:len(bullets)]
+    spent |= (bullet_x > mario_world_rect.x + 1000) | (bullet_x < mario_world_rect.x - 200)
+    bullets.remove_where(spent)
+
     # Update fireballs
     gravity_fire = 0.3
-    for f in fireballs[:]:
-        f['rect'].x += int(f['vx'])
-        f['vy'] += gravity_fire
-        f['rect'].y += int(f['vy'])
-        
-        # Collision with player - both in world coordinates
-        if f['rect'].colliderect(mario_world_rect):
-            game_over = True
-            pygame.mixer.music.pause()
-            if sad_meow:
-                sad_meow.play()
-            print("Fireball hit Mario!")  # Debug output
-            
-        # Remove if far off screen or hits ground (doubled horizontal range)
-        if f['rect'].y > ground_y + 200 or f['rect'].right < (mario_world_rect.x - 2400) or f['rect'].left > (mario_world_rect.x + 12000):
-            fireballs.remove(f)
-
-def draw_bosses_fireballs_and_bullets():
-    now = pygame.time.get_ticks()
+    fireballs.advance(gravity_fire)
+
+    # Collision with player - both in world coordinates
+    if fireballs.overlaps(mario_world_rect).any():
+        game_over = True
+        pygame.mixer.music.pause()
+        if sad_meow:
+            sad_meow.play()
+        print("Fireball hit Mario!")  # Debug output
+
+    # Remove if far off screen or hits ground (doubled horizontal range)
+    fire_x = fireballs.x[:len(fireballs)]
+    fire_y = fireballs.y[:len(fireballs)]
+    fireballs.remove_where((fire_y > ground_y + 200) |
+                           (fire_x + fireballs.width < mario_world_rect.x - 2400) |
+                           (fire_x > mario_world_rect.x + 12000))
+
+def draw_bosses_fireballs_and_bullets(view_offset, alpha, view_dy=0):
+    """Draw at camera offset (view_offset, view_dy), with projectiles blended alpha of the way into the last step"""
+    now = sim_time
     
     # Draw bosses with health bars and face expressions
     for b in bosses:
-        draw_pos = b['rect'].move(scroll_offset, 0)
+        draw_pos = b['rect'].move(view_offset, view_dy)
         
         # Draw boss body
         screen.blit(boss_img, (draw_pos.x, draw_pos.y))
@@ -530,38 +495,38 @@ def draw_bosses_fireballs_and_bullets():
                         (health_bar_x, health_bar_y, health_bar_width, health_bar_height), 1)
     
     # Draw fireballs with debug info
-    for f in fireballs:
-        draw_pos = f['rect'].move(scroll_offset, 0)
+    for fire_x, fire_y in fireballs.positions(alpha):
+        draw_x = fire_x + view_offset
+        fire_y += view_dy
         # Only draw if on screen
-        if -50 < draw_pos.x < SCREEN_WIDTH + 50 and -50 < draw_pos.y < SCREEN_HEIGHT + 50:
+        if -50 < draw_x < SCREEN_WIDTH + 50 and -50 < fire_y < SCREEN_HEIGHT + 50:
+            center = (draw_x + fireballs.width // 2, fire_y + fireballs.height // 2)
             # Draw larger, more visible fireballs with glow effect
-            pygame.draw.circle(screen, (255,200,50), (draw_pos.centerx, draw_pos.centery), 12)  # yellow glow
-            pygame.draw.circle(screen, (255,100,0), (draw_pos.centerx, draw_pos.centery), 8)   # orange center
-            pygame.draw.circle(screen, (255,50,0), (draw_pos.centerx, draw_pos.centery), 4)    # red hot center
+            pygame.draw.circle(screen, (255,200,50), center, 12)  # yellow glow
+            pygame.draw.circle(screen, (255,100,0), center, 8)   # orange center
+            pygame.draw.circle(screen, (255,50,0), center, 4)    # red hot center
     
     # Draw bullets
-    for bullet in bullets:
-        draw_pos = bullet['rect'].move(scroll_offset, 0)
+    for bullet_x, bullet_y in bullets.positions(alpha):
+        draw_x = bullet_x + view_offset
+        bullet_y += view_dy
         # Only draw if on screen
-        if -50 < draw_pos.x < SCREEN_WIDTH + 50 and -50 < draw_pos.y < SCREEN_HEIGHT + 50:
-            screen.blit(bullet_img, (draw_pos.x, draw_pos.y))
+        if -50 < draw_x < SCREEN_WIDTH + 50 and -50 < bullet_y < SCREEN_HEIGHT + 50:
+            screen.blit(bullet_img, (draw_x, bullet_y))
     
     # Debug: Show number of active bosses, fireballs, and bullets (reduce frequency)
-    if (len(bosses) > 0 or len(fireballs) > 0 or len(bullets) > 0) and pygame.time.get_ticks() % 1000 < 50:
+    if (len(bosses) > 0 or len(fireballs) > 0 or len(bullets) > 0) and sim_time % 1000 < 50:
         print(f"Active bosses: {len(bosses)}, Active fireballs: {len(fireballs)}, Active bullets: {len(bullets)}")  # Debug
 
 
-def check_platform_collisions(mario_rect, platforms):
-    for platform_data in platforms:
-        platform = platform_data['rect']
-        platform_rect = platform.move(scroll_offset, 0)
-        if mario_rect.colliderect(platform_rect) and mario_rect.bottom <= platform_rect.bottom:
-            return platform.top
-    return None
+def check_platform_collisions(mario_rect):
+    """Top of the platform Mario is landing on, or None - a world-space grid lookup"""
+    world_left = mario_rect.left - scroll_offset
+    return world.platform_index.landing_top(world_left, mario_rect.top, world_left + mario_rect.width, mario_rect.bottom)
 
 
 def reset_game():
-    global mario_x, mario_y, mario_velocity_y, scroll_offset, on_ground, score, total_distance, platforms, obstacles, next_boss_spawn_score, bosses, fireballs, bullets, last_bullet_time, last_score, boss_warning_active, boss_warning_start_time
+    global mario_x, mario_y, mario_velocity_y, scroll_offset, on_ground, score, total_distance, next_boss_spawn_score, bosses, fireballs, bullets, last_bullet_time, last_score, boss_warning_active, boss_warning_start_time
     
     # Stop all sounds and resume background music
     if sad_meow:
@@ -586,79 +551,57 @@ def reset_game():
     bosses.clear()
     fireballs.clear()
     bullets.clear()
-    platforms = generate_random_platforms()  # Use random platforms on reset too
-    obstacles = [
-        pygame.Rect(SCREEN_WIDTH + 200, ground_y - 45, 45, 45),    # First obstacle off-screen to the right (1.5x size)
-        pygame.Rect(SCREEN_WIDTH + 600, ground_y - 45, 45, 45),    # Second obstacle further right (1.5x size)
-        pygame.Rect(SCREEN_WIDTH + 1000, ground_y - 45, 45, 45)    # Third obstacle even further (1.5x size)
-    ]
+    world.reset()  # Fresh random platforms and obstacles on reset too
 
-def draw_boss_warning():
-    """Draw dramatic boss warning with screen effects"""
-    global boss_warning_active, boss_warning_start_time
+def boss_warning_elapsed():
+    """Milliseconds into the boss warning, or None when no warning is showing"""
+    global boss_warning_active
     
     if not boss_warning_active:
-        return
-        
-    now = pygame.time.get_ticks()
-    warning_elapsed = now - boss_warning_start_time
+        return None
+    
+    warning_elapsed = sim_time - boss_warning_start_time
     
     # End warning after duration
     if warning_elapsed >= BOSS_WARNING_DURATION:
         boss_warning_active = False
+        return None
+    return warning_elapsed
+
+
+def boss_warning_shake(warning_elapsed):
+    """Screen shake offset (x, y) for drawing the game world while the warning plays"""
+    if warning_elapsed is None:
+        return 0, 0
+    intensity = 1.0 - warning_elapsed / BOSS_WARNING_DURATION
+    shake_intensity = int(intensity * 15)  # Max 15 pixel shake
+    if shake_intensity <= 0:
+        return 0, 0
+    return (shake_random.randint(-shake_intensity, shake_intensity),
+            shake_random.randint(-shake_intensity, shake_intensity))
+
+
+def draw_boss_warning(warning_elapsed):
+    """Draw dramatic boss warning over the (already shaken) game world"""
+    if warning_elapsed is None:
         return
     
     # Calculate warning intensity (starts strong, fades out)
     progress = warning_elapsed / BOSS_WARNING_DURATION
     intensity = 1.0 - progress  # 1.0 to 0.0
     
-    # Screen shake effect
-    shake_intensity = int(intensity * 15)  # Max 15 pixel shake
-    if shake_intensity > 0:
-        shake_x = random.randint(-shake_intensity, shake_intensity)
-        shake_y = random.randint(-shake_intensity, shake_intensity)
-        # Apply shake by temporarily moving all drawing positions
-        screen.scroll(shake_x, shake_y)
-    
-    # Dark overlay with pulsing effect
-    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+    # Red overlay with pulsing effect - one reusable surface, only its alpha changes
     pulse = math.sin(warning_elapsed * 0.01) * 0.2 + 0.3  # Pulsing between 0.1 and 0.5
     overlay_alpha = int(intensity * pulse * 255)
-    overlay.fill((200, 0, 0, overlay_alpha))  # Red tint
-    screen.blit(overlay, (0, 0))
+    screen.blit(boss_warning_frames.overlay(overlay_alpha), (0, 0))
     
-    # Warning text with dramatic effects
-    warning_font = pygame.font.Font(pygame.font.match_font('arial', bold=True), 64)
-    warning_text = "3RD YEAR BOSS INCOMING"
-    
-    # Text pulsing size effect
+    # Text pulsing size effect - shadow, outline, main text (and highlight at peak intensity)
+    # are pre-baked into one surface per quantized size
     text_pulse = math.sin(warning_elapsed * 0.008) * 0.3 + 1.0  # Scale between 0.7 and 1.3
     scaled_font_size = int(64 * text_pulse * intensity)
     if scaled_font_size > 0:
-        scaled_font = pygame.font.Font(pygame.font.match_font('arial', bold=True), scaled_font_size)
-        
-        # Multiple colored text layers for dramatic effect
-        # Red shadow (biggest)
-        shadow_text = scaled_font.render(warning_text, True, (150, 0, 0))
-        shadow_rect = shadow_text.get_rect(center=(SCREEN_WIDTH//2 + 4, SCREEN_HEIGHT//3 + 4))
-        screen.blit(shadow_text, shadow_rect)
-        
-        # Dark outline
-        outline_text = scaled_font.render(warning_text, True, (50, 0, 0))
-        outline_rect = outline_text.get_rect(center=(SCREEN_WIDTH//2 + 2, SCREEN_HEIGHT//3 + 2))
-        screen.blit(outline_text, outline_rect)
-        
-        # Main bright red text
-        main_text = scaled_font.render(warning_text, True, (255, 50, 50))
-        main_rect = main_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//3))
-        screen.blit(main_text, main_rect)
-        
-        # Bright white highlight (center)
-        highlight_text = scaled_font.render(warning_text, True, (255, 255, 255))
-        highlight_rect = highlight_text.get_rect(center=(SCREEN_WIDTH//2 - 1, SCREEN_HEIGHT//3 - 1))
-        # Only show highlight at peak intensity
-        if intensity > 0.7:
-            screen.blit(highlight_text, highlight_rect)
+        text_surface, (text_dx, text_dy) = boss_warning_frames.text(scaled_font_size, intensity > 0.7)
+        screen.blit(text_surface, (SCREEN_WIDTH//2 + text_dx, SCREEN_HEIGHT//3 + text_dy))
     
     # Countdown bars at bottom (dramatic progress indicator)
     bar_width = SCREEN_WIDTH - 100
@@ -676,311 +619,380 @@ def draw_boss_warning():
     
     # Bar border
     pygame.draw.rect(screen, (255, 255, 255), (bar_x, bar_y, bar_width, bar_height), 3)
-    
-    # Reset screen position after shake
-    if shake_intensity > 0:
-        screen.scroll(-shake_x, -shake_y)
 
 
-# Main game loop
-game_over = False
-while True:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            cap.release()
-            sys.exit()
-        elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                pygame.quit()
-                cap.release()
-                sys.exit()
-            elif game_over:
-                reset_game()
-                game_over = False
-
-    # Camera input
-    ret, frame = cap.read()
-    if not ret:
-        break
-
-    frame = cv2.flip(frame, 1)
-    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    result = pose.process(rgb_frame)
-
-    move_right, move_left, jump, shoot = False, False, False, False
-
-    if result.pose_landmarks:
-        landmarks = result.pose_landmarks.landmark
-        left_wrist = landmarks[mp_pose.PoseLandmark.LEFT_WRIST]
-        right_wrist = landmarks[mp_pose.PoseLandmark.RIGHT_WRIST]
-        left_shoulder = landmarks[mp_pose.PoseLandmark.LEFT_SHOULDER]
-        right_shoulder = landmarks[mp_pose.PoseLandmark.RIGHT_SHOULDER]
-        left_elbow = landmarks[mp_pose.PoseLandmark.LEFT_ELBOW]
-        right_elbow = landmarks[mp_pose.PoseLandmark.RIGHT_ELBOW]
-
-        if right_wrist.x > right_shoulder.x:
-            move_right = True
-        elif left_wrist.x < left_shoulder.x:
-            move_left = True
+def read_keyboard():
+    """Keyboard fallback controls as (move_right, move_left, jump, shoot)"""
+    keys = pygame.key.get_pressed()
+    return (bool(keys[pygame.K_RIGHT] or keys[pygame.K_d]),
+            bool(keys[pygame.K_LEFT] or keys[pygame.K_a]),
+            bool(keys[pygame.K_UP] or keys[pygame.K_w] or keys[pygame.K_SPACE]),
+            bool(keys[pygame.K_x] or keys[pygame.K_LCTRL] or keys[pygame.K_RCTRL]))
 
-        if (left_wrist.y < left_shoulder.y and right_wrist.y < right_shoulder.y) and on_ground:
-            jump = True
-            
-        # Shooting gesture: Point forward with right hand (wrist forward of elbow, elbow forward of shoulder)
-        if (right_wrist.z < right_elbow.z and right_elbow.z < right_shoulder.z and 
-            abs(right_wrist.y - right_shoulder.y) < 0.15):  # Hand pointing forward at shoulder height
-            shoot = True
 
-    # Keyboard fallback
-    keys = pygame.key.get_pressed()
-    if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-        move_right = True
-    if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-        move_left = True
-    if (keys[pygame.K_UP] or keys[pygame.K_w] or keys[pygame.K_SPACE]) and on_ground:
-        jump = True
-    if keys[pygame.K_x] or keys[pygame.K_LCTRL] or keys[pygame.K_RCTRL]:
-        shoot = True
-
-    if not game_over:
-        now = pygame.time.get_ticks()  # Get current time for shooting cooldown
-        
-        if move_right:
-            mario_x += mario_speed_x
-            total_distance += mario_speed_x
-        if move_left:
-            mario_x -= mario_speed_x
-        if jump:
-            mario_velocity_y = -jump_force
-            on_ground = False
-        if shoot and now - last_bullet_time >= BULLET_COOLDOWN:
-            mario_world_rect = pygame.Rect(mario_x - scroll_offset, mario_y, 100, 100)
-            shoot_bullet(mario_world_rect)
-            last_bullet_time = now
-
-        mario_velocity_y += gravity
-        mario_y += mario_velocity_y
-
-        mario_rect = pygame.Rect(mario_x, mario_y, 100, 100)
-        platform_top = check_platform_collisions(mario_rect, platforms)
-        if platform_top is not None:
-            mario_y = platform_top - 100  # Updated for larger Mario
-            mario_velocity_y = 0
-            on_ground = True
-
-        if mario_y > ground_y - 100:  # Updated for larger Mario
-            mario_y = ground_y - 100  # Updated for larger Mario
-            mario_velocity_y = 0
-            on_ground = True
-
-        if mario_x > 400:
-            scroll_offset -= mario_speed_x
-            mario_x = 400
-
-        # Spawn new obstacles dynamically
-        if obstacles:
-            last_obstacle_x = obstacles[-1].x
-            if mario_x - scroll_offset > last_obstacle_x - 2000:
-                new_x = last_obstacle_x + obstacle_gap
-                new_obstacle = pygame.Rect(new_x, ground_y - 45, 45, 45)  # Updated size and position
-                obstacles.append(new_obstacle)
-
-                speed = random.uniform(2, 4)
-                direction = random.choice([-1, 1])
-                range_limit = random.randint(100, 300)
-                obstacle_speeds.append(speed)
-                obstacle_directions.append(direction)
-                obstacle_movement_ranges.append({
-                    'start': new_obstacle.x - range_limit,
-                    'end': new_obstacle.x + range_limit,
-                    'initial_x': new_obstacle.x
-                })
-
-        # Spawn new platforms dynamically with much more randomization
-        if platforms:
-            last_platform_data = platforms[-1]
-            last_platform_x = last_platform_data['rect'].x
-            if mario_x - scroll_offset > last_platform_x - 2000:
-                # Randomize horizontal spacing (much more varied gaps)
-                random_gap = random.randint(250, 800)  # Much more varied spacing
-                new_x = last_platform_x + random_gap
-                
-                # More varied vertical positioning (relative to ground) - higher for bigger Mario
-                new_y = random.randint(SCREEN_HEIGHT - 350, SCREEN_HEIGHT - 120)
-                
-                # Randomize platform width and height - larger for bigger Mario
-                platform_width = random.choice([180, 220, 250, 300, 350, 400])  # Larger widths
-                platform_height = random.choice([20, 25, 30])  # Thicker platforms
-                
-                new_platform_rect = pygame.Rect(new_x, new_y, platform_width, platform_height)
-                new_texture_id = random.randint(0, len(platform_textures) - 1)
-                new_platform = {'rect': new_platform_rect, 'texture_id': new_texture_id}
-                platforms.append(new_platform)
-                
-                # Sometimes add a second platform nearby for interesting jumps
-                if random.random() < 0.3:  # 30% chance
-                    bonus_x = new_x + random.randint(150, 300)
-                    bonus_y = new_y + random.randint(-100, 100)  # More vertical variation
-                    bonus_y = max(SCREEN_HEIGHT - 400, min(SCREEN_HEIGHT - 120, bonus_y))  # Better bounds for higher platforms
-                    bonus_width = random.choice([150, 180, 220])  # Larger bonus platforms
-                    bonus_rect = pygame.Rect(bonus_x, bonus_y, bonus_width, 20)
-                    bonus_texture = random.randint(0, len(platform_textures) - 1)
-                    bonus_platform = {'rect': bonus_rect, 'texture_id': bonus_texture}
-                    platforms.append(bonus_platform)
-
-        # Move obstacles & check collision
-        for i, obstacle in enumerate(obstacles):
-            obstacle_rect = obstacle.move(scroll_offset, 0)
-
-            if mario_rect.colliderect(obstacle_rect):
-                game_over = True
-                pygame.mixer.music.pause()
-                if sad_meow:
-                    sad_meow.play()
-
-            current_x = obstacles[i].x
-            movement = obstacle_speeds[i] * obstacle_directions[i]
-            new_x = current_x + movement
-
-            if new_x <= obstacle_movement_ranges[i]['start']:
-                obstacle_directions[i] = 1
-                new_x = obstacle_movement_ranges[i]['start']
-            elif new_x >= obstacle_movement_ranges[i]['end']:
-                obstacle_directions[i] = -1
-                new_x = obstacle_movement_ranges[i]['end']
-
-            obstacles[i].x = new_x
-
-        score = total_distance // 10
-        
-        # Track score changes for visual effects
-        if score != last_score:
-            score_change_time = pygame.time.get_ticks()
-            last_score = score
-
-        # Boss warning system
-        if not boss_warning_active and score >= next_boss_spawn_score - BOSS_WARNING_THRESHOLD:
-            boss_warning_active = True
-            boss_warning_start_time = pygame.time.get_ticks()
-            print(f"Boss warning activated! Score: {score}, Threshold: {next_boss_spawn_score}")
-
-        # Boss spawning at score thresholds (only after warning period)
-        if score >= next_boss_spawn_score and (not boss_warning_active or pygame.time.get_ticks() - boss_warning_start_time >= BOSS_WARNING_DURATION):
-            spawn_world_x = (mario_x - scroll_offset) + BOSS_SPAWN_AHEAD
-            spawn_boss(spawn_world_x)
-            print(f"Boss spawned at world position {spawn_world_x}, Mario at {mario_x - scroll_offset}, Score: {score}")
-            next_boss_spawn_score += 200
-            boss_warning_active = False  # Reset warning for next boss
-
-        # Create mario world rect for boss/fireball system
-        mario_world_rect = pygame.Rect(mario_x - scroll_offset, mario_y, 100, 100)
-        
-        # Update bosses, fireballs & bullets
-        update_bosses_fireballs_and_bullets(mario_world_rect)
-
-    # Draw background
-    if background_img:
-        x_position = scroll_offset % -background_img.get_width()
-        screen.blit(background_img, (x_position, 0))
-        if x_position + background_img.get_width() < SCREEN_WIDTH:
-            screen.blit(background_img, (x_position + background_img.get_width(), 0))
-    else:
-        screen.fill((255, 255, 255))
+def save_render_state():
+    """Remember the state drawing interpolates from, taken before each simulation step"""
+    global render_state
+    render_state = (mario_x, mario_y, scroll_offset)
 
-    # Draw textured platforms
-    for platform_data in platforms:
-        platform = platform_data['rect']
-        platform_rect = platform.move(scroll_offset, 0)
-        texture_id = platform_data['texture_id']
-        
-        # Use the appropriate texture
-        current_texture = platform_textures[texture_id] if texture_id < len(platform_textures) else platform_textures[0]
-        draw_textured_rect(screen, current_texture, platform_rect)
-        
-        # Add platform borders for Jump King style with texture-appropriate colors
-        border_colors = [
-            (60, 60, 100),   # Blue border
-            (80, 60, 100),   # Purple border
-            (60, 80, 70),    # Green border
-            (100, 70, 60),   # Brown border
-        ]
-        highlight_colors = [
-            (140, 140, 180),  # Blue highlight
-            (160, 140, 180),  # Purple highlight
-            (140, 160, 150),  # Green highlight
-            (180, 150, 140),  # Brown highlight
-        ]
-        
-        border_color = border_colors[texture_id] if texture_id < len(border_colors) else border_colors[0]
-        highlight_color = highlight_colors[texture_id] if texture_id < len(highlight_colors) else highlight_colors[0]
-        
-        pygame.draw.rect(screen, border_color, platform_rect, 2)
-        # Add highlight on top edge
-        pygame.draw.line(screen, highlight_color, 
-                        (platform_rect.left, platform_rect.top), 
-                        (platform_rect.right, platform_rect.top), 2)
 
-    for obstacle in obstacles:
-        obstacle_rect = obstacle.move(scroll_offset, 0)
-        screen.blit(obstacle_img, (obstacle_rect.x, obstacle_rect.y))
+def simulation_step(move_right, move_left, jump, shoot):
+    """Advance all game state by one fixed SIM_DT step with this frame's inputs"""
+    global sim_time, mario_x, mario_y, mario_velocity_y, scroll_offset, on_ground, score, total_distance
+    global next_boss_spawn_score, last_bullet_time, last_score, score_change_time, boss_warning_active, boss_warning_start_time, game_over
+    sim_time += SIM_STEP_MS
+    if game_over:
+        return
 
-    # Draw bosses, fireballs & bullets
-    draw_bosses_fireballs_and_bullets()
+    now = sim_time  # Current time for shooting cooldown
+    
+    if move_right:
+        mario_x += mario_speed_x
+        total_distance += mario_speed_x
+    if move_left:
+        mario_x -= mario_speed_x
+    if jump and on_ground:
+        mario_velocity_y = -jump_force
+        on_ground = False
+    if shoot and now - last_bullet_time >= BULLET_COOLDOWN:
+        mario_world_rect = pygame.Rect(mario_x - scroll_offset, mario_y, 100, 100)
+        shoot_bullet(mario_world_rect)
+        last_bullet_time = now
+
+    mario_velocity_y += gravity
+    mario_y += mario_velocity_y
+
+    mario_rect = pygame.Rect(mario_x, mario_y, 100, 100)
+    platform_top = check_platform_collisions(mario_rect)
+    if platform_top is not None:
+        mario_y = platform_top - 100  # Updated for larger Mario
+        mario_velocity_y = 0
+        on_ground = True
+
+    if mario_y > ground_y - 100:  # Updated for larger Mario
+        mario_y = ground_y - 100  # Updated for larger Mario
+        mario_velocity_y = 0
+        on_ground = True
+
+    if mario_x > 400:
+        scroll_offset -= mario_speed_x
+        mario_x = 400
+    profiler.step_lap('physics')
+
+    # Stream world chunks: generate ahead of the player, retire far behind the camera
+    world.update(-scroll_offset, mario_x - scroll_offset)
+    profiler.step_lap('world stream')
+
+    # Check collision with all obstacles at once, then move them along their patrols
+    mario_world_left = mario_rect.left - scroll_offset
+    if obstacles.collides(mario_world_left, mario_rect.top, mario_world_left + mario_rect.width, mario_rect.bottom):
+        game_over = True
+        pygame.mixer.music.pause()
+        if sad_meow:
+            sad_meow.play()
+    obstacles.update()
+    profiler.step_lap('obstacles')
+
+    score = total_distance // 10
+    
+    # Track score changes for visual effects
+    if score != last_score:
+        score_change_time = now
+        last_score = score
+
+    # Boss warning system
+    if not boss_warning_active and score >= next_boss_spawn_score - BOSS_WARNING_THRESHOLD:
+        boss_warning_active = True
+        boss_warning_start_time = now
+        print(f"Boss warning activated! Score: {score}, Threshold: {next_boss_spawn_score}")
+
+    # Boss spawning at score thresholds (only after warning period)
+    if score >= next_boss_spawn_score and (not boss_warning_active or now - boss_warning_start_time >= BOSS_WARNING_DURATION):
+        spawn_world_x = (mario_x - scroll_offset) + BOSS_SPAWN_AHEAD
+        spawn_boss(spawn_world_x)
+        print(f"Boss spawned at world position {spawn_world_x}, Mario at {mario_x - scroll_offset}, Score: {score}")
+        next_boss_spawn_score += 200
+        boss_warning_active = False  # Reset warning for next boss
+
+    profiler.step_lap('spawn logic')
+
+    # Create mario world rect for boss/fireball system
+    mario_world_rect = pygame.Rect(mario_x - scroll_offset, mario_y, 100, 100)
+    
+    # Update bosses, fireballs & bullets
+    update_bosses_fireballs_and_bullets(mario_world_rect)
+    profiler.step_lap('bosses & projectiles')
+
+
+def shutdown():
+    """Report the camera/pose latency and cache stats, then release the pose backend"""
+    print(pose_input.latency_report())
+    pose_input.stop()
+    print(f"Platform surface cache: {platform_cache.stats()}")
+    print(f"Assets: {assets.stats()}")
+    print(f"Text cache: {text_cache.stats()}")
+    print(f"Projectile pools: bullets {bullets.stats()}, fireballs {fireballs.stats()}")
+    if PROFILE_PATH:
+        print(profiler.report())
+        profiler.write_csv(PROFILE_PATH)
+        print(f"Frame profile written to {PROFILE_PATH}")
+    if recorder:
+        recorder.close()
+        print(f"Recorded {recorder.frames} frames to {recorder.path} (seed {GAME_SEED})")
+    if HEADLESS:
+        print(headless_report())
+
+
+def headless_report():
+    wall_seconds = time.perf_counter() - run_start
+    sim_seconds = sim_time / 1000
+    return (f"Headless run: {sim_seconds / 60:.1f} simulated minutes in {wall_seconds:.1f} s "
+            f"({sim_seconds / wall_seconds:.1f}x real time), {sim_steps} steps, "
+            f"{sim_steps / max(sim_wall_seconds, 1e-9):.0f} logic steps/s, "
+            f"{deaths} deaths, best score {max(best_score, score)}, final score {score}")
 
-    screen.blit(mario_img, (mario_x, mario_y))
 
-    # Draw boss warning (must be after everything else for screen shake effect)
-    draw_boss_warning()
+game_over = False
+score_change_time = 0
+deaths = 0
+best_score = 0
+run_start = None  # Set when start() is done - headless wall time and recording timestamps count from here
+render_state = None
+time_to_first_frame = None  # ms from PLAY to the first frame of the latest run(), when the launcher timed it
+
+
+def new_round():
+    """Reseed the game RNG and reset - every launcher round plays the same level as the first"""
+    global game_over
+    game_random.seed(GAME_SEED)
+    reset_game()
+    game_over = False
+    save_render_state()
+
+
+def reset(warm_pose_input=None):
+    """Start a fresh round: new level, Mario back at the start, clocks caught up.
+
+    warm_pose_input an already started pose backend to switch to (one that
+    finished warming up after the game started keyboard-only).
+    """
+    global game_over, sim_accumulator, pose_input, round_reset
+    if warm_pose_input is not None:
+        pose_input.stop()
+        pose_input = warm_pose_input
+        pose_input.profiler = profiler if PROFILE_PATH else None
+    if pose_input.failed:
+        # The camera dropped out last round - open it again from scratch, or play on the keyboard
+        pose_input.stop()
+        pose_input = open_pose_input()
+        pose_input.profiler = profiler if PROFILE_PATH else None
+    new_round()
+    sim_accumulator = 0.0
+    clock.tick()  # Don't count the time spent outside run() as a frame
+    save_render_state()
+    round_reset = True  # Marked in the recording so a replay resets at the same frame
+
+
+def run(play_requested_at=None):
+    """Play until the player quits (Esc / window close), the pose backend fails or a headless run is done.
+
+    Returns why it stopped: 'quit', 'pose failed' or 'done'. play_requested_at
+    is the time.perf_counter() of the PLAY click, for the time-to-first-frame report.
+    """
+    global game_over, deaths, best_score, sim_accumulator, sim_steps, sim_wall_seconds, time_to_first_frame
+    global round_reset
+    first_frame = True
+    time_to_first_frame = None  # Stays None if the round ends before its first frame
+    last_gestures = None
+    if render_state is None:
+        save_render_state()
+    while True:
+        profiler.frame_start()
+        restart = False
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return 'quit'
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    return 'quit'
+                elif event.key == pygame.K_F3:
+                    profiler.toggle_overlay()
+                elif game_over:
+                    restart = True
+        profiler.lap('events')
+
+        # Camera input - newest landmarks from the pose backend
+        if pose_input.scheduler is not None:
+            pose_input.scheduler.idle = game_over  # Nobody is playing - the pose backend can slow down
+        snapshot = pose_input.latest()
+        if pose_input.failed:
+            return 'pose failed'
+        landmarks = snapshot['landmarks'] if snapshot else None
+        pose_input.note_decision(snapshot)  # Capture age of the frame the gestures below act on
+        profiler.lap('pose input')
+
+        move_right, move_left, jump, shoot = classify_gestures(landmarks)
+        gestures = (move_right, move_left, jump, shoot)
+        if gestures != last_gestures:
+            pose_input.note_action(snapshot)  # How old the landmarks behind this change of gesture are
+            last_gestures = gestures
+
+        # Keyboard fallback - the recorded keys and restarts when replaying
+        if REPLAY_PATH:
+            keys = unpack_keys(snapshot['keys'])
+            restart = snapshot['restart']
+            if snapshot['reset']:
+                new_round()  # The recorded launcher session started a new round here
+        else:
+            keys = read_keyboard()
+            if HEADLESS and game_over:
+                restart = True  # Nobody to press a key - restart straight away and keep playing
+        key_right, key_left, key_jump, key_shoot = keys
+        if key_right:
+            move_right = True
+        if key_left:
+            move_left = True
+        if key_jump:
+            jump = True
+        if key_shoot:
+            shoot = True
 
-    # Elegant Score HUD
-    # Clean, modern score display with subtle effects
-    score_font = pygame.font.Font(pygame.font.match_font('arial'), 32)
-    
-    # Subtle shadow for depth
-    shadow_text = score_font.render(f"Score: {score:,}", True, (30, 30, 30))
-    shadow_rect = shadow_text.get_rect()
-    shadow_rect.topright = (screen.get_width() - 18, 22)
-    screen.blit(shadow_text, shadow_rect)
-    
-    # Main score text in clean white
-    score_text = score_font.render(f"Score: {score:,}", True, (255, 255, 255))
-    score_rect = score_text.get_rect()
-    score_rect.topright = (screen.get_width() - 20, 20)
-    screen.blit(score_text, score_rect)
-    
-    # Subtle background panel
-    panel_rect = pygame.Rect(score_rect.left - 10, score_rect.top - 5, 
-                           score_rect.width + 20, score_rect.height + 10)
-    panel_surface = pygame.Surface((panel_rect.width, panel_rect.height), pygame.SRCALPHA)
-    panel_surface.fill((0, 0, 0, 80))  # Semi-transparent black
-    screen.blit(panel_surface, panel_rect)
-    
-    # Controls HUD
-    small_font = pygame.font.Font(pygame.font.match_font('arial'), 20)
-    white = (255, 255, 255)
-    controls_text = small_font.render("Controls: Gestures (Move hands, Raise arms=Jump, Point forward=Shoot) | Keys: WASD/Arrows, X/Ctrl", True, white)
-    screen.blit(controls_text, (10, screen.get_height() - 25))
-
-    # Camera overlay
-    annotated_frame = frame.copy()
-    mp.solutions.drawing_utils.draw_landmarks(annotated_frame, result.pose_landmarks, mp_pose.POSE_CONNECTIONS)
-    camera_feed = cv2.cvtColor(annotated_frame, cv2.COLOR_BGR2RGB)
-    camera_feed = pygame.surfarray.make_surface(camera_feed)
-    camera_feed = pygame.transform.rotate(camera_feed, -90)
-    camera_feed = pygame.transform.flip(camera_feed, True, False)
-    camera_feed = pygame.transform.scale(camera_feed, (200, 150))
-    screen.blit(camera_feed, (0, 0))
+        if restart:
+            deaths += 1
+            best_score = max(best_score, score)
+            reset_game()
+            game_over = False
+            save_render_state()  # Don't interpolate from the pre-reset position
+        profiler.lap('gestures & keys')
+
+        # Advance the simulation by as many fixed steps as the real time since the last frame covers
+        if REPLAY_PATH:
+            steps = snapshot['steps']  # Exactly what the recorded session ran
+        elif HEADLESS:
+            steps = HEADLESS_STEPS_PER_FRAME  # Virtual clock, wall time doesn't matter
+        else:
+            sim_accumulator = min(sim_accumulator + clock.get_time(), MAX_STEPS_PER_FRAME * SIM_STEP_MS)
+            steps = int(sim_accumulator // SIM_STEP_MS)
+            sim_accumulator -= steps * SIM_STEP_MS
+        if recorder:
+            recorder.write((time.perf_counter() - run_start) * 1000, steps, landmarks, pack_keys(*keys), restart,
+                           round_reset)
+        round_reset = False
+        step_start = time.perf_counter()
+        for _ in range(steps):
+            save_render_state()
+            simulation_step(move_right, move_left, jump, shoot)
+        sim_steps += steps
+        sim_wall_seconds += time.perf_counter() - step_start
+
+        if HEADLESS_MINUTES and sim_time >= HEADLESS_MINUTES * 60000:
+            return 'done'
+
+        # Draw between the last two simulation states, alpha of the way into the step in progress
+        alpha = sim_accumulator / SIM_STEP_MS
+        previous_mario_x, previous_mario_y, previous_scroll_offset = render_state
+        view_offset = round(previous_scroll_offset + (scroll_offset - previous_scroll_offset) * alpha)
+        mario_draw_x = round(previous_mario_x + (mario_x - previous_mario_x) * alpha)
+        mario_draw_y = round(previous_mario_y + (mario_y - previous_mario_y) * alpha)
+
+        # Boss warning screen shake moves the whole game world (HUD stays put)
+        warning_elapsed = boss_warning_elapsed()
+        shake_x, shake_y = boss_warning_shake(warning_elapsed)
+        view_offset += shake_x
+        mario_draw_x += shake_x
+        mario_draw_y += shake_y
+
+        # Draw background
+        if background_img:
+            x_position = view_offset % -background_img.get_width()
+            screen.blit(background_img, (x_position, shake_y))
+            if x_position + background_img.get_width() < SCREEN_WIDTH:
+                screen.blit(background_img, (x_position + background_img.get_width(), shake_y))
+        else:
+            screen.fill((255, 255, 255))
+        profiler.lap('draw background')
+
+        # Draw textured platforms - one blit of a pre-rendered surface each
+        for platform_data in platforms:
+            platform = platform_data['rect']
+            platform_surface = platform_cache.get(platform.width, platform.height, platform_data['texture_id'])
+            screen.blit(platform_surface, (platform.x + view_offset, platform.y + shake_y))
+        profiler.lap('draw platforms')
+
+        for obstacle_x, obstacle_y in obstacles.positions(-view_offset, SCREEN_WIDTH - view_offset, alpha):
+            screen.blit(obstacle_img, (obstacle_x + view_offset, obstacle_y + shake_y))
+
+        # Draw bosses, fireballs & bullets
+        draw_bosses_fireballs_and_bullets(view_offset, alpha, shake_y)
+
+        screen.blit(mario_img, (mario_draw_x, mario_draw_y))
+        profiler.lap('draw entities')
+
+        # Draw boss warning on top of the game world
+        draw_boss_warning(warning_elapsed)
+        profiler.lap('boss warning')
+
+        # Elegant Score HUD
+        # Clean, modern score display with subtle effects
+        score_label = f"Score: {score:,}"
+
+        # Subtle shadow for depth
+        shadow_text = text_cache.render(score_label, 'arial', 32, (30, 30, 30))
+        shadow_rect = shadow_text.get_rect()
+        shadow_rect.topright = (screen.get_width() - 18, 22)
+        screen.blit(shadow_text, shadow_rect)
 
-    if game_over:
-        font = pygame.font.Font(None, 74)
-        text = font.render("Game Over!", True, (255, 0, 0))
-        text_rect = text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 50))
-        screen.blit(text, text_rect)
-        font = pygame.font.Font(None, 36)
-        text = font.render("Press any key to restart", True, (255, 255, 255))
-        text_rect = text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 50))
-        screen.blit(text, text_rect)
-
-    pygame.display.flip()
-    clock.tick(120)  # Increased from 30 to 120 FPS for smoother gameplay
+        # Main score text in clean white
+        score_text = text_cache.render(score_label, 'arial', 32, (255, 255, 255))
+        score_rect = score_text.get_rect()
+        score_rect.topright = (screen.get_width() - 20, 20)
+        screen.blit(score_text, score_rect)
+
+        # Subtle background panel
+        panel_rect = score_rect.inflate(20, 10)
+        screen.blit(text_cache.panel(panel_rect.size, (0, 0, 0, 80)), panel_rect)  # Semi-transparent black
+
+        # Controls HUD
+        controls_text = text_cache.render(CONTROLS_TEXT, 'arial', 20, (255, 255, 255))
+        screen.blit(controls_text, (10, screen.get_height() - 25))
+        profiler.lap('hud')
+
+        # Camera overlay
+        if snapshot and snapshot['frame'] is not None:
+            screen.blit(camera_preview.update(snapshot['frame'], landmarks, snapshot['frame_id']), (0, 0))
+        profiler.lap('camera overlay')
+
+        if game_over:
+            text = text_cache.render("Game Over!", None, 74, (255, 0, 0))
+            text_rect = text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 50))
+            screen.blit(text, text_rect)
+            text = text_cache.render("Press any key to restart", None, 36, (255, 255, 255))
+            text_rect = text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 50))
+            screen.blit(text, text_rect)
+
+        profiler.draw(screen, SCREEN_WIDTH - 580, 70)
+        profiler.lap('profiler overlay')
+
+        pygame.display.flip()
+        profiler.lap('display.flip')
+        if first_frame:
+            first_frame = False
+            if play_requested_at is not None:
+                time_to_first_frame = (time.perf_counter() - play_requested_at) * 1000
+                print(f"First playable frame {time_to_first_frame:.0f} ms after PLAY")
+        if HEADLESS:
+            clock.tick()  # Uncapped
+        else:
+            clock.tick(RENDER_FPS)
+        profiler.lap('clock.tick (idle)')
+
+
+def main():
+    start()
+    run()
+    shutdown()
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
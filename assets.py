@@ -0,0 +1,205 @@
+"""
+Images and sounds for the menu and the game, loaded once per process.
+
+MANIFEST names every asset file. preload() decodes them on a thread pool
+(PNG and MP3 decoding doesn't need the display), so by the time the menu or
+the game asks for an asset it is usually ready. image() applies convert() /
+convert_alpha() once, on the calling (main) thread, and scaled() memoizes
+scaled copies by (asset, size). Scaled copies asked for with persist=True -
+the 2x-screen-wide background - are also stored in .cache/scaled as raw
+pixels, keyed by the source file and size, so later starts at the same
+resolution skip the decode and the transform.scale. Sounds are decoded once
+into the mixer's PCM format and read back from .cache/audio after that (see
+audio_cache.py). MARIO_AUDIO_CACHE=0 turns that off.
+
+The menu music is streamed by pygame.mixer.music, so it is only listed here
+for its path.
+"""
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from atomic_file import atomic_write
+from audio_cache import AudioCache
+
+ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_DIR = os.path.join(ASSET_DIR, ".cache", "scaled")
+AUDIO_CACHE_ENABLED = os.environ.get('MARIO_AUDIO_CACHE', '1') != '0'
+
+# kind: 'alpha' (convert_alpha), 'opaque' (convert), 'sound' or 'music' (streamed, not decoded)
+MANIFEST = {
+    'mario': {'file': 'mario.png', 'kind': 'alpha'},
+    'obstacle': {'file': 'obstacle.png', 'kind': 'alpha'},
+    'boss': {'file': 'boss_image.png', 'kind': 'alpha'},
+    'bullet': {'file': 'bullet.png', 'kind': 'alpha'},
+    'boss_face_neutral': {'file': 'boss_face_neutral.png', 'kind': 'alpha'},
+    'boss_face_angry': {'file': 'boss_face_angry.png', 'kind': 'alpha'},
+    'background': {'file': 'im2.png', 'kind': 'opaque'},
+    'menu_background': {'file': 'im1.png', 'kind': 'opaque'},
+    'angry_sound': {'file': 'angry_sound.mp3', 'kind': 'sound'},
+    'luigi_scream': {'file': 'luigi-woaaahh-scream.mp3', 'kind': 'sound'},
+    'sad_meow': {'file': 'sad-meow-song.mp3', 'kind': 'sound'},
+    'music': {'file': 'background_music.mp3', 'kind': 'music'},
+}
+
+# What the menu and the game each preload. Not 'background': the game usually gets it scaled from disk
+MENU_ASSETS = ('mario', 'menu_background')
+GAME_ASSETS = ('mario', 'obstacle', 'boss', 'bullet', 'boss_face_neutral', 'boss_face_angry',
+               'angry_sound', 'luigi_scream', 'sad_meow')
+
+# Raw pixel layout of persisted scaled images - 4 bytes a pixel converts to the display format fastest
+PERSIST_FORMATS = {'alpha': "RGBA", 'opaque': "RGBX"}
+
+
+class AssetManager:
+    """Decodes the manifest's assets in the background and hands out converted, scaled copies"""
+
+    def __init__(self, manifest=MANIFEST, directory=ASSET_DIR, cache_dir=DEFAULT_CACHE_DIR, workers=None,
+                 audio_cache=None):
+        self.manifest = manifest
+        self.audio_cache = audio_cache  # AudioCache for decoded sounds, or None to decode the MP3 every time
+        self.directory = directory
+        self.cache_dir = cache_dir
+        # pygame's PNG and MP3 decoders release the GIL, so one worker per core (up to 4) runs in parallel
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self._pool = None
+        self._decoding = {}  # name -> Future of the decoded Surface / Sound
+        self._converted = {}  # name -> Surface in the display's format
+        self._scaled = {}  # (name, (width, height)) -> Surface
+        self._display = None  # Display the converted surfaces were made for
+        self.decode_ms = {}  # name -> ms the decode took on its worker thread
+        self.wait_ms = 0.0  # Time the main thread spent waiting for decodes
+        self.scaled_hits = 0
+        self.scaled_misses = 0
+        self.disk_hits = 0
+
+    def path(self, name):
+        return os.path.join(self.directory, self.manifest[name]['file'])
+
+    def preload(self, names):
+        """Start decoding names (images and sounds) on the thread pool"""
+        for name in names:
+            if name not in self._decoding and self.manifest[name]['kind'] != 'music':
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="asset-decode")
+                self._decoding[name] = self._pool.submit(self._decode, name)
+        return self
+
+    def _decode(self, name):
+        start = time.perf_counter()
+        if self.manifest[name]['kind'] == 'sound':
+            if self.audio_cache is not None:
+                asset = self.audio_cache.load(self.path(name))
+            else:
+                asset = pygame.mixer.Sound(self.path(name))
+        else:
+            asset = pygame.image.load(self.path(name))
+        self.decode_ms[name] = (time.perf_counter() - start) * 1000
+        return asset
+
+    def _decoded(self, name):
+        """The decoded asset, waiting for its decode if needed. Raises whatever the decode raised"""
+        self.preload([name])
+        start = time.perf_counter()
+        try:
+            return self._decoding[name].result()
+        finally:
+            self.wait_ms += (time.perf_counter() - start) * 1000
+
+    def _check_display(self):
+        # Converted surfaces match the display they were converted for - a new display mode starts over
+        display = pygame.display.get_surface()
+        if display is not self._display:
+            self._display = display
+            self._converted.clear()
+            self._scaled.clear()
+
+    def image(self, name):
+        """The image converted for the display. Call from the main thread, after set_mode()"""
+        self._check_display()
+        image = self._converted.get(name)
+        if image is None:
+            decoded = self._decoded(name)
+            image = decoded.convert_alpha() if self.manifest[name]['kind'] == 'alpha' else decoded.convert()
+            self._converted[name] = image
+        return image
+
+    def scaled(self, name, size, persist=False):
+        """The image scaled to size, made once per (name, size). persist=True also keeps it on disk"""
+        self._check_display()
+        size = (int(size[0]), int(size[1]))
+        key = (name, size)
+        image = self._scaled.get(key)
+        if image is not None:
+            self.scaled_hits += 1
+            return image
+        self.scaled_misses += 1
+        if persist:
+            image = self._load_persisted(name, size)
+        if image is None:
+            image = pygame.transform.scale(self.image(name), size)
+            if persist:
+                self._persist(name, size, image)
+        self._scaled[key] = image
+        return image
+
+    def sound(self, name):
+        """The decoded pygame.mixer.Sound. Raises if it couldn't be loaded"""
+        return self._decoded(name)
+
+    def _persist_path(self, name, size):
+        path = self.path(name)
+        source = os.stat(path)
+        kind = self.manifest[name]['kind']
+        key = repr((os.path.basename(path), source.st_size, source.st_mtime_ns, size, PERSIST_FORMATS[kind]))
+        digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{name}-{size[0]}x{size[1]}-{digest}.raw")
+
+    def _load_persisted(self, name, size):
+        try:
+            with open(self._persist_path(name, size), 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        if len(data) != size[0] * size[1] * 4:
+            return None
+        self.disk_hits += 1
+        image = pygame.image.frombuffer(data, size, PERSIST_FORMATS[self.manifest[name]['kind']])
+        return image.convert_alpha() if self.manifest[name]['kind'] == 'alpha' else image.convert()
+
+    def _persist(self, name, size, image):
+        try:
+            path = self._persist_path(name, size)
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Only the current resolution is kept - drop this asset's entries for other sizes
+            for filename in os.listdir(self.cache_dir):
+                if filename.startswith(f"{name}-") and filename != os.path.basename(path):
+                    os.remove(os.path.join(self.cache_dir, filename))
+            atomic_write(path, pygame.image.tobytes(image, PERSIST_FORMATS[self.manifest[name]['kind']]))
+        except OSError as e:
+            print(f"Could not write scaled image cache entry: {e}")
+
+    def stats(self):
+        return {
+            'decoded': len(self.decode_ms),
+            'decode_ms': round(sum(self.decode_ms.values()), 1),
+            'main_thread_wait_ms': round(self.wait_ms, 1),
+            'scaled_hits': self.scaled_hits,
+            'scaled_misses': self.scaled_misses,
+            'disk_hits': self.disk_hits,
+            'audio_cache': self.audio_cache.stats() if self.audio_cache is not None else 'off',
+        }
+
+
+_shared = None
+
+
+def shared_assets():
+    """The process-wide AssetManager, so the menu and the game decode each file once"""
+    global _shared
+    if _shared is None:
+        _shared = AssetManager(audio_cache=AudioCache() if AUDIO_CACHE_ENABLED else None)
+    return _shared
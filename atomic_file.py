@@ -0,0 +1,23 @@
+import os
+import tempfile
+
+
+def atomic_write(path, data):
+    """Write data (bytes) to path so a crash never leaves a half-written file.
+
+    The data goes to a uniquely named temp file in the same directory, which then
+    replaces path in one step - so threads or processes writing the same entry
+    at once can't collide on the temp file. Raises OSError like open() would.
+    """
+    directory, name = os.path.split(path)
+    fd, tmp_path = tempfile.mkstemp(prefix=name + ".", suffix=".tmp", dir=directory or ".")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
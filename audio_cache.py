@@ -0,0 +1,73 @@
+import hashlib
+import os
+import threading
+
+import pygame
+
+from atomic_file import atomic_write
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "audio")
+
+
+class AudioCache:
+    """On-disk cache of sound effects decoded to the mixer's native PCM.
+
+    Decoding an MP3 into a pygame.mixer.Sound takes milliseconds per file
+    every start. The first time, the decoded samples (Sound.get_raw()) are
+    written to disk. Later loads read them back into a buffer-backed Sound.
+    Entries are keyed by a hash of the file's contents and the mixer
+    settings (frequency, sample format, channels), because raw samples
+    only play correctly with the settings they were decoded for. Entries
+    for an older version of the same file are deleted when the new one is
+    written.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()  # Sounds are loaded from the asset manager's decode threads
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+        except OSError as e:
+            print(f"Audio cache unavailable: {e}")
+
+    def _path(self, path, data, mixer_settings):
+        key = hashlib.sha1(data)
+        key.update(repr(mixer_settings).encode())
+        return os.path.join(self.directory, f"{os.path.basename(path)}-{key.hexdigest()[:16]}.pcm")
+
+    def load(self, path):
+        """pygame.mixer.Sound for path, from the decoded copy on disk when there is one"""
+        mixer_settings = pygame.mixer.get_init()
+        if mixer_settings is None:
+            raise pygame.error("mixer not initialized")
+        with open(path, 'rb') as f:
+            data = f.read()
+        cache_path = self._path(path, data, mixer_settings)
+        try:
+            with open(cache_path, 'rb') as f:
+                samples = f.read()
+            if samples:
+                with self._lock:
+                    self.hits += 1
+                return pygame.mixer.Sound(buffer=samples)
+        except OSError:
+            pass
+
+        with self._lock:
+            self.misses += 1
+        sound = pygame.mixer.Sound(path)
+        try:
+            # Drop entries for other versions of this file or other mixer settings
+            prefix = os.path.basename(path) + "-"
+            for filename in os.listdir(self.directory):
+                if filename.startswith(prefix) and filename != os.path.basename(cache_path):
+                    os.remove(os.path.join(self.directory, filename))
+            atomic_write(cache_path, sound.get_raw())
+        except OSError as e:
+            print(f"Could not write audio cache entry: {e}")
+        return sound
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses}
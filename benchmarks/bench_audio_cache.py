@@ -0,0 +1,83 @@
+"""
+Sound effect loading with and without the decoded-PCM audio cache.
+
+Each mode runs in a fresh interpreter (dummy audio driver), loading the
+game's three MP3 sound effects the way the asset manager does:
+    no cache    - pygame.mixer.Sound(mp3 file), decoded every start
+    cold cache  - AudioCache on an empty directory: decode, then write the PCM
+    warm cache  - AudioCache again: PCM read back into buffer-backed Sounds
+Reported per mode, median of RUNS: ms to load the three sounds, and the
+process's resident memory (RSS) afterwards and at its peak.
+
+Usage: python benchmarks/bench_audio_cache.py
+"""
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = 5
+SOUNDS = ('angry_sound', 'luigi_scream', 'sad_meow')
+
+# Loads SOUNDS in one mode, prints a JSON result line
+LOAD_SCRIPT = """
+import json, os, resource, sys, time
+sys.path.insert(0, {repo!r})
+import pygame
+from assets import MANIFEST
+from audio_cache import AudioCache
+mode, cache_dir = sys.argv[1], sys.argv[2]
+pygame.mixer.init()
+paths = [os.path.join({repo!r}, MANIFEST[name]['file']) for name in {sounds!r}]
+start = time.perf_counter()
+if mode == 'none':
+    sounds = [pygame.mixer.Sound(path) for path in paths]
+else:
+    cache = AudioCache(cache_dir)
+    sounds = [cache.load(path) for path in paths]
+load_ms = (time.perf_counter() - start) * 1000
+with open('/proc/self/status') as f:
+    rss_kb = next(int(line.split()[1]) for line in f if line.startswith('VmRSS:'))
+peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{'load_ms': load_ms, 'rss_mb': rss_kb / 1024, 'peak_mb': peak_kb / 1024}}))
+"""
+
+
+def run_once(mode, cache_dir):
+    script = LOAD_SCRIPT.format(repo=REPO, sounds=SOUNDS)
+    env = dict(os.environ, SDL_AUDIODRIVER='dummy', PYGAME_HIDE_SUPPORT_PROMPT='1')
+    result = subprocess.run([sys.executable, "-c", script, mode, cache_dir],
+                            env=env, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def summarize(label, results):
+    load_ms = statistics.median(r['load_ms'] for r in results)
+    rss_mb = statistics.median(r['rss_mb'] for r in results)
+    peak_mb = statistics.median(r['peak_mb'] for r in results)
+    print(f"{label:<12}{load_ms:>10.1f}{rss_mb:>12.1f}{peak_mb:>12.1f}")
+
+
+def main():
+    cache_dir = tempfile.mkdtemp(prefix="audio-cache-")
+    try:
+        print(f"Loading {', '.join(SOUNDS)} - median of {RUNS} fresh processes")
+        print(f"{'mode':<12}{'load ms':>10}{'RSS MB':>12}{'peak MB':>12}")
+        summarize("no cache", [run_once('none', cache_dir) for _ in range(RUNS)])
+        cold = []
+        for _ in range(RUNS):
+            shutil.rmtree(cache_dir)
+            os.makedirs(cache_dir)
+            cold.append(run_once('cache', cache_dir))
+        summarize("cold cache", cold)
+        summarize("warm cache", [run_once('cache', cache_dir) for _ in range(RUNS)])
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Camera HUD thumbnail cost per frame: the old copy/cvtColor/make_surface/rotate/
+flip/scale chain vs camera_preview.CameraPreview.
+
+Bytes allocated per frame are the peak NumPy/Python allocations seen by
+tracemalloc plus the pixel memory of every intermediate pygame surface.
+
+Usage: python benchmarks/bench_camera_preview.py
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import cv2
+import numpy as np
+import pygame
+
+from camera_preview import CameraPreview
+from gestures import synthetic_landmarks
+from pose_input import draw_pose_landmarks
+
+RESOLUTIONS = [(640, 480), (1280, 720)]
+FRAMES = 200
+PREVIEW_SIZE = (200, 150)
+
+
+def surface_bytes(surface):
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def legacy_preview(frame, landmarks):
+    """The camera overlay from 18.py before CameraPreview, returns (surface, surface bytes)"""
+    annotated_frame = frame.copy()
+    draw_pose_landmarks(annotated_frame, landmarks)
+    camera_feed = cv2.cvtColor(annotated_frame, cv2.COLOR_BGR2RGB)
+    surfaces = [pygame.surfarray.make_surface(camera_feed)]
+    surfaces.append(pygame.transform.rotate(surfaces[-1], -90))
+    surfaces.append(pygame.transform.flip(surfaces[-1], True, False))
+    surfaces.append(pygame.transform.scale(surfaces[-1], PREVIEW_SIZE))
+    return surfaces[-1], sum(surface_bytes(surface) for surface in surfaces)
+
+
+def measure(render, frames):
+    """(ms per frame, bytes allocated per frame) for render(frame) over frames"""
+    start = time.perf_counter()
+    for frame in frames:
+        render(frame)
+    elapsed_ms = (time.perf_counter() - start) / len(frames) * 1000
+
+    tracemalloc.start()
+    allocated = 0
+    for frame in frames[:20]:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        surface_allocated = render(frame)
+        _, peak = tracemalloc.get_traced_memory()
+        allocated += peak - before + surface_allocated
+    tracemalloc.stop()
+    return elapsed_ms, allocated / 20
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    landmarks = synthetic_landmarks(move_right=True, shoot=True)
+    print(f"{'camera':>10}{'legacy ms':>11}{'legacy KB':>11}{'preview ms':>12}{'preview KB':>12}{'speedup':>10}")
+    for width, height in RESOLUTIONS:
+        rng = np.random.default_rng(0)
+        frames = [rng.integers(0, 256, (height, width, 3), dtype=np.uint8) for _ in range(8)] * (FRAMES // 8)
+
+        def legacy(frame):
+            surface, allocated = legacy_preview(frame, landmarks)
+            screen.blit(surface, (0, 0))
+            return allocated
+
+        preview = CameraPreview(PREVIEW_SIZE)
+
+        def zero_copy(frame):
+            screen.blit(preview.update(frame, landmarks), (0, 0))
+            return 0
+
+        legacy_ms, legacy_bytes = measure(legacy, frames)
+        preview_ms, preview_bytes = measure(zero_copy, frames)
+        print(f"{f'{width}x{height}':>10}{legacy_ms:>11.2f}{legacy_bytes / 1024:>11.0f}"
+              f"{preview_ms:>12.2f}{preview_bytes / 1024:>12.1f}{legacy_ms / preview_ms:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Per-frame obstacle update + Mario collision cost: per-obstacle Python loop vs
+obstacles.ObstacleStore, for a stress scenario with thousands of obstacles.
+
+Usage: python benchmarks/bench_obstacles.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from obstacles import OBSTACLE_SIZE, ObstacleStore
+
+COUNTS = [10, 1000, 10_000]
+FRAMES = 200
+GROUND_Y = 1030
+
+
+def spawn(count):
+    """Same obstacles as a list of dicts with Rects and as an ObstacleStore"""
+    dicts = []
+    store = ObstacleStore()
+    for i in range(count):
+        x = 2000 + i * 400
+        speed = random.uniform(2, 4)
+        direction = random.choice([-1, 1])
+        range_limit = random.randint(100, 300)
+        dicts.append({'rect': pygame.Rect(x, GROUND_Y - OBSTACLE_SIZE, OBSTACLE_SIZE, OBSTACLE_SIZE),
+                      'speed': speed, 'direction': direction,
+                      'start': x - range_limit, 'end': x + range_limit})
+        store.add(x, GROUND_Y - OBSTACLE_SIZE, speed, direction, x - range_limit, x + range_limit)
+    return dicts, store
+
+
+def loop_frame(obstacles, mario_rect, scroll_offset):
+    """The per-obstacle update from 18.py before ObstacleStore"""
+    hit = False
+    for obstacle in obstacles:
+        if mario_rect.colliderect(obstacle['rect'].move(scroll_offset, 0)):
+            hit = True
+        new_x = obstacle['rect'].x + obstacle['speed'] * obstacle['direction']
+        if new_x <= obstacle['start']:
+            obstacle['direction'] = 1
+            new_x = obstacle['start']
+        elif new_x >= obstacle['end']:
+            obstacle['direction'] = -1
+            new_x = obstacle['end']
+        obstacle['rect'].x = new_x
+    return hit
+
+
+def store_frame(store, mario_rect, scroll_offset):
+    left = mario_rect.left - scroll_offset
+    hit = store.collides(left, mario_rect.top, left + mario_rect.width, mario_rect.bottom)
+    store.update()
+    return hit
+
+
+def main():
+    print(f"{'obstacles':>10}{'loop us/frame':>16}{'store us/frame':>16}{'speedup':>10}")
+    for count in COUNTS:
+        dicts, store = spawn(count)
+        mario_rect = pygame.Rect(400, GROUND_Y - 100, 100, 100)
+
+        start = time.perf_counter()
+        for frame in range(FRAMES):
+            loop_frame(dicts, mario_rect, -frame * 5)
+        loop_us = (time.perf_counter() - start) / FRAMES * 1e6
+
+        start = time.perf_counter()
+        for frame in range(FRAMES):
+            store_frame(store, mario_rect, -frame * 5)
+        store_us = (time.perf_counter() - start) / FRAMES * 1e6
+
+        drift = sum(abs(d['rect'].x - x) for d, (x, _) in zip(dicts, store.positions()))
+        note = f"  (position drift {drift}px)" if drift else ""
+        print(f"{count:>10}{loop_us:>16.1f}{store_us:>16.1f}{loop_us / store_us:>9.1f}x{note}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Platform collision query cost: the old linear scan vs spatial_index.PlatformIndex.
+
+Usage: python benchmarks/bench_platform_index.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from spatial_index import PlatformIndex
+
+COUNTS = [100, 10_000, 100_000]
+QUERIES = 2000
+SCREEN_HEIGHT = 1080
+
+
+def make_platforms(count):
+    """Platforms laid out like world.py does: one every 250-800px, some bonus ones"""
+    platforms = []
+    x = 500
+    while len(platforms) < count:
+        y = random.randint(SCREEN_HEIGHT - 350, SCREEN_HEIGHT - 120)
+        width = random.choice([180, 220, 250, 300, 350, 400])
+        platforms.append({'rect': pygame.Rect(x, y, width, random.choice([20, 25, 30])), 'texture_id': 0})
+        if random.random() < 0.3 and len(platforms) < count:
+            platforms.append({'rect': pygame.Rect(x + random.randint(150, 300), y, 150, 20), 'texture_id': 0})
+        x += random.randint(250, 800)
+    return platforms, x
+
+
+def linear_scan(mario_rect, platforms, scroll_offset):
+    """check_platform_collisions as it was before the index"""
+    for platform_data in platforms:
+        platform = platform_data['rect']
+        platform_rect = platform.move(scroll_offset, 0)
+        if mario_rect.colliderect(platform_rect) and mario_rect.bottom <= platform_rect.bottom:
+            return platform.top
+    return None
+
+
+def main():
+    print(f"{'platforms':>10}{'linear us/query':>18}{'index us/query':>17}{'speedup':>10}")
+    for count in COUNTS:
+        platforms, world_width = make_platforms(count)
+        index = PlatformIndex()
+        for platform in platforms:
+            index.insert(platform)
+
+        queries = []
+        for _ in range(QUERIES):
+            scroll_offset = -random.randint(0, world_width)
+            mario_rect = pygame.Rect(400, random.randint(SCREEN_HEIGHT - 450, SCREEN_HEIGHT - 150), 100, 100)
+            queries.append((mario_rect, scroll_offset))
+
+        linear_queries = queries if count <= 10_000 else queries[:200]
+        start = time.perf_counter()
+        linear_results = [linear_scan(rect, platforms, offset) for rect, offset in linear_queries]
+        linear_us = (time.perf_counter() - start) / len(linear_queries) * 1e6
+
+        start = time.perf_counter()
+        index_results = []
+        for rect, offset in queries:
+            left = rect.left - offset
+            index_results.append(index.landing_top(left, rect.top, left + rect.width, rect.bottom))
+        index_us = (time.perf_counter() - start) / len(queries) * 1e6
+
+        # Both must agree on whether Mario is standing on something
+        mismatches = sum((a is None) != (b is None) for a, b in zip(linear_results, index_results))
+        note = f"  ({mismatches} mismatches)" if mismatches else ""
+        print(f"{count:>10}{linear_us:>18.2f}{index_us:>17.2f}{linear_us / index_us:>9.0f}x{note}")
+
+
+if __name__ == "__main__":
+    main()
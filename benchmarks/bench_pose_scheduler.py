@@ -0,0 +1,89 @@
+"""
+Pose inference scheduling policies on the same scripted camera footage.
+
+The footage is 10 s at 30 fps of a player who stands still between
+gestures. Each gesture starts from rest and speeds up, the way a real arm
+does, so its first frames move only a few pixels - under the motion gate.
+Two gestures start while playing and two after the game is over, when the
+adaptive policy is also throttled to idle_fps. Each policy runs MediaPipe
+pose only where InferenceScheduler lets it. Reported per policy:
+    inferences         - frames pose actually ran on
+    CPU ms / frame     - process CPU time per camera frame, gating included
+    gesture delay      - ms of footage from a gesture's first moving frame to
+                         the first inference on or after it, mean and max
+
+Usage: python benchmarks/bench_pose_scheduler.py
+"""
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cv2
+import mediapipe as mp
+import numpy as np
+
+from pose_scheduler import POLICIES, InferenceScheduler
+
+FPS = 30
+FRAMES = 300
+GAME_OVER = range(170, FRAMES)
+GESTURE_ONSETS = (40, 105, 203, 262)  # First moving frame of each gesture - the last two while idle
+GESTURE_FRAMES = 30  # The arm rises, then drops back to rest
+
+
+def arm_offset(index):
+    """Pixels the arm is raised by on frame index - accelerating from rest at each onset"""
+    for onset in GESTURE_ONSETS:
+        if onset <= index < onset + GESTURE_FRAMES:
+            t = index - onset
+            return min(1 + t * t // 4, 150)
+    return 0
+
+
+def footage():
+    """Yield (frame, idle)"""
+    rng = np.random.default_rng(0)
+    background = rng.integers(0, 256, (480, 640, 3), dtype=np.uint8)
+    for index in range(FRAMES):
+        frame = background.copy()
+        arm_y = 250 - arm_offset(index)
+        frame[arm_y:arm_y + 30, 300:420] = (40, 40, 200)
+        yield frame, index in GAME_OVER
+
+
+def run(policy, frames, pose):
+    scheduler = InferenceScheduler(policy)
+    cpu_start = time.process_time()
+    delays = []
+    onset = None  # Footage time of the gesture inference hasn't seen yet
+    for index, (frame, idle) in enumerate(frames):
+        now = index / FPS  # Footage clock, so results don't depend on how fast this machine is
+        scheduler.idle = idle
+        if index in GESTURE_ONSETS:
+            onset = now
+        if scheduler.should_infer(frame, now):
+            pose.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+            if onset is not None:
+                delays.append((now - onset) * 1000)
+                onset = None
+    cpu_ms = (time.process_time() - cpu_start) * 1000 / len(frames)
+    return scheduler.inferred, cpu_ms, delays
+
+
+def main():
+    frames = list(footage())
+    pose = mp.solutions.pose.Pose()
+    pose.process(cv2.cvtColor(frames[0][0], cv2.COLOR_BGR2RGB))  # Load the model outside the timings
+    print(f"{FRAMES} frames at {FPS} fps, {len(GESTURE_ONSETS)} gestures")
+    print(f"{'policy':<10}{'inferences':>12}{'CPU ms / frame':>16}{'mean delay ms':>15}{'max delay ms':>14}")
+    for policy in POLICIES:
+        inferences, cpu_ms, delays = run(policy, frames, pose)
+        print(f"{policy:<10}{inferences:>12}{cpu_ms:>16.2f}{statistics.mean(delays):>15.0f}{max(delays):>14.0f}")
+    pose.close()
+
+
+if __name__ == '__main__':
+    main()
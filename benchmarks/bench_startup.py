@@ -0,0 +1,155 @@
+"""
+Cold start of the menu: what it imports, and how long until its first frame.
+
+Two measurements, each in a fresh interpreter:
+    imports          - `python -X importtime -c "import launcher, menu, game_session"`,
+                       the slowest imports and the total. The menu must not pull in
+                       cv2 or mediapipe - the game loads those once the menu is up.
+    first menu frame - ms from starting `python launcher.py` (dummy video and audio
+                       drivers) to its first display.flip(), median of RUNS
+
+Exits with status 1 if a heavy module shows up in the menu's imports, or if
+the median is over the limit:
+    --max-ms N   an absolute limit - what CI passes, since a fresh checkout
+                 has no stored baseline
+    otherwise    TOLERANCE over this machine's baseline. The first run stores
+                 the median in .cache/startup_baseline.json (not checked in)
+                 and passes; --rebaseline stores a new one.
+
+Usage: python benchmarks/bench_startup.py [--max-ms N | --rebaseline]
+"""
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(REPO, ".cache", "startup_baseline.json")
+RUNS = 7
+TOLERANCE = 1.25  # Allowed median / baseline ratio
+SLACK_MS = 30  # Plus this much, so a fast machine's jitter doesn't fail the check
+HEAVY_MODULES = ("cv2", "mediapipe", "tensorflow", "google.protobuf")
+
+# Runs the launcher until its first frame is on screen, then reports and exits
+FIRST_FRAME_SCRIPT = """
+import os, sys
+import pygame
+def flip():
+    print('FIRST_FRAME', flush=True)
+    os._exit(0)
+pygame.display.flip = flip
+sys.argv = ['launcher.py']
+import launcher
+launcher.run_mario_game()
+"""
+
+
+def child_env():
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy', PYGAME_HIDE_SUPPORT_PROMPT='1')
+    env.pop('PYTHONPROFILEIMPORTTIME', None)
+    return env
+
+
+def import_times():
+    """[(cumulative ms, module)] for everything the menu side imports, slowest first"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import launcher, menu, game_session"],
+                            cwd=REPO, env=child_env(), capture_output=True, text=True, check=True)
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times.append((int(cumulative) / 1000, name.strip()))
+    return sorted(times, reverse=True)
+
+
+def first_frame_ms():
+    start = time.perf_counter()
+    child = subprocess.Popen([sys.executable, "-c", FIRST_FRAME_SCRIPT], cwd=REPO, env=child_env(),
+                             stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    for line in child.stdout:
+        if line.startswith("FIRST_FRAME"):
+            elapsed = (time.perf_counter() - start) * 1000
+            child.wait()
+            return elapsed
+    child.wait()
+    raise RuntimeError("launcher exited without drawing a frame")
+
+
+def machine_key():
+    return f"{platform.node()}|{platform.machine()}|{os.cpu_count()} cpus|{sys.version.split()[0]}"
+
+
+def load_baseline():
+    try:
+        with open(BASELINE_PATH) as file:
+            return json.load(file).get(machine_key())
+    except (OSError, ValueError):
+        return None
+
+
+def save_baseline(median_ms):
+    try:
+        with open(BASELINE_PATH) as file:
+            baselines = json.load(file)
+    except (OSError, ValueError):
+        baselines = {}
+    baselines[machine_key()] = round(median_ms, 1)
+    os.makedirs(os.path.dirname(BASELINE_PATH), exist_ok=True)
+    with open(BASELINE_PATH, 'w') as file:
+        json.dump(baselines, file, indent=2)
+
+
+def max_ms_argument():
+    """The --max-ms limit, or None"""
+    if "--max-ms" not in sys.argv:
+        return None
+    index = sys.argv.index("--max-ms")
+    if index + 1 >= len(sys.argv):
+        sys.exit("--max-ms needs a number of milliseconds")
+    return float(sys.argv[index + 1])
+
+
+def main():
+    failures = []
+    max_ms = max_ms_argument()
+
+    times = import_times()
+    print("Slowest imports for the menu (cumulative ms):")
+    for ms, name in times[:8]:
+        print(f"  {ms:8.1f}  {name}")
+    top_level = sum(ms for ms, name in times if name in ("launcher", "menu", "game_session"))
+    print(f"  {top_level:8.1f}  total")
+    heavy = sorted({name for _, name in times if name in HEAVY_MODULES})
+    if heavy:
+        failures.append(f"menu imports heavy modules: {', '.join(heavy)}")
+
+    samples = [first_frame_ms() for _ in range(RUNS)]
+    median_ms = statistics.median(samples)
+    print(f"First menu frame: median {median_ms:.0f} ms, best {min(samples):.0f} ms, worst {max(samples):.0f} ms "
+          f"over {RUNS} cold starts")
+
+    baseline = load_baseline()
+    if max_ms is not None:
+        print(f"Limit {max_ms:.0f} ms (--max-ms)")
+        if median_ms > max_ms:
+            failures.append(f"first menu frame too slow: {median_ms:.0f} ms > {max_ms:.0f} ms")
+    elif baseline is None or "--rebaseline" in sys.argv:
+        save_baseline(median_ms)
+        print(f"Stored {median_ms:.0f} ms as this machine's baseline in {BASELINE_PATH}")
+    else:
+        limit = baseline * TOLERANCE + SLACK_MS
+        print(f"Baseline {baseline:.0f} ms, limit {limit:.0f} ms")
+        if median_ms > limit:
+            failures.append(f"first menu frame regressed: {median_ms:.0f} ms > {limit:.0f} ms")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
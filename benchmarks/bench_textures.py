@@ -0,0 +1,141 @@
+"""
+Compare the old per-pixel texture generators with the NumPy ones in textures.py.
+
+Usage: python benchmarks/bench_textures.py
+"""
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from textures import create_grass_ground_texture, create_stone_texture
+
+SIZES = [32, 128, 512]
+
+
+# Per-pixel generators as they were in 18.py before textures.py
+def legacy_create_stone_texture(width, height, base_color=(120, 100, 80)):
+    texture = pygame.Surface((width, height))
+    texture.fill(base_color)
+    for y in range(height):
+        for x in range(width):
+            position_noise = math.sin(x * 0.4) * math.cos(y * 0.3) * 12
+            random_noise_r = random.randint(-15, 15)
+            random_noise_g = random.randint(-12, 12)
+            random_noise_b = random.randint(-10, 10)
+
+            total_noise_r = int(position_noise + random_noise_r)
+            total_noise_g = int(position_noise * 0.8 + random_noise_g)
+            total_noise_b = int(position_noise * 0.6 + random_noise_b)
+
+            r = max(0, min(255, base_color[0] + total_noise_r))
+            g = max(0, min(255, base_color[1] + total_noise_g))
+            b = max(0, min(255, base_color[2] + total_noise_b))
+
+            if random.random() < 0.08:
+                r = max(0, r - 25)
+                g = max(0, g - 20)
+                b = max(0, b - 15)
+            elif random.random() < 0.06:
+                r = min(255, r + 30)
+                g = min(255, g + 25)
+                b = min(255, b + 20)
+
+            texture.set_at((x, y), (r, g, b))
+
+    for _ in range(random.randint(1, 3)):
+        start_x = random.randint(0, width-1)
+        start_y = random.randint(0, height-1)
+        end_x = max(0, min(width-1, start_x + random.randint(-15, 15)))
+        end_y = max(0, min(height-1, start_y + random.randint(-8, 8)))
+        crack_color = (max(0, base_color[0] - 25), max(0, base_color[1] - 20), max(0, base_color[2] - 15))
+        pygame.draw.line(texture, crack_color, (start_x, start_y), (end_x, end_y), 1)
+
+    return texture
+
+
+def legacy_create_grass_ground_texture(width, height):
+    texture = pygame.Surface((width, height))
+    dirt_color = (101, 67, 33)
+    texture.fill(dirt_color)
+
+    for y in range(height):
+        for x in range(width):
+            if y > 4:
+                noise_factor = (math.sin(x * 0.3) + math.cos(y * 0.2)) * 8
+                base_noise = random.randint(-8, 8)
+                total_noise = int(noise_factor + base_noise)
+                r = max(0, min(255, dirt_color[0] + total_noise))
+                g = max(0, min(255, dirt_color[1] + total_noise))
+                b = max(0, min(255, dirt_color[2] + total_noise))
+                texture.set_at((x, y), (r, g, b))
+
+    grass_height = 6
+    for y in range(min(grass_height, height)):
+        for x in range(width):
+            grass_variation = math.sin(x * 0.2) * math.cos(y * 0.4) * 15
+            if y < 2:
+                base_green = (45 + int(grass_variation), 120 + int(grass_variation * 0.8), 35 + int(grass_variation * 0.5))
+            elif y < 4:
+                base_green = (40 + int(grass_variation * 0.7), 100 + int(grass_variation * 0.6), 30 + int(grass_variation * 0.4))
+            else:
+                base_green = (60 + int(grass_variation * 0.5), 80 + int(grass_variation * 0.4), 35 + int(grass_variation * 0.3))
+
+            r = max(0, min(255, base_green[0] + random.randint(-5, 5)))
+            g = max(0, min(255, base_green[1] + random.randint(-8, 12)))
+            b = max(0, min(255, base_green[2] + random.randint(-5, 5)))
+            if random.random() < 0.1:
+                g = min(255, g + 20)
+                r = max(0, r - 5)
+            texture.set_at((x, y), (r, g, b))
+
+    for _ in range(random.randint(3, 7)):
+        spot_x = random.randint(0, width-3)
+        spot_y = random.randint(grass_height-2, height-1)
+        spot_size = random.randint(1, 2)
+        dirt_spot_color = (dirt_color[0] + random.randint(-10, 10),
+                           dirt_color[1] + random.randint(-10, 10),
+                           dirt_color[2] + random.randint(-10, 10))
+        for dy in range(spot_size):
+            for dx in range(spot_size):
+                if spot_x + dx < width and spot_y + dy < height:
+                    texture.set_at((spot_x + dx, spot_y + dy), dirt_spot_color)
+
+    return texture
+
+
+def time_call(func, *args, min_time=0.5):
+    """Best-of-runs milliseconds per call, running for at least min_time seconds"""
+    best = float('inf')
+    total = 0.0
+    while total < min_time:
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        total += elapsed
+    return best * 1000
+
+
+def main():
+    pygame.init()
+    pairs = [
+        ("stone", legacy_create_stone_texture, create_stone_texture),
+        ("grass", legacy_create_grass_ground_texture, create_grass_ground_texture),
+    ]
+    print(f"{'texture':<8}{'size':>6}{'per-pixel ms':>15}{'numpy ms':>12}{'speedup':>10}")
+    for name, legacy, vectorized in pairs:
+        for size in SIZES:
+            old_ms = time_call(legacy, size, size)
+            new_ms = time_call(vectorized, size, size)
+            print(f"{name:<8}{size:>6}{old_ms:>15.2f}{new_ms:>12.2f}{old_ms / new_ms:>9.1f}x")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
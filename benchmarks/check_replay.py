@@ -0,0 +1,106 @@
+"""
+Record a multi-round launcher session, replay it, and check both end the same.
+
+The recording runs the game the way the launcher does - GameSession, several
+rounds in one process, scripted pose backend, dummy video and audio drivers -
+with Esc pressed after FRAMES_PER_ROUND frames of each round. Between rounds
+it draws from the global random the way the menu's particles do, which a
+replay doesn't. The replay then runs the recording in a fresh interpreter.
+Both print the simulation steps, score, deaths, Mario's position and the
+current level's platforms, and the check fails (exit status 1) if they differ.
+
+Usage: python benchmarks/check_replay.py [rounds]
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROUNDS = 3
+FRAMES_PER_ROUND = 150
+
+# End state of the game module, put in front of both scripts below
+STATE = """
+def state(game):
+    return {'sim_steps': game.sim_steps, 'score': game.score, 'deaths': game.deaths,
+            'mario': [game.mario_x, round(game.mario_y, 3)], 'scroll_offset': game.scroll_offset,
+            'platforms': [list(p['rect']) for p in game.platforms]}
+"""
+
+RECORD_SCRIPT = """
+import json, random, sys
+sys.path.insert(0, {repo!r})
+import pygame
+from game_session import GameSession
+real_get = pygame.event.get
+frames = [0]
+def get(*args, **kwargs):
+    events = real_get(*args, **kwargs)
+    frames[0] += 1
+    if frames[0] % {frames!r} == 0:
+        events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE, mod=0, unicode='', scancode=0))
+    return events
+pygame.event.get = get
+session = GameSession()
+for _ in range({rounds!r}):
+    session.play()
+    for _ in range(5000):
+        random.random()  # The menu's particles, between rounds
+print('STATE', json.dumps(state(session.game)), flush=True)
+session.close()
+"""
+
+REPLAY_SCRIPT = """
+import json, sys
+sys.path.insert(0, {repo!r})
+from game_session import load_game_module
+game = load_game_module()
+game.start()
+game.run()
+print('STATE', json.dumps(state(game)), flush=True)
+game.shutdown()
+"""
+
+
+def run_child(script, **env):
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy', PYGAME_HIDE_SUPPORT_PROMPT='1',
+               MARIO_POSE_BACKEND='scripted', **env)
+    env.pop('MARIO_HEADLESS_MINUTES', None)
+    result = subprocess.run([sys.executable, "-c", STATE + script], cwd=REPO, env=env,
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        sys.exit(f"child failed:\n{result.stderr}")
+    for line in result.stdout.splitlines():
+        if line.startswith("STATE "):
+            return json.loads(line[len("STATE "):])
+    sys.exit(f"child printed no state:\n{result.stdout}")
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else ROUNDS
+    with tempfile.TemporaryDirectory(prefix="replay-check-") as directory:
+        path = os.path.join(directory, "session.rec")
+        recorded = run_child(RECORD_SCRIPT.format(repo=REPO, frames=FRAMES_PER_ROUND, rounds=rounds),
+                             MARIO_RECORD=path, MARIO_SEED='7')
+        replayed = run_child(REPLAY_SCRIPT.format(repo=REPO), MARIO_REPLAY=path)
+
+    print(f"{rounds} rounds of {FRAMES_PER_ROUND} frames")
+    failures = []
+    for key in recorded:
+        if key == 'platforms':
+            print(f"  {'platforms':<14}{len(recorded[key])} recorded, {len(replayed[key])} replayed")
+        else:
+            print(f"  {key:<14}recorded {recorded[key]}, replayed {replayed[key]}")
+        if recorded[key] != replayed[key]:
+            failures.append(key)
+    for key in failures:
+        print(f"FAIL: {key} differs after replay")
+    if not failures:
+        print("Replay matches the recording")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
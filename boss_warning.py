@@ -0,0 +1,59 @@
+import pygame
+
+WARNING_TEXT = "3RD YEAR BOSS INCOMING"
+WARNING_OVERLAY_COLOR = (200, 0, 0)
+
+# Text layers back to front: offset from the centre, color
+TEXT_LAYERS = [
+    ((4, 4), (150, 0, 0)),      # Red shadow
+    ((2, 2), (50, 0, 0)),       # Dark outline
+    ((0, 0), (255, 50, 50)),    # Main bright red text
+]
+HIGHLIGHT_LAYER = ((-1, -1), (255, 255, 255))  # White highlight, only at peak intensity
+LAYER_MARGIN = 1  # Room for the highlight's -1 offset
+
+
+class BossWarningFrames:
+    """Pre-baked pieces of the boss warning effect.
+
+    The layered warning text is composited into one surface per quantized
+    font size the first time that size is needed, so the pulsing animation
+    is a single blit per frame. The red tint is one screen-sized surface
+    whose alpha is changed instead of reallocating it every frame.
+    """
+
+    def __init__(self, fonts, screen_size, size_step=4):
+        self.fonts = fonts
+        self.size_step = size_step
+        self._text_frames = {}
+        self._overlay = pygame.Surface(screen_size)
+        if pygame.display.get_surface() is not None:
+            self._overlay = self._overlay.convert()
+        self._overlay.fill(WARNING_OVERLAY_COLOR)
+
+    def overlay(self, alpha):
+        """The red tint surface at the given alpha (0-255)"""
+        self._overlay.set_alpha(alpha)
+        return self._overlay
+
+    def text(self, font_size, highlight):
+        """(surface, offset) for the warning text near font_size - blit at centre + offset"""
+        size = max(self.size_step, round(font_size / self.size_step) * self.size_step)
+        key = (size, highlight)
+        frame = self._text_frames.get(key)
+        if frame is None:
+            frame = self._text_frames[key] = self._bake(size, highlight)
+        return frame
+
+    def _bake(self, size, highlight):
+        font = self.fonts.get('arial', size, bold=True)
+        layers = TEXT_LAYERS + [HIGHLIGHT_LAYER] if highlight else TEXT_LAYERS
+        width, height = font.size(WARNING_TEXT)
+        # Every layer is the same text in the same font, so they only differ by their offset
+        surface = pygame.Surface((width + 4 + 2 * LAYER_MARGIN, height + 4 + 2 * LAYER_MARGIN), pygame.SRCALPHA)
+        for (dx, dy), color in layers:
+            surface.blit(font.render(WARNING_TEXT, True, color), (LAYER_MARGIN + dx, LAYER_MARGIN + dy))
+        return surface, (-(LAYER_MARGIN + width // 2), -(LAYER_MARGIN + height // 2))
+
+    def stats(self):
+        return {'text_frames': len(self._text_frames)}
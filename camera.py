@@ -0,0 +1,97 @@
+import os
+import time
+
+import cv2
+
+MAX_STALE_GRABS = 4  # Most queued frames skipped per read (V4L2 queues are usually 4 deep)
+MAX_TIMESTAMP_AGE = 5.0  # Seconds - older driver timestamps must be on another clock, so they're ignored
+
+
+class Camera:
+    """Low-latency frame source over cv2.VideoCapture.
+
+    source is a camera index or a video file path. Cameras are asked for a
+    one-frame driver queue, MJPG at an explicit resolution and frame rate.
+    When the driver keeps a deeper queue anyway, read() skips frames whose
+    driver timestamp shows a newer one has already arrived, with grab() -
+    grabs are cheap, no decode - and decodes only the newest one with
+    retrieve(), so gestures always act on the freshest frame. It never
+    waits for the sensor to skip a frame. Video
+    files play back at their own frame rate, like a camera would deliver
+    them, for testing without a webcam.
+    """
+
+    def __init__(self, source=0, width=640, height=480, fps=30, fourcc='MJPG', buffer_size=1, loop=False):
+        self.source = source
+        self.is_file = isinstance(source, str) and os.path.exists(source)
+        self.loop = loop
+        self.frames = 0
+        self.dropped = 0  # Stale queued frames skipped without decoding
+        self.cap = cv2.VideoCapture(source)
+        if not self.is_file:
+            # Drivers ignore what they don't support, so set everything and read back what stuck
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, buffer_size)
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+            self.cap.set(cv2.CAP_PROP_FPS, fps)
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or fps
+        # 1 when the driver honoured the one-frame queue, its real depth or 0 (unknown) otherwise
+        self.queue_depth = 1 if self.is_file else int(self.cap.get(cv2.CAP_PROP_BUFFERSIZE) or 0)
+        self._next_frame_at = None
+
+    def settings(self):
+        """What the capture actually runs at, e.g. '640x480 @ 30 fps MJPG'"""
+        width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        code = int(self.cap.get(cv2.CAP_PROP_FOURCC))
+        fourcc = "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4)) if code else "?"
+        return f"{width}x{height} @ {self.fps:.0f} fps {fourcc}"
+
+    def read(self):
+        """Grab the newest frame and decode it, returns (BGR frame, captured_at) or (None, None)"""
+        if self.is_file:
+            return self._read_file()
+
+        if not self.cap.grab():
+            return None, None
+        skipped = 0
+        while self.queue_depth != 1 and skipped < MAX_STALE_GRABS and self._frame_age() > 1.0 / self.fps:
+            # The sensor has delivered another frame since this one, so it's already queued and grab() won't wait
+            if not self.cap.grab():
+                return None, None
+            self.dropped += 1
+            skipped += 1
+        captured_at = time.perf_counter()
+        ret, frame = self.cap.retrieve()
+        if not ret:
+            return None, None
+        self.frames += 1
+        return frame, captured_at
+
+    def _frame_age(self):
+        """Seconds since the driver timestamped the grabbed frame, 0 when it gives no usable timestamp"""
+        timestamp_ms = self.cap.get(cv2.CAP_PROP_POS_MSEC)
+        if not timestamp_ms:
+            return 0.0
+        age = time.monotonic() - timestamp_ms / 1000  # V4L2 stamps buffers on the monotonic clock
+        return age if 0 <= age < MAX_TIMESTAMP_AGE else 0.0
+
+    def _read_file(self):
+        # Pace playback to the file's frame rate
+        now = time.perf_counter()
+        if self._next_frame_at is not None and now < self._next_frame_at:
+            time.sleep(self._next_frame_at - now)
+        self._next_frame_at = max(now, self._next_frame_at or now) + 1.0 / self.fps
+
+        ret, frame = self.cap.read()
+        if not ret and self.loop:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self.cap.read()
+        if not ret:
+            return None, None
+        self.frames += 1
+        return frame, time.perf_counter()
+
+    def release(self):
+        self.cap.release()
@@ -0,0 +1,37 @@
+import cv2
+import numpy as np
+import pygame
+
+from pose_input import draw_pose_landmarks
+
+
+class CameraPreview:
+    """Camera thumbnail for the HUD, built without any full-frame passes.
+
+    The camera frame is shrunk with cv2.resize straight into a preallocated
+    BGR buffer, the skeleton is drawn at thumbnail scale, and cvtColor writes
+    RGB into a second buffer that a pygame surface wraps with
+    pygame.image.frombuffer. The surface shares that memory, so updating the
+    buffer updates the surface - nothing is allocated per frame and no
+    transpose/rotate/flip is needed. A frame is only processed once, however
+    many times it is drawn.
+    """
+
+    def __init__(self, size=(200, 150)):
+        self.size = size
+        width, height = size
+        self._bgr = np.empty((height, width, 3), dtype=np.uint8)
+        self._rgb = np.empty((height, width, 3), dtype=np.uint8)
+        self.surface = pygame.image.frombuffer(self._rgb, size, 'RGB')
+        self._frame_id = None
+
+    def update(self, frame, landmarks, frame_id=None):
+        """Refresh the thumbnail from a BGR camera frame, returns the preview surface"""
+        if frame_id is not None and frame_id == self._frame_id:
+            return self.surface
+        self._frame_id = frame_id
+        # Bilinear: far cheaper than INTER_AREA and still smoother than the old nearest-neighbour scale
+        cv2.resize(frame, self.size, dst=self._bgr, interpolation=cv2.INTER_LINEAR)
+        draw_pose_landmarks(self._bgr, landmarks, line_thickness=1, point_radius=1)
+        cv2.cvtColor(self._bgr, cv2.COLOR_BGR2RGB, dst=self._rgb)
+        return self.surface
@@ -0,0 +1,124 @@
+"""
+In-process game host for the launcher.
+
+18.py keeps its game state in module globals and still runs on its own
+(`python 18.py` plays one session). GameSession imports it once and plays it
+round after round in the launcher's process, so the interpreter, cv2 and
+MediaPipe, the pose pipeline, textures, sounds, the display and the mixer are
+only set up for the first PLAY. warm_up() gets the camera and pose model going
+in the background while the menu is still up. Every round reports how long it
+took from PLAY to the first playable frame.
+"""
+import importlib.util
+import os
+import threading
+import time
+
+from pose_warmup import PoseWarmup
+
+GAME_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "18.py")
+
+
+def load_game_module():
+    """Import 18.py - not a valid module name, so by path - as 'mario_game'"""
+    spec = importlib.util.spec_from_file_location("mario_game", GAME_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class GameSession:
+    """The game, loaded once and played any number of rounds"""
+
+    def __init__(self):
+        self.game = None
+        self.rounds = 0
+        self.first_frame_ms = []  # (cold start, ms from PLAY to the first playable frame) per round
+        self.warmup = None
+        self._load_lock = threading.Lock()  # The warmup thread and PLAY may both want the game module
+
+    @property
+    def display(self):
+        """The game's display surface, once started - the menu draws on it between rounds"""
+        return self.game.screen if self.game is not None and self.game.started else None
+
+    def _load(self):
+        with self._load_lock:
+            if self.game is None:
+                self.game = load_game_module()
+        return self.game
+
+    def warm_up(self):
+        """Start opening the camera and building the pose model on a background thread"""
+        if self.warmup is None and not (self.game is not None and self.game.started):
+            self.warmup = PoseWarmup(lambda: self._load().create_game_pose_input()).start()
+        return self.warmup
+
+    def warmup_ready(self):
+        return self.warmup is None or self.warmup.ready()
+
+    def start(self, display=None):
+        """Import and set up the game; does nothing once it has been started.
+
+        Takes the pose backend from warm_up() when there is one. If warmup failed or is
+        still running, the game doesn't wait for it and plays on the keyboard - a backend
+        that finishes warming up later is switched to on the next reset().
+        """
+        game = self._load()
+        if game.started:
+            return
+        warm_pose_input = None
+        if self.warmup is not None:
+            warm_pose_input = self.warmup.take()
+            print(self.warmup.report())
+            if warm_pose_input is None:
+                warm_pose_input = game.keyboard_only_input()
+        game.start(display, warm_pose_input)
+
+    def reset(self):
+        """Fresh level and score, music from the top"""
+        late_pose_input = None
+        if self.warmup is not None and self.warmup.ready():
+            late_pose_input = self.warmup.take()
+            if late_pose_input is not None:
+                print(f"{self.warmup.report()} - switching to camera controls")
+        self.game.reset(late_pose_input)
+        self.game.start_music()
+
+    def run(self, play_requested_at=None):
+        """Play one round until Esc, returns why it ended (see run() in 18.py)"""
+        return self.game.run(play_requested_at)
+
+    def play(self, play_requested_at=None):
+        """Start (first time) or reset (later rounds), then run a round"""
+        if play_requested_at is None:
+            play_requested_at = time.perf_counter()
+        cold = self.game is None or not self.game.started
+        self.start()
+        if self.rounds:
+            self.reset()
+        self.rounds += 1
+        reason = self.run(play_requested_at)
+        if self.game.pose_input.scheduler is not None:
+            self.game.pose_input.scheduler.idle = True  # Back in the menu
+        if self.game.time_to_first_frame is not None:
+            self.first_frame_ms.append((cold, self.game.time_to_first_frame))
+        return reason
+
+    def report(self):
+        cold = [ms for is_cold, ms in self.first_frame_ms if is_cold]
+        warm = [ms for is_cold, ms in self.first_frame_ms if not is_cold]
+        parts = []
+        if cold:
+            parts.append(f"first round {cold[0]:.0f} ms")
+        if warm:
+            parts.append(f"later rounds mean {sum(warm) / len(warm):.0f} ms, worst {max(warm):.0f} ms")
+        return "Time from PLAY to first playable frame: " + (", ".join(parts) if parts else "no rounds played")
+
+    def close(self):
+        """Print the game's reports and release the pose pipeline"""
+        if self.warmup is not None:
+            self.warmup.close()  # A backend that warmed up but was never taken
+        if self.game is not None and self.game.started:
+            self.game.shutdown()
+        print(self.report())
@@ -0,0 +1,92 @@
+import numpy as np
+
+# MediaPipe pose landmark indices used by the gesture controls
+LEFT_SHOULDER = 11
+RIGHT_SHOULDER = 12
+LEFT_ELBOW = 13
+RIGHT_ELBOW = 14
+LEFT_WRIST = 15
+RIGHT_WRIST = 16
+
+NUM_LANDMARKS = 33
+
+# Same skeleton as mp.solutions.pose.POSE_CONNECTIONS
+POSE_CONNECTIONS = frozenset([
+    (0, 1), (1, 2), (2, 3), (3, 7), (0, 4), (4, 5), (5, 6), (6, 8), (9, 10),
+    (11, 12), (11, 13), (13, 15), (15, 17), (15, 19), (15, 21), (17, 19),
+    (12, 14), (14, 16), (16, 18), (16, 20), (16, 22), (18, 20), (11, 23),
+    (12, 24), (23, 24), (23, 25), (24, 26), (25, 27), (26, 28), (27, 29),
+    (28, 30), (29, 31), (30, 32), (27, 31), (28, 32),
+])
+
+
+def landmarks_to_array(pose_landmarks):
+    """Convert MediaPipe pose landmarks into a (33, 4) array of x, y, z, visibility"""
+    if pose_landmarks is None:
+        return None
+    return np.array([(lm.x, lm.y, lm.z, lm.visibility) for lm in pose_landmarks.landmark],
+                    dtype=np.float32)
+
+
+def classify_gestures(landmarks):
+    """Turn a landmark array into (move_right, move_left, jump, shoot) flags.
+
+    jump only means "both arms raised" - the caller still has to check that
+    Mario is on the ground.
+    """
+    move_right, move_left, jump, shoot = False, False, False, False
+    if landmarks is None:
+        return move_right, move_left, jump, shoot
+
+    left_wrist = landmarks[LEFT_WRIST]
+    right_wrist = landmarks[RIGHT_WRIST]
+    left_shoulder = landmarks[LEFT_SHOULDER]
+    right_shoulder = landmarks[RIGHT_SHOULDER]
+    right_elbow = landmarks[RIGHT_ELBOW]
+
+    # Columns are x, y, z, visibility
+    if right_wrist[0] > right_shoulder[0]:
+        move_right = True
+    elif left_wrist[0] < left_shoulder[0]:
+        move_left = True
+
+    if left_wrist[1] < left_shoulder[1] and right_wrist[1] < right_shoulder[1]:
+        jump = True
+
+    # Shooting gesture: Point forward with right hand (wrist forward of elbow, elbow forward of shoulder)
+    if (right_wrist[2] < right_elbow[2] and right_elbow[2] < right_shoulder[2] and
+            abs(right_wrist[1] - right_shoulder[1]) < 0.15):  # Hand pointing forward at shoulder height
+        shoot = True
+
+    return move_right, move_left, jump, shoot
+
+
+def synthetic_landmarks(move_right=False, move_left=False, jump=False, shoot=False):
+    """Build a landmark array that classify_gestures reads back as the given flags.
+
+    Only the arm landmarks are placed (visible); everything else is left at
+    zero with zero visibility.
+    """
+    landmarks = np.zeros((NUM_LANDMARKS, 4), dtype=np.float32)
+    # Shoulders at chest height, arms hanging down by default
+    landmarks[LEFT_SHOULDER] = (0.6, 0.4, 0.0, 1.0)
+    landmarks[RIGHT_SHOULDER] = (0.4, 0.4, 0.0, 1.0)
+    landmarks[LEFT_ELBOW] = (0.62, 0.55, 0.0, 1.0)
+    landmarks[RIGHT_ELBOW] = (0.38, 0.55, 0.0, 1.0)
+    landmarks[LEFT_WRIST] = (0.62, 0.7, 0.0, 1.0)
+    landmarks[RIGHT_WRIST] = (0.38, 0.7, 0.0, 1.0)
+
+    if move_right:
+        landmarks[RIGHT_WRIST, 0] = 0.55
+    elif move_left:
+        landmarks[LEFT_WRIST, 0] = 0.45
+    if jump:
+        landmarks[LEFT_WRIST, 1] = 0.3
+        landmarks[RIGHT_WRIST, 1] = 0.3
+    if shoot:
+        # Right arm pointed at the camera, the wrist within shoulder height (raised wrist still counts)
+        landmarks[RIGHT_ELBOW, 1:3] = (0.4, -0.15)
+        landmarks[RIGHT_WRIST, 2] = -0.3
+        if not jump:
+            landmarks[RIGHT_WRIST, 1] = 0.4
+    return landmarks
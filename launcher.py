@@ -1,43 +1,47 @@
 import pygame
-import sys
-import subprocess
+import time
 import os
 
+WARMUP_WAIT_SECONDS = 15  # Longest PLAY waits for the camera before going keyboard-only
+
 def run_mario_game():
     """
     Main launcher for Super Mario Bros - Gesture Control Edition
-    This script launches the menu system and handles game transitions
+    This script launches the menu system and handles game transitions.
+    The game runs in this same process: it is loaded on the first PLAY and
+    reused for every round after that, on the same display. The camera and
+    pose model warm up in the background once the first menu is showing.
     """
     
     # Set the working directory to the script's location
     script_dir = os.path.dirname(os.path.abspath(__file__))
     os.chdir(script_dir)
     
+    session = None
     while True:
         try:
             # Import and run the menu system
             from menu import MarioMenu
+            from game_session import GameSession
+            
+            if session is None:
+                session = GameSession()
             
-            # Create and run menu
-            menu = MarioMenu()
-            result = menu.run()
+            # Create and run menu (on the game's display once a round has been played).
+            # The camera and pose model start warming up once the menu is on screen
+            menu = MarioMenu(session.display)
+            result = menu.run(on_first_frame=session.warm_up)
             
             # Handle menu result
             if result == "START_GAME":
-                # Clean up menu resources
-                pygame.quit()
-                
-                # Start the main game (18.py)
-                try:
-                    subprocess.run([sys.executable, "18.py"], check=True)
-                except subprocess.CalledProcessError as e:
-                    print(f"Game exited with error code: {e.returncode}")
-                except FileNotFoundError:
-                    print("Error: 18.py not found!")
-                    break
-                
-                # After game ends, reinitialize pygame for menu
-                pygame.init()
+                play_requested_at = time.perf_counter()
+                if not session.warmup_ready():
+                    # Give the camera a little longer, then play on the keyboard without it
+                    if not menu.show_loading(session.warmup_ready, "Starting camera...", WARMUP_WAIT_SECONDS):
+                        break
+                reason = session.play(play_requested_at)
+                if reason == 'pose failed':
+                    print("Camera / pose input stopped, back to the menu")
                 
             else:
                 # User chose to quit
@@ -52,6 +56,8 @@ def run_mario_game():
             break
     
     # Final cleanup
+    if session is not None:
+        session.close()
     try:
         pygame.quit()
     except:
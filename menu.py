@@ -2,8 +2,11 @@ import pygame
 import sys
 import math
 import random
+import time
 from enum import Enum
 
+from assets import GAME_ASSETS, MENU_ASSETS, shared_assets
+
 class MenuState(Enum):
     MAIN_MENU = 1
     SETTINGS = 2
@@ -11,9 +14,15 @@ class MenuState(Enum):
     GAME = 4
 
 class MarioMenu:
-    def __init__(self):
+    def __init__(self, display=None):
         pygame.init()
-        self.screen = pygame.display.set_mode((800, 600))
+        # The menu is drawn at 800x600. Coming back from a round it is centred on the
+        # game's (fullscreen) display instead of switching the display mode back.
+        self.display = display if display is not None else pygame.display.set_mode((800, 600))
+        if self.display.get_size() == (800, 600):
+            self.screen = self.display
+        else:
+            self.screen = pygame.Surface((800, 600)).convert()
         pygame.display.set_caption("Super Mario Bros - Gesture Control")
         self.clock = pygame.time.Clock()
         
@@ -51,22 +60,22 @@ class MarioMenu:
         self.sfx_enabled = True
         self.difficulty = "NORMAL"  # EASY, NORMAL, HARD
         
-        # Load images (with fallbacks)
+        # Load images (with fallbacks). The menu's own images are queued first; the game's
+        # keep decoding in the background while the menu is up
+        assets = shared_assets().preload(MENU_ASSETS).preload(GAME_ASSETS)
         try:
-            self.mario_img = pygame.image.load('mario.png')
-            self.mario_img = pygame.transform.scale(self.mario_img, (80, 80))
+            self.mario_img = assets.scaled('mario', (80, 80))
         except:
             self.mario_img = None
             
         try:
-            self.background_img = pygame.image.load('im1.png')
-            self.background_img = pygame.transform.scale(self.background_img, (800, 600))
+            self.background_img = assets.scaled('menu_background', (800, 600))
         except:
             self.background_img = None
             
         # Load and play menu music
         try:
-            pygame.mixer.music.load('background_music.mp3')
+            pygame.mixer.music.load(assets.path('music'))
             if self.music_enabled:
                 pygame.mixer.music.play(-1, 0.0, 1000)  # Fade in over 1 second
         except:
@@ -519,8 +528,42 @@ class MarioMenu:
             
         return True
     
-    def run(self):
-        """Main menu loop"""
+    def show_loading(self, is_ready, message, timeout):
+        """Keep the menu animating with a message until is_ready() or timeout seconds pass.
+
+        Returns False if the window was closed meanwhile.
+        """
+        deadline = time.perf_counter() + timeout
+        while not is_ready() and time.perf_counter() < deadline:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return False
+            
+            self.update_particles()
+            self.draw_background()
+            self.draw_particles()
+            self.draw_title()
+            
+            # Message panel where the menu options usually are
+            text = self.small_font.render(message, True, self.WHITE)
+            panel = text.get_rect(center=(400, 350)).inflate(40, 24)
+            pygame.draw.rect(self.screen, self.BLACK, panel)
+            pygame.draw.rect(self.screen, self.YELLOW, panel, 3)
+            self.screen.blit(text, text.get_rect(center=panel.center))
+            
+            if self.screen is not self.display:
+                self.display.fill(self.BLACK)
+                self.display.blit(self.screen, self.screen.get_rect(center=self.display.get_rect().center))
+            pygame.display.flip()
+            self.clock.tick(60)
+        return True
+    
+    def run(self, on_first_frame=None):
+        """Main menu loop
+
+        on_first_frame is called once the first frame is on screen - the launcher starts
+        loading the game (cv2, MediaPipe, camera) from there, so none of it delays the menu.
+        """
         running = True
         
         while running:
@@ -548,21 +591,28 @@ class MarioMenu:
             elif self.current_state == MenuState.CREDITS:
                 self.draw_credits()
             
+            if self.screen is not self.display:
+                self.display.fill(self.BLACK)
+                self.display.blit(self.screen, self.screen.get_rect(center=self.display.get_rect().center))
             pygame.display.flip()
+            if on_first_frame is not None:
+                on_first_frame()
+                on_first_frame = None
             self.clock.tick(60)
         
         return False
 
 def main():
     """Main function to run the menu system"""
+    from game_session import GameSession
+    session = GameSession()
     menu = MarioMenu()
-    result = menu.run()
+    result = menu.run(on_first_frame=session.warm_up)
     
     if result == "START_GAME":
-        # Import and run the main game
-        pygame.quit()
-        import subprocess
-        subprocess.run([sys.executable, "18.py"])
+        # Run the main game in this process
+        session.play()
+        session.close()
     
     pygame.quit()
     sys.exit()
@@ -0,0 +1,109 @@
+import numpy as np
+
+OBSTACLE_SIZE = 45  # 1.5x the original obstacle size
+
+
+class ObstacleStore:
+    """Patrolling ground obstacles kept as parallel NumPy arrays (structure of arrays).
+
+    Slot i of every array describes obstacle i; only the first `count` slots
+    are live. Patrol movement and the Mario collision test run over all
+    obstacles in a few array operations, so their cost stays flat as the
+    number of obstacles grows.
+    """
+
+    def __init__(self, capacity=64, size=OBSTACLE_SIZE):
+        self.size = size
+        self.count = 0
+        self.x = np.zeros(capacity)
+        self.prev_x = np.zeros(capacity)  # x before the last update, for interpolated drawing
+        self.y = np.zeros(capacity)
+        self.speed = np.zeros(capacity)
+        self.direction = np.zeros(capacity)  # -1 left, 1 right
+        self.range_start = np.zeros(capacity)
+        self.range_end = np.zeros(capacity)
+        self.chunk = np.zeros(capacity, dtype=np.int64)  # World chunk that spawned it
+
+    def __len__(self):
+        return self.count
+
+    def _arrays(self):
+        return ['x', 'prev_x', 'y', 'speed', 'direction', 'range_start', 'range_end', 'chunk']
+
+    def _grow(self):
+        for name in self._arrays():
+            old = getattr(self, name)
+            new = np.zeros(len(old) * 2, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def add(self, x, y, speed, direction, range_start, range_end, chunk=0):
+        if self.count == len(self.x):
+            self._grow()
+        i = self.count
+        self.x[i] = x
+        self.prev_x[i] = x
+        self.y[i] = y
+        self.speed[i] = speed
+        self.direction[i] = direction
+        self.range_start[i] = range_start
+        self.range_end[i] = range_end
+        self.chunk[i] = chunk
+        self.count += 1
+
+    def clear(self):
+        self.count = 0
+
+    def retire_chunks_before(self, first_chunk):
+        """Drop obstacles spawned by chunks older than first_chunk, keeping the rest in order"""
+        n = self.count
+        keep = self.chunk[:n] >= first_chunk
+        kept = int(keep.sum())
+        if kept == n:
+            return
+        for name in self._arrays():
+            array = getattr(self, name)
+            array[:kept] = array[:n][keep]
+        self.count = kept
+
+    def update(self):
+        """Move every obstacle along its patrol range, bouncing at the ends"""
+        n = self.count
+        x = self.x[:n]
+        direction = self.direction[:n]
+        start = self.range_start[:n]
+        end = self.range_end[:n]
+        self.prev_x[:n] = x
+
+        new_x = x + self.speed[:n] * direction
+        hit_start = new_x <= start
+        hit_end = ~hit_start & (new_x >= end)
+        direction[hit_start] = 1
+        direction[hit_end] = -1
+        new_x = np.where(hit_start, start, np.where(hit_end, end, new_x))
+        # Positions stay whole pixels, rounded like a pygame.Rect would round them
+        np.floor(new_x + 0.5, out=x)
+
+    def collides(self, left, top, right, bottom):
+        """True if any obstacle overlaps the world-space box (same test as Rect.colliderect)"""
+        n = self.count
+        x = self.x[:n]
+        y = self.y[:n]
+        overlap = (x < right) & (x + self.size > left) & (y < bottom) & (y + self.size > top)
+        return bool(overlap.any())
+
+    def positions(self, left=None, right=None, alpha=1.0):
+        """Iterate (x, y) integer world positions for drawing, optionally only those inside [left, right)
+
+        alpha blends from the position before the last update (0.0) to the current one (1.0).
+        """
+        n = self.count
+        x = self.x[:n]
+        if alpha != 1.0:
+            x = self.prev_x[:n] + (x - self.prev_x[:n]) * alpha
+        if left is None:
+            indices = range(n)
+        else:
+            indices = np.flatnonzero((x + self.size > left) & (x < right))
+        for i in indices:
+            yield round(x[i]), int(self.y[i])
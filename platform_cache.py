@@ -0,0 +1,101 @@
+from collections import OrderedDict
+
+import pygame
+
+# Border and top-edge highlight colours per platform texture, Jump King style
+PLATFORM_BORDER_COLORS = [
+    (60, 60, 100),   # Blue border
+    (80, 60, 100),   # Purple border
+    (60, 80, 70),    # Green border
+    (100, 70, 60),   # Brown border
+]
+PLATFORM_HIGHLIGHT_COLORS = [
+    (140, 140, 180),  # Blue highlight
+    (160, 140, 180),  # Purple highlight
+    (140, 160, 150),  # Green highlight
+    (180, 150, 140),  # Brown highlight
+]
+
+
+def draw_textured_rect(surface, texture, rect, offset_x=0):
+    """Draw a rectangle with tiled texture, with optional horizontal offset for scrolling"""
+    if texture:
+        texture_width = texture.get_width()
+        texture_height = texture.get_height()
+
+        # Fix the offset calculation to handle negative values properly
+        # This ensures seamless tiling when scrolling in both directions
+        offset_mod = offset_x % texture_width
+        start_x = rect.x - texture_width + offset_mod
+
+        # Tile the texture across the rectangle with extra coverage
+        for x in range(start_x, rect.x + rect.width + texture_width, texture_width):
+            for y in range(rect.y, rect.y + rect.height, texture_height):
+                # Calculate how much of the texture to draw
+                draw_x = max(rect.x, x)
+                draw_y = max(rect.y, y)
+
+                # Only draw if the tile overlaps with the target rectangle
+                if draw_x < rect.x + rect.width and draw_y < rect.y + rect.height:
+                    clip_width = min(texture_width - (draw_x - x), rect.x + rect.width - draw_x)
+                    clip_height = min(texture_height - (draw_y - y), rect.y + rect.height - draw_y)
+
+                    if clip_width > 0 and clip_height > 0:
+                        # Calculate texture clip area
+                        tex_clip_x = max(0, draw_x - x)
+                        tex_clip_y = max(0, draw_y - y)
+                        texture_clip = pygame.Rect(tex_clip_x, tex_clip_y, clip_width, clip_height)
+                        surface.blit(texture, (draw_x, draw_y), texture_clip)
+
+
+class PlatformSurfaceCache:
+    """LRU cache of fully drawn platform surfaces keyed by (width, height, texture_id).
+
+    Platforms only come in a handful of sizes, so each combination is tiled,
+    bordered and highlighted once and afterwards drawn with a single blit.
+    """
+
+    def __init__(self, textures, max_entries=128):
+        self.textures = textures
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, width, height, texture_id):
+        """Return the pre-rendered surface for a platform, drawing it on first use"""
+        key = (width, height, texture_id)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self._render(width, height, texture_id)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def _render(self, width, height, texture_id):
+        surface = pygame.Surface((width, height))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        rect = surface.get_rect()
+
+        # Use the appropriate texture
+        texture = self.textures[texture_id] if texture_id < len(self.textures) else self.textures[0]
+        draw_textured_rect(surface, texture, rect)
+
+        border_color = PLATFORM_BORDER_COLORS[texture_id] if texture_id < len(PLATFORM_BORDER_COLORS) else PLATFORM_BORDER_COLORS[0]
+        highlight_color = PLATFORM_HIGHLIGHT_COLORS[texture_id] if texture_id < len(PLATFORM_HIGHLIGHT_COLORS) else PLATFORM_HIGHLIGHT_COLORS[0]
+        pygame.draw.rect(surface, border_color, rect, 2)
+        # Add highlight on top edge (clipped to the platform itself)
+        pygame.draw.line(surface, highlight_color, (rect.left, rect.top), (rect.right, rect.top), 2)
+        return surface
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'size': len(self._surfaces)}
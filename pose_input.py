@@ -0,0 +1,580 @@
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+
+import cv2
+import numpy as np
+
+from camera import Camera
+from gestures import NUM_LANDMARKS, POSE_CONNECTIONS, landmarks_to_array, synthetic_landmarks
+from pose_tuner import CALIBRATION_FRAMES, scale_to_width
+from pose_worker import LANDMARK_BYTES, REPLY, REQUEST, FrameRing, read_exact
+from recording import read_frames, read_header
+
+
+class LatencyStats:
+    """Rolling window of latencies in milliseconds (capture-to-landmarks unless labelled otherwise)"""
+
+    def __init__(self, window=600):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+
+    def add(self, latency_ms):
+        self.samples.append(latency_ms)
+        self.count += 1
+
+    def summary(self, label="latency"):
+        if not self.samples:
+            return "no frames"
+        ordered = sorted(self.samples)
+        p50 = ordered[len(ordered) // 2]
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        mean = sum(ordered) / len(ordered)
+        return f"{self.count} frames, {label} mean {mean:.1f} ms, p50 {p50:.1f} ms, p95 {p95:.1f} ms"
+
+
+class PoseInput:
+    """Common snapshot publishing for the pose backends.
+
+    Every camera backend owns a Camera (webcam or video file) and a MediaPipe
+    pose graph and hands the game loop snapshot dicts through latest():
+        'frame'       - mirrored BGR camera frame (None from the scripted backend)
+        'landmarks'   - (33, 4) float32 array of x, y, z, visibility, or None
+        'captured_at' - time.perf_counter() when the frame was read
+        'landmarks_at' - captured_at of the frame the landmarks came from (older when they were reused)
+        'frame_id'    - increasing frame counter
+    """
+
+    name = "base"
+
+    def __init__(self, camera_index=0, camera_settings=None):
+        self.camera_index = camera_index  # Camera index or video file path
+        self.camera_settings = camera_settings or {}  # Camera() keyword arguments: width, height, fps, ...
+        self.cap = None
+        self.pose = None
+        self.failed = False  # Set when the camera (or worker) stops delivering frames
+        self.latency = LatencyStats()
+        self.capture_age = LatencyStats()  # How old the frame was when the game acted on it
+        self.profiler = None  # Optional FrameProfiler that gets the camera and pose stage timings
+        self.roi = None  # Optional PoseROITracker - set before start() to run pose on a crop around the player
+        self.scheduler = None  # Optional InferenceScheduler - set before start() to skip inference on still frames
+        self.tuner = None  # Optional PoseTuner - set before start() to pick the model and input size for this machine
+        self.action_latency = LatencyStats()  # Landmark age when a gesture change reached the game
+        self._cpu_start = (time.perf_counter(), time.process_time())
+        self._latest = None
+        self._lock = threading.Lock()
+        self._frame_id = 0
+
+    def _publish(self, frame, landmarks, captured_at, landmarks_at=None, **extra):
+        self._frame_id += 1
+        if landmarks_at is None:
+            landmarks_at = captured_at
+            self.latency.add((time.perf_counter() - captured_at) * 1000)
+        snapshot = {
+            'frame': frame,
+            'landmarks': landmarks,
+            'captured_at': captured_at,
+            'landmarks_at': landmarks_at,
+            'frame_id': self._frame_id,
+        }
+        snapshot.update(extra)
+        with self._lock:
+            self._latest = snapshot
+
+    def _should_infer(self, frame):
+        """False when the scheduler wants the previous landmarks reused for this frame"""
+        if self.scheduler is None:
+            return True
+        started = time.perf_counter_ns()
+        infer = self.scheduler.should_infer(frame)
+        self._profile('motion gate', started)
+        return infer
+
+    def _publish_reused(self, frame, captured_at):
+        """Publish a new frame with the previous frame's landmarks"""
+        previous = self._latest
+        if previous is None:
+            self._publish(frame, None, captured_at, landmarks_at=captured_at)
+        else:
+            self._publish(frame, previous['landmarks'], captured_at, landmarks_at=previous['landmarks_at'])
+
+    def _profile(self, stage, started_ns):
+        if self.profiler is not None:
+            self.profiler.add(stage, time.perf_counter_ns() - started_ns)
+
+    def _open_camera(self):
+        self.cap = Camera(self.camera_index, **self.camera_settings)
+
+    def _read_frame(self):
+        """Read and mirror the newest camera frame, returns (frame, captured_at) or (None, None)"""
+        started = time.perf_counter_ns()
+        frame, captured_at = self.cap.read()
+        if frame is None:
+            self.failed = True
+            return None, None
+        self._profile('cap.read', started)
+        return cv2.flip(frame, 1), captured_at
+
+    def _first_frame(self):
+        """Read the camera's first frame and settle the pose config on it, before the first inference.
+
+        The config is the one stored for this machine, or calibrated on live frames. Returns
+        the frame, or None (with failed set) if the camera gives none - whether or not tuning is on.
+        """
+        first, _ = self._read_frame()
+        if first is None or self.tuner is None or self.tuner.load((first.shape[1], first.shape[0])):
+            return first
+        frames = [first]
+        while len(frames) < CALIBRATION_FRAMES:
+            frame, _ = self._read_frame()
+            if frame is None:
+                return None
+            frames.append(frame)
+        self.tuner.calibrate(frames)
+        return first
+
+    def _build_pose(self):
+        """MediaPipe pose graph - the tuned model complexity, or MediaPipe's default - warmed up with one inference"""
+        import mediapipe as mp  # Imported here: it's the slowest import by far and only camera backends need it
+        if self.tuner is None or self.tuner.config is None:
+            pose = mp.solutions.pose.Pose()
+        else:
+            pose = mp.solutions.pose.Pose(model_complexity=self.tuner.config['model_complexity'])
+        # The first process() call initialises the graph and loads the model - pay for it here, not on the first frame
+        pose.process(np.zeros((64, 64, 3), dtype=np.uint8))
+        return pose
+
+    def _detect(self, frame):
+        """Run MediaPipe pose on a BGR frame, returns the landmark array or None"""
+        if self.tuner is None or self.tuner.config is None:
+            return self._run_pose(frame)
+        started = time.perf_counter()
+        landmarks = self._run_pose(scale_to_width(frame, self.tuner.config['input_width']))
+        self.pose = self.tuner.after_inference(self.pose, (time.perf_counter() - started) * 1000)
+        return landmarks
+
+    def _run_pose(self, frame):
+        if self.roi is not None:
+            return self.roi.detect(frame, self._infer)[0]
+        started = time.perf_counter_ns()
+        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        self._profile('cvtColor', started)
+        return self._infer(rgb_frame)
+
+    def _infer(self, rgb_frame):
+        started = time.perf_counter_ns()
+        result = self.pose.process(rgb_frame)
+        self._profile('pose.process', started)
+        return landmarks_to_array(result.pose_landmarks)
+
+    def latest(self):
+        """Return the newest snapshot dict, or None before the first frame arrives"""
+        with self._lock:
+            return self._latest
+
+    def note_decision(self, snapshot):
+        """Record the capture age of the snapshot the game is about to act on"""
+        if snapshot is None:
+            return
+        age_ms = (time.perf_counter() - snapshot['captured_at']) * 1000
+        self.capture_age.add(age_ms)
+        if self.profiler is not None:
+            self.profiler.add('capture age', int(age_ms * 1e6))
+
+    def note_action(self, snapshot):
+        """Record how old the landmarks were when a change of gesture reached the game"""
+        if snapshot is None:
+            return
+        self.action_latency.add((time.perf_counter() - snapshot['landmarks_at']) * 1000)
+
+    def cpu_usage(self):
+        """Game process CPU time since the backend was built, as a fraction of one core"""
+        wall = time.perf_counter() - self._cpu_start[0]
+        return (time.process_time() - self._cpu_start[1]) / wall if wall > 0 else 0.0
+
+    def latency_report(self):
+        report = f"Pose backend '{self.name}': {self.latency.summary()}"
+        if self.capture_age.samples:
+            report += f"\n  capture age at gesture decision: {self.capture_age.summary('age')}"
+        if self.action_latency.samples:
+            report += f"\n  gesture-to-action: {self.action_latency.summary()}"
+        if self.cap is not None:
+            report += f"\n  camera {self.cap.settings()}, {self.cap.frames} frames read, {self.cap.dropped} stale frames skipped"
+            if self.scheduler is not None:
+                report += f"\n  {self.scheduler.report()}"
+            if self.tuner is not None:
+                report += f"\n  {self.tuner.report()}"
+        if self.roi is not None:
+            report += f"\n  {self.roi.report()}"
+        report += f"\n  CPU: game process {self.cpu_usage():.0%} of one core"  # Last - the process backend adds its worker
+        return report
+
+
+class InlinePoseInput(PoseInput):
+    """Reads the camera and runs pose inside latest(), blocking the game loop (original behaviour)"""
+
+    name = "inline"
+
+    def start(self):
+        self._open_camera()
+        if self._first_frame() is None:
+            return
+        self.pose = self._build_pose()
+
+    def latest(self):
+        frame, captured_at = self._read_frame()
+        if frame is not None:
+            if self._should_infer(frame):
+                self._publish(frame, self._detect(frame), captured_at)
+            else:
+                self._publish_reused(frame, captured_at)
+        return self._latest
+
+    def stop(self):
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+        if self.pose is not None:
+            self.pose.close()
+            self.pose = None
+
+
+class ThreadedPoseInput(PoseInput):
+    """Webcam capture and MediaPipe pose detection on a background thread.
+
+    The thread owns the Camera and mp_pose.Pose. The game loop calls
+    latest() once per frame and always gets the newest landmark snapshot
+    straight away, so rendering is never held back by the camera or the model.
+    """
+
+    name = "thread"
+
+    def __init__(self, camera_index=0, camera_settings=None):
+        super().__init__(camera_index, camera_settings)
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        """Open the camera, build the pose graph and start the capture thread"""
+        self._open_camera()
+        if self._first_frame() is None:
+            return
+        self.pose = self._build_pose()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="pose-input", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        try:
+            while self._running:
+                frame, captured_at = self._read_frame()
+                if frame is None:
+                    break
+                if self._should_infer(frame):
+                    self._publish(frame, self._detect(frame), captured_at)
+                else:
+                    self._publish_reused(frame, captured_at)
+        except Exception as e:
+            # Don't leave the game acting on the last landmarks forever - fail like a lost camera
+            print(f"Pose thread stopped: {e!r}")
+            self.failed = True
+
+    def stop(self):
+        """Stop the capture thread and release the camera and pose graph"""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+        if self.pose is not None:
+            self.pose.close()
+            self.pose = None
+
+
+class ProcessPoseInput(PoseInput):
+    """Pose inference in a separate worker process (pose_worker.py).
+
+    A capture thread here writes frames into a shared-memory FrameRing and
+    tells the worker which slot to read. Only slot numbers and landmark
+    arrays cross the pipe, so MediaPipe never competes with the game for the
+    GIL and frames are never pickled or copied through the pipe.
+    """
+
+    name = "process"
+
+    def __init__(self, camera_index=0, camera_settings=None, slots=4, max_in_flight=1):
+        super().__init__(camera_index, camera_settings)
+        self.slots = slots
+        self.max_in_flight = max_in_flight  # Must stay below slots so busy slots are never overwritten
+        self.ring = None
+        self.worker = None
+        self._pending = {}  # slot -> mirrored frame waiting for its landmarks
+        self._pending_lock = threading.Lock()
+        self._running = False
+        self._threads = []
+        self._worker_started = None
+
+    def start(self):
+        """Open the camera, allocate the ring buffer and launch the worker process"""
+        self._open_camera()
+        frame = self._first_frame()
+        if frame is None:
+            return
+
+        self.ring = FrameRing(frame.shape, self.slots)
+        height, width = frame.shape[:2]
+        worker_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pose_worker.py")
+        command = [sys.executable, worker_script, self.ring.name, str(self.slots), str(height), str(width)]
+        if self.roi is not None:
+            command.append("roi")  # The worker tracks the ROI itself, results come back with the mode
+        if self.tuner is not None and self.tuner.config is not None:
+            # The worker runs the tuned config and steps it down itself if it drifts over budget
+            command.append("tuning=" + json.dumps(self.tuner.config))
+        self.worker = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+        )
+        self._worker_started = time.perf_counter()
+
+        self._running = True
+        self._threads = [
+            threading.Thread(target=self._capture_loop, name="pose-capture", daemon=True),
+            threading.Thread(target=self._result_loop, name="pose-results", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _capture_loop(self):
+        try:
+            self._capture_frames()
+        except Exception as e:
+            print(f"Pose capture thread stopped: {e!r}")
+            self.failed = True
+
+    def _capture_frames(self):
+        slot = 0
+        while self._running:
+            frame, captured_at = self._read_frame()
+            if frame is None:
+                break
+            with self._pending_lock:
+                busy = len(self._pending)
+            if busy >= self.max_in_flight:
+                continue  # Worker busy - drop this frame, a fresher one follows
+            if not self._should_infer(frame):
+                if not busy:
+                    self._publish_reused(frame, captured_at)
+                continue
+            with self._pending_lock:
+                self.ring.write(slot, frame)
+                self._pending[slot] = frame
+            try:
+                self.worker.stdin.write(REQUEST.pack(slot, captured_at))
+                self.worker.stdin.flush()
+            except (BrokenPipeError, OSError, ValueError):
+                self.failed = True
+                break
+            slot = (slot + 1) % self.slots
+
+    def _result_loop(self):
+        try:
+            self._read_results()
+        except Exception as e:
+            # Don't leave the game acting on the last landmarks forever - fail like a dead worker
+            print(f"Pose result thread stopped: {e!r}")
+            self.failed = True
+
+    def _read_results(self):
+        while self._running:
+            header = read_exact(self.worker.stdout, REPLY.size)
+            body = read_exact(self.worker.stdout, LANDMARK_BYTES) if header else None
+            if body is None:
+                if self._running:
+                    self.failed = True  # Worker exited under us
+                break
+            slot, captured_at, inference_ms, found, mode, complexity, input_width, step_downs = REPLY.unpack(header)
+            if self.tuner is not None and self.tuner.config is not None:
+                self.tuner.follow(complexity, input_width, step_downs)  # The worker steps its own copy down
+            if self.profiler is not None:
+                self.profiler.add('pose.process', int(inference_ms * 1e6))
+            if self.roi is not None:
+                self.roi.note(mode, inference_ms)
+            landmarks = None
+            if found:
+                landmarks = np.frombuffer(body, dtype=np.float32).reshape(NUM_LANDMARKS, 4)
+            with self._pending_lock:
+                frame = self._pending.pop(slot, None)
+            if frame is not None:
+                self._publish(frame, landmarks, captured_at)
+
+    def _worker_cpu_seconds(self):
+        """CPU time the worker has used so far (Linux only, None elsewhere)"""
+        try:
+            with open(f"/proc/{self.worker.pid}/stat") as file:
+                fields = file.read().rsplit(')', 1)[1].split()
+        except (AttributeError, OSError):
+            return None
+        # utime and stime, fields 14 and 15 of proc(5) - 12 and 13 after the command name
+        return (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')
+
+    def latency_report(self):
+        report = super().latency_report()
+        worker_cpu = self._worker_cpu_seconds()
+        if worker_cpu is not None:
+            report += f", worker {worker_cpu / (time.perf_counter() - self._worker_started):.0%}"
+        return report
+
+    def stop(self):
+        """Shut the worker down, then release the camera and shared memory"""
+        self._running = False
+        if self.worker is not None:
+            try:
+                self.worker.stdin.close()  # EOF tells the worker to exit
+            except OSError:
+                pass
+            try:
+                self.worker.wait(timeout=2.0)
+            except subprocess.TimeoutExpired:
+                self.worker.kill()
+            self.worker = None
+        for thread in self._threads:
+            thread.join(timeout=1.0)
+        self._threads = []
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
+
+
+class KeyboardPoseInput(PoseInput):
+    """No camera at all - latest() is always None and the game runs on its keyboard controls"""
+
+    name = "keyboard"
+
+    def start(self):
+        pass
+
+    def latest(self):
+        return None
+
+    def stop(self):
+        pass
+
+
+class ScriptedPoseInput(PoseInput):
+    """Synthetic player for headless runs - no camera, no MediaPipe.
+
+    Each latest() call is one frame: the player keeps running right, jumps
+    and fires at random, and the choice is turned into landmarks with
+    synthetic_landmarks() so the normal gesture code reads it. The same seed
+    always plays the same way. Snapshots carry no camera frame.
+    """
+
+    name = "scripted"
+
+    def __init__(self, camera_index=0, camera_settings=None, seed=0, jump_chance=0.05, shoot_chance=0.1):
+        super().__init__(camera_index, camera_settings)
+        self.rng = random.Random(seed)
+        self.jump_chance = jump_chance
+        self.shoot_chance = shoot_chance
+
+    def start(self):
+        pass
+
+    def latest(self):
+        captured_at = time.perf_counter()
+        jump = self.rng.random() < self.jump_chance
+        shoot = self.rng.random() < self.shoot_chance
+        self._publish(None, synthetic_landmarks(move_right=True, jump=jump, shoot=shoot), captured_at)
+        return self._latest
+
+    def stop(self):
+        pass
+
+
+class ReplayPoseInput(PoseInput):
+    """Plays a LandmarkRecorder file back, one recorded frame per latest() call.
+
+    Besides the recorded landmarks, snapshots carry the recorded keyboard
+    bits ('keys'), simulation step count ('steps'), restart flag ('restart')
+    and new-round flag ('reset') so the game can repeat the session frame for frame. Nothing
+    waits on a camera or MediaPipe, so replay runs as fast as the game loop.
+    failed is set once the recording runs out.
+    """
+
+    name = "replay"
+
+    def __init__(self, camera_index=0, camera_settings=None, path=None):
+        super().__init__(camera_index, camera_settings)
+        self.path = path
+        self.file = None
+        self._frames = None
+
+    def start(self):
+        self.file = open(self.path, 'rb')
+        read_header(self.file)
+        self._frames = read_frames(self.file)
+
+    def latest(self):
+        record = next(self._frames, None)
+        if record is None:
+            self.failed = True
+            return None
+        timestamp_ms, steps, landmarks, keys, restart, reset = record
+        self._publish(None, landmarks, time.perf_counter(),
+                      recorded_at=timestamp_ms, keys=keys, steps=steps, restart=restart, reset=reset)
+        return self._latest
+
+    def stop(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+POSE_BACKENDS = {
+    'inline': InlinePoseInput,
+    'thread': ThreadedPoseInput,
+    'process': ProcessPoseInput,
+    'keyboard': KeyboardPoseInput,
+    'scripted': ScriptedPoseInput,
+    'replay': ReplayPoseInput,
+}
+
+
+def create_pose_input(backend="thread", camera_index=0, **options):
+    """Build the pose backend named by backend ("inline", "thread", "process", "keyboard", "scripted" or "replay").
+
+    camera_index is a camera index or a video file path. options go to the
+    backend's constructor, e.g. camera_settings= or path= for "replay".
+    """
+    if backend not in POSE_BACKENDS:
+        print(f"Unknown pose backend '{backend}', using 'thread'")
+        backend = "thread"
+    return POSE_BACKENDS[backend](camera_index, **options)
+
+
+def draw_pose_landmarks(frame, landmarks, line_thickness=2, point_radius=2):
+    """Draw the pose skeleton onto a BGR frame of any size, like mp drawing_utils.draw_landmarks"""
+    if landmarks is None:
+        return
+    height, width = frame.shape[:2]
+    points = {}
+    for idx, (x, y, z, visibility) in enumerate(landmarks):
+        if visibility < 0.5:
+            continue
+        points[idx] = (int(x * width), int(y * height))
+
+    for start, end in POSE_CONNECTIONS:
+        if start in points and end in points:
+            cv2.line(frame, points[start], points[end], (224, 224, 224), line_thickness)
+    for point in points.values():
+        cv2.circle(frame, point, point_radius, (0, 0, 255), line_thickness)
@@ -0,0 +1,124 @@
+"""
+Region-of-interest tracking for pose inference.
+
+The player stays in roughly the same part of the camera image from one frame
+to the next, so instead of handing MediaPipe the whole frame every time, the
+tracker crops a padded box around the previous frame's landmarks, shrinks
+that crop to at most max_side pixels and runs inference on it. Landmarks are
+mapped back to full-frame normalized coordinates, so gestures never see the
+crop. When the crop finds nobody (the player moved out of it, or left), the
+same frame is run again uncropped and tracking starts over from there.
+"""
+import time
+
+import cv2
+
+# How a frame was run, as reported by detect() and sent back by pose_worker.py
+MODE_FULL = 0  # Whole frame - nothing tracked yet
+MODE_ROI = 1  # Cropped to the tracked box
+MODE_LOST = 2  # Crop found nobody, the whole frame was run again
+
+MIN_TRACKED_LANDMARKS = 4  # Fewer visible landmarks than this is too little to box the body
+
+
+class PoseROITracker:
+    """Crops frames to a box around the last detected body before inference"""
+
+    def __init__(self, padding=0.3, max_side=256, min_visibility=0.5, min_box_fraction=0.25):
+        self.padding = padding  # Extra margin on each side, as a fraction of the body's size
+        self.max_side = max_side  # Crops are downscaled so their longest side is at most this
+        self.min_visibility = min_visibility
+        self.min_box_fraction = min_box_fraction  # Smallest box side, as a fraction of the frame's shorter side
+        self.box = None  # (x0, y0, x1, y1) in pixels for the next frame, None for the whole frame
+        self.frames = {MODE_FULL: 0, MODE_ROI: 0, MODE_LOST: 0}
+        self.inference_ms = {MODE_FULL: 0.0, MODE_ROI: 0.0, MODE_LOST: 0.0}
+
+    def detect(self, frame, infer):
+        """Run infer(rgb_image) -> landmarks or None on the tracked part of a BGR frame.
+
+        Returns (landmarks in full-frame coordinates or None, mode).
+        """
+        start = time.perf_counter()
+        mode = MODE_FULL
+        landmarks = None
+        if self.box is not None:
+            landmarks = self._run(frame, self.box, infer)
+            mode = MODE_ROI if landmarks is not None else MODE_LOST
+        if landmarks is None:
+            landmarks = self._run(frame, None, infer)
+        self.box = self.next_box(landmarks, frame.shape)
+        self.note(mode, (time.perf_counter() - start) * 1000)
+        return landmarks, mode
+
+    def _run(self, frame, box, infer):
+        if box is None:
+            return infer(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+
+        x0, y0, x1, y1 = box
+        crop_width, crop_height = x1 - x0, y1 - y0
+        crop = frame[y0:y1, x0:x1]
+        scale = self.max_side / max(crop_width, crop_height)
+        if scale < 1.0:
+            crop = cv2.resize(crop, (max(1, round(crop_width * scale)), max(1, round(crop_height * scale))),
+                              interpolation=cv2.INTER_LINEAR)
+        landmarks = infer(cv2.cvtColor(crop, cv2.COLOR_BGR2RGB))
+        if landmarks is None:
+            return None
+
+        # Crop-normalized back to frame-normalized; z is scaled like x
+        height, width = frame.shape[:2]
+        landmarks[:, 0] = (x0 + landmarks[:, 0] * crop_width) / width
+        landmarks[:, 1] = (y0 + landmarks[:, 1] * crop_height) / height
+        landmarks[:, 2] *= crop_width / width
+        return landmarks
+
+    def next_box(self, landmarks, shape):
+        """Padded pixel box around the visible landmarks, or None to run the whole frame"""
+        if landmarks is None:
+            return None
+        visible = landmarks[landmarks[:, 3] >= self.min_visibility]
+        if len(visible) < MIN_TRACKED_LANDMARKS:
+            return None
+
+        height, width = shape[:2]
+        xs = visible[:, 0] * width
+        ys = visible[:, 1] * height
+        centre_x = (xs.min() + xs.max()) / 2
+        centre_y = (ys.min() + ys.max()) / 2
+        # Square box so the model sees the body at its usual aspect ratio
+        side = max(xs.max() - xs.min(), ys.max() - ys.min()) * (1 + 2 * self.padding)
+        side = max(side, self.min_box_fraction * min(width, height))
+
+        x0 = int(max(0, centre_x - side / 2))
+        y0 = int(max(0, centre_y - side / 2))
+        x1 = int(min(width, centre_x + side / 2))
+        y1 = int(min(height, centre_y + side / 2))
+        if x1 - x0 < 2 or y1 - y0 < 2:
+            return None
+        if (x1 - x0) * (y1 - y0) >= 0.8 * width * height:
+            return None  # Body fills the frame - cropping would save nothing
+        return x0, y0, x1, y1
+
+    def note(self, mode, inference_ms):
+        """Count one frame run in mode (also fed with the worker's results by the process backend)"""
+        self.frames[mode] += 1
+        self.inference_ms[mode] += inference_ms
+
+    def stats(self):
+        roi_tries = self.frames[MODE_ROI] + self.frames[MODE_LOST]
+        return {
+            'roi_frames': self.frames[MODE_ROI],
+            'full_frames': self.frames[MODE_FULL],
+            'lost': self.frames[MODE_LOST],
+            'loss_rate': self.frames[MODE_LOST] / roi_tries if roi_tries else 0.0,
+        }
+
+    def report(self):
+        stats = self.stats()
+        parts = []
+        for mode, label in ((MODE_ROI, 'cropped'), (MODE_FULL, 'full frame'), (MODE_LOST, 'lost + full frame')):
+            if self.frames[mode]:
+                parts.append(f"{self.frames[mode]} {label} at {self.inference_ms[mode] / self.frames[mode]:.1f} ms")
+        if not parts:
+            return "ROI tracking: no frames"
+        return f"ROI tracking: {', '.join(parts)}; tracking lost on {stats['loss_rate']:.1%} of cropped frames"
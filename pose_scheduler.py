@@ -0,0 +1,98 @@
+"""
+Decides, camera frame by camera frame, whether pose inference has to run.
+
+Inference is the expensive part of the pose pipeline, but most frames look
+just like the last one that was run: the player stands still, or the game
+is over and nobody is playing. The scheduler compares a tiny grayscale
+thumbnail of each frame (a few hundred pixels, well under a millisecond)
+with the one from the last inferred frame and lets the backend reuse the
+previous landmarks while the share of thumbnail pixels that changed stays
+under motion_threshold. Counting changed pixels rather than averaging the
+difference means an arm moving in one corner still counts, while sensor
+noise (averaged away by the downscale) does not.
+
+Skipping costs input lag: a gesture that starts from rest moves only a few
+pixels in its first frames and stays under the threshold until it speeds
+up (4-5 frames in benchmarks/bench_pose_scheduler.py), so the game defaults
+to 'always' and gating is opt-in for machines short on CPU.
+
+Policies:
+    always   - run every frame (the original behaviour, the default)
+    motion   - skip frames with too little motion
+    adaptive - motion gating, plus at most idle_fps inferences while the game is idle (game over)
+"""
+import time
+
+import cv2
+
+POLICIES = ('always', 'motion', 'adaptive')
+PIXEL_DELTA = 12  # Gray levels a thumbnail pixel has to change by to count as motion
+
+
+class InferenceScheduler:
+    """Motion-gated, idle-throttled pose inference"""
+
+    def __init__(self, policy='always', motion_threshold=0.005, idle_fps=4, refresh_seconds=1.0, thumb_size=(32, 24)):
+        if policy not in POLICIES:
+            print(f"Unknown pose schedule '{policy}', using 'always'")
+            policy = 'always'
+        self.policy = policy
+        self.motion_threshold = motion_threshold  # Fraction of thumbnail pixels that changed
+        self.idle_fps = idle_fps
+        self.refresh_seconds = refresh_seconds  # Run anyway after this long, so slow drift can't go unseen forever
+        self.thumb_size = thumb_size
+        self.idle = False  # Set by the game while nobody is playing
+        self.last_motion = 0.0
+        self.inferred = 0
+        self.skipped_still = 0
+        self.skipped_idle = 0
+        self._reference = None  # Thumbnail of the last inferred frame
+        self._last_inference = None
+
+    def thumbnail(self, frame):
+        small = cv2.resize(frame, self.thumb_size, interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+
+    def should_infer(self, frame, now=None):
+        """True if frame needs inference, False to reuse the previous landmarks"""
+        if now is None:
+            now = time.perf_counter()
+        if self.policy == 'always':
+            self.inferred += 1
+            return True
+
+        since_last = now - self._last_inference if self._last_inference is not None else None
+        if self.policy == 'adaptive' and self.idle and since_last is not None and since_last < 1.0 / self.idle_fps:
+            self.skipped_idle += 1
+            return False
+
+        thumb = self.thumbnail(frame)
+        if self._reference is not None:
+            self.last_motion = cv2.countNonZero(cv2.threshold(cv2.absdiff(thumb, self._reference), PIXEL_DELTA, 1,
+                                                              cv2.THRESH_BINARY)[1]) / thumb.size
+            if self.last_motion < self.motion_threshold and since_last < self.refresh_seconds:
+                self.skipped_still += 1
+                return False
+
+        self._reference = thumb
+        self._last_inference = now
+        self.inferred += 1
+        return True
+
+    def stats(self):
+        frames = self.inferred + self.skipped_still + self.skipped_idle
+        return {
+            'policy': self.policy,
+            'frames': frames,
+            'inferred': self.inferred,
+            'skipped_still': self.skipped_still,
+            'skipped_idle': self.skipped_idle,
+            'inference_rate': self.inferred / frames if frames else 0.0,
+        }
+
+    def report(self):
+        stats = self.stats()
+        return (f"schedule '{self.policy}': inference on {stats['inferred']} of {stats['frames']} frames "
+                f"({stats['inference_rate']:.0%}), {self.skipped_still} skipped as still, "
+                f"{self.skipped_idle} skipped while idle")
+
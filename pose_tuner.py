@@ -0,0 +1,240 @@
+"""
+Picks the MediaPipe pose model complexity and input resolution for this machine.
+
+At first start the pose backend reads a couple of seconds of camera frames
+(a video file works too) and times model_complexity 2, 1 and 0 at a few
+input widths, best first, until one fits the inference budget. The choice is
+stored in .cache/pose_tuning.json under a key for this machine, so later
+starts skip the calibration. While the game runs, PoseTuner.after_inference() watches
+the inference times and steps down a width, then a model, when they stay
+over budget - and stores the new choice.
+
+Calibration needs the player in view: with nobody in the frame MediaPipe
+only runs its person detector, which costs the same for every complexity.
+So only frames that came back with landmarks are timed. If too few did,
+nothing is stored, the game runs MediaPipe's default (model complexity 1),
+and calibration is tried again at the next start.
+
+Models MediaPipe cannot load (complexity 0 and 2 are downloaded on first use)
+are skipped.
+"""
+import json
+import os
+import platform
+import time
+from collections import deque
+
+import cv2
+import numpy as np
+
+from atomic_file import atomic_write
+
+DEFAULT_TUNING_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "pose_tuning.json")
+COMPLEXITIES = (2, 1, 0)  # Most accurate first
+INPUT_WIDTHS = (640, 480, 320, 240)  # Widths tried below the camera's own, widest first
+CALIBRATION_FRAMES = 24
+WARMUP_FRAMES = 4  # Not timed - the first inferences include graph setup
+MIN_PERSON_FRAMES = 8  # Timed frames with landmarks needed for a measurement to count
+
+
+def machine_key():
+    """Identifies the machine the tuning was measured on"""
+    return f"{platform.node()}|{platform.machine()}|{platform.processor() or '?'}|{os.cpu_count()} cpus"
+
+
+def scale_to_width(frame, width):
+    """frame downscaled to width pixels wide (aspect kept), or frame itself if it is not wider"""
+    if width is None or frame.shape[1] <= width:
+        return frame
+    height = max(1, round(frame.shape[0] * width / frame.shape[1]))
+    return cv2.resize(frame, (width, height), interpolation=cv2.INTER_LINEAR)
+
+
+def candidate_widths(frame_width):
+    return [frame_width] + [width for width in INPUT_WIDTHS if width < frame_width]
+
+
+def build_pose(model_complexity):
+    """MediaPipe pose graph, or None if the model can't be loaded (e.g. not downloaded and offline)"""
+    import mediapipe as mp
+    try:
+        return mp.solutions.pose.Pose(model_complexity=model_complexity)
+    except Exception as e:
+        print(f"Pose model complexity {model_complexity} unavailable: {e}")
+        return None
+
+
+def time_config(frames, pose, input_width):
+    """p95 milliseconds of resize + cvtColor + pose.process over the frames a person was found in.
+
+    None when fewer than MIN_PERSON_FRAMES were - detector-only timings say nothing about the model.
+    """
+    times = []
+    for index, frame in enumerate(frames):
+        start = time.perf_counter()
+        results = pose.process(cv2.cvtColor(scale_to_width(frame, input_width), cv2.COLOR_BGR2RGB))
+        if index >= WARMUP_FRAMES and results.pose_landmarks is not None:
+            times.append((time.perf_counter() - start) * 1000)
+    if len(times) < MIN_PERSON_FRAMES:
+        return None
+    return float(np.percentile(times, 95))
+
+
+def calibrate(frames, budget_ms):
+    """Time configurations best first and return the first that fits budget_ms (or the cheapest tried).
+
+    Returns a config dict: model_complexity, input_width, p95_ms - or None when no model
+    could be loaded or nobody was in view.
+    """
+    frame_width = frames[0].shape[1]
+    cheapest = None
+    for complexity in COMPLEXITIES:
+        pose = build_pose(complexity)
+        if pose is None:
+            continue
+        try:
+            for width in candidate_widths(frame_width):
+                p95_ms = time_config(frames, pose, width)
+                if p95_ms is None:
+                    print(f"  pose model complexity {complexity} at {width} px: nobody in view")
+                    if width == frame_width:
+                        return cheapest  # Nobody at full size - narrower inputs and other models won't do better
+                    continue
+                print(f"  pose model complexity {complexity} at {width} px: p95 {p95_ms:.1f} ms")
+                config = {'model_complexity': complexity, 'input_width': width, 'p95_ms': round(p95_ms, 2)}
+                if p95_ms <= budget_ms:
+                    return config
+                if cheapest is None or p95_ms < cheapest['p95_ms']:
+                    cheapest = config
+        finally:
+            pose.close()
+    return cheapest
+
+
+def load_tuning(path, frame_size, budget_ms):
+    """This machine's stored config for the frame size and budget, or None"""
+    try:
+        with open(path) as file:
+            entry = json.load(file).get(machine_key())
+    except (OSError, ValueError):
+        return None
+    if not entry or entry.get('frame_size') != list(frame_size) or entry.get('budget_ms') != budget_ms:
+        return None
+    return entry
+
+
+def save_tuning(path, config):
+    try:
+        with open(path) as file:
+            tunings = json.load(file)
+    except (OSError, ValueError):
+        tunings = {}
+    tunings[machine_key()] = config
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        atomic_write(path, json.dumps(tunings, indent=2).encode())
+    except OSError as e:
+        print(f"Could not save pose tuning: {e}")
+
+
+class PoseTuner:
+    """The pose configuration in use, stepped down when inference keeps running over budget.
+
+    config is a dict with model_complexity, input_width, p95_ms, frame_size
+    and budget_ms - as stored in the tuning file.
+    """
+
+    def __init__(self, budget_ms, path=DEFAULT_TUNING_PATH, window=90, tolerance=1.2):
+        self.budget_ms = budget_ms
+        self.path = path
+        self.tolerance = tolerance  # Median has to exceed budget * tolerance to count as drift
+        self.config = None
+        self.source = None  # 'stored' or 'calibrated'
+        self.step_downs = 0
+        self.min_complexity = 0  # Raised when a lighter model turns out not to load
+        self._samples = deque(maxlen=window)
+        self._previous = None
+
+    def load(self, frame_size):
+        """Use the stored config for this machine and camera frame size, returns it or None"""
+        self.config = load_tuning(self.path, frame_size, self.budget_ms)
+        if self.config is not None:
+            self.source = 'stored'
+        return self.config
+
+    def calibrate(self, frames):
+        """Time the configurations on frames (BGR), then use and store the best that fits"""
+        print(f"Calibrating pose model for a {self.budget_ms:g} ms budget...")
+        config = calibrate(frames, self.budget_ms)
+        if config is None:
+            # No model loaded, or nobody in view - MediaPipe's default model until the next start calibrates
+            print("Pose calibration found nothing to time, using model complexity 1 for now")
+            return None
+        config.update(frame_size=[frames[0].shape[1], frames[0].shape[0]], budget_ms=self.budget_ms)
+        self.config = config
+        self.source = 'calibrated'
+        save_tuning(self.path, config)
+        return config
+
+    def use(self, config):
+        """Take a config decided elsewhere (the process backend hands its worker one)"""
+        self.config = dict(config)
+        self.source = 'given'
+
+    def follow(self, model_complexity, input_width, step_downs):
+        """Mirror the config a worker process is running now - it steps down without telling this tuner"""
+        if (model_complexity, input_width) != (self.config['model_complexity'], self.config['input_width']):
+            self.config = dict(self.config, model_complexity=model_complexity, input_width=input_width)
+        self.step_downs = step_downs
+
+    def observe(self, inference_ms):
+        """Feed one inference time. Returns True when the config was just stepped down"""
+        self._samples.append(inference_ms)
+        if len(self._samples) < self._samples.maxlen:
+            return False
+        if sorted(self._samples)[len(self._samples) // 2] <= self.budget_ms * self.tolerance:
+            return False
+        self._samples.clear()
+        return self.step_down()
+
+    def step_down(self):
+        """Next cheaper config: a narrower input, then a lighter model at the camera's width"""
+        config = dict(self.config)
+        narrower = [width for width in INPUT_WIDTHS if width < config['input_width']]
+        if narrower:
+            config['input_width'] = narrower[0]
+        elif config['model_complexity'] > self.min_complexity:
+            config['model_complexity'] -= 1
+            config['input_width'] = config['frame_size'][0]
+        else:
+            return False  # Already as cheap as it gets
+        self._previous = self.config
+        self.config = config
+        self.step_downs += 1
+        print(f"Pose inference over its {self.budget_ms:g} ms budget, stepping down to "
+              f"model complexity {config['model_complexity']} at {config['input_width']} px")
+        save_tuning(self.path, config)
+        return True
+
+    def after_inference(self, pose, inference_ms):
+        """Feed one inference time, returns the pose graph to use from now on (a new one if the model changed)"""
+        complexity = self.config['model_complexity']
+        if not self.observe(inference_ms) or self.config['model_complexity'] == complexity:
+            return pose
+        new_pose = build_pose(self.config['model_complexity'])
+        if new_pose is None:
+            # Lighter model won't load - stay on this one for good
+            self.min_complexity = complexity
+            self.config = self._previous
+            self.step_downs -= 1
+            save_tuning(self.path, self.config)
+            return pose
+        pose.close()
+        return new_pose
+
+    def report(self):
+        if self.config is None:
+            return "pose model complexity 1, MediaPipe's default (not calibrated - needs the player in view)"
+        return (f"pose model complexity {self.config['model_complexity']} at {self.config['input_width']} px "
+                f"({self.source}, p95 {self.config['p95_ms']:.1f} ms at calibration, {self.budget_ms:g} ms budget), "
+                f"{self.step_downs} runtime step-downs")
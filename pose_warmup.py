@@ -0,0 +1,88 @@
+"""
+Camera and pose model warmup in the background, while the menu is showing.
+
+Opening the webcam, building the MediaPipe graph and its first inference take
+seconds. PoseWarmup does all of it on a thread as soon as the menu opens, so
+by the time the player presses PLAY the pose backend is already running and
+the game only has to take it. If warmup fails (no camera, MediaPipe missing)
+or hasn't finished when the game gives up waiting, take() returns None and
+the game plays on keyboard controls. A backend that finishes later can still
+be taken, and close() stops one that nobody took.
+"""
+import threading
+import time
+
+
+class PoseWarmup:
+    """Builds and starts a pose backend on a background thread"""
+
+    def __init__(self, create):
+        self.create = create  # Returns a configured, not yet started pose backend
+        self.pose_input = None
+        self.error = None
+        self.seconds = None  # How long warmup took, once done
+        self._done = threading.Event()
+        self._abandoned = False  # Set by close() - whatever warmup still builds is shut down
+        self._lock = threading.Lock()
+        self._thread = None
+        self._started_at = None
+
+    def start(self):
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="pose-warmup", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        pose_input = None
+        try:
+            pose_input = self.create()
+            pose_input.start()
+            if pose_input.failed:
+                raise RuntimeError("camera delivered no frames")
+            if pose_input.scheduler is not None:
+                pose_input.scheduler.idle = True  # Menu still up - nobody is playing yet
+        except Exception as e:
+            self.error = e
+            if pose_input is not None:
+                pose_input.stop()
+            pose_input = None
+
+        with self._lock:
+            self.seconds = time.perf_counter() - self._started_at
+            if self._abandoned:
+                if pose_input is not None:
+                    pose_input.stop()  # Closed before warmup finished
+            else:
+                self.pose_input = pose_input
+            self._done.set()
+
+    def ready(self):
+        return self._done.is_set()
+
+    def take(self, timeout=0):
+        """The running pose backend, or None if warmup failed, is still going after timeout seconds or was taken.
+
+        The caller owns (and stops) the backend it takes.
+        """
+        self._done.wait(timeout)
+        with self._lock:
+            pose_input = self.pose_input
+            self.pose_input = None
+            return pose_input
+
+    def close(self):
+        """Stop the backend if nobody took it, now or when warmup finishes"""
+        with self._lock:
+            self._abandoned = True
+            pose_input = self.pose_input
+            self.pose_input = None
+        if pose_input is not None:
+            pose_input.stop()
+
+    def report(self):
+        if not self.ready():
+            return "Pose warmup: still running"
+        if self.error is not None:
+            return f"Pose warmup failed after {self.seconds:.1f} s: {self.error}"
+        return f"Pose warmup: camera and pose model ready after {self.seconds:.1f} s"
@@ -0,0 +1,157 @@
+"""
+Pose inference worker process for the "process" pose backend.
+
+The game process writes mirrored BGR camera frames into a shared-memory ring
+buffer and sends this worker the slot number over stdin. The worker runs
+MediaPipe pose on the frame straight out of shared memory and writes the
+landmarks back over stdout. Frames themselves never go through a pipe.
+With the optional "roi" argument the worker runs pose on a crop around the
+last detected body (see pose_roi.py) and reports which way each frame ran.
+"tuning=<json>" runs the model complexity and input width picked by
+pose_tuner.py, stepping them down here if inference drifts over budget; every
+reply carries the config in use, so the game's report shows what ran.
+
+Usage: python pose_worker.py <shm_name> <slots> <height> <width> [roi] [tuning=<json>]
+"""
+import json
+import os
+import struct
+import sys
+import time
+
+import numpy as np
+from multiprocessing import resource_tracker, shared_memory
+
+from gestures import NUM_LANDMARKS
+
+# Game -> worker: slot index, capture timestamp
+REQUEST = struct.Struct('<Id')
+# Worker -> game: slot index, capture timestamp, inference ms, landmarks found, pose_roi MODE_*,
+# then the tuned model complexity, input width and runtime step-downs (all 0 without tuning)
+REPLY = struct.Struct('<IddBBBHB')
+LANDMARK_BYTES = NUM_LANDMARKS * 4 * 4  # 33 landmarks x (x, y, z, visibility) float32
+
+
+class FrameRing:
+    """Fixed number of BGR frame slots in one multiprocessing.shared_memory block"""
+
+    def __init__(self, shape, slots, name=None):
+        self.shape = tuple(shape)
+        self.slots = slots
+        self.frame_bytes = int(np.prod(self.shape))
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=self.frame_bytes * slots)
+            self.owner = True
+        else:
+            self.shm = _attach_shared_memory(name)
+            self.owner = False
+        self.name = self.shm.name
+        self.frames = [
+            np.ndarray(self.shape, dtype=np.uint8, buffer=self.shm.buf, offset=i * self.frame_bytes)
+            for i in range(slots)
+        ]
+
+    def write(self, slot, frame):
+        np.copyto(self.frames[slot], frame)
+
+    def close(self):
+        self.frames = []
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def _attach_shared_memory(name):
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        # Only the game process owns the block - stop this process's resource
+        # tracker from unlinking it when the worker exits
+        if os.name == 'posix':
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        return shm
+
+
+def read_exact(stream, size):
+    """Read exactly size bytes from a binary stream, or return None on EOF"""
+    data = b''
+    while len(data) < size:
+        chunk = stream.read(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+def main(argv):
+    shm_name, slots, height, width = argv[1], int(argv[2]), int(argv[3]), int(argv[4])
+    options = argv[5:]
+    use_roi = 'roi' in options
+    tuning = next((json.loads(option[len('tuning='):]) for option in options if option.startswith('tuning=')), None)
+
+    # Keep the real stdout for replies and send anything else printed
+    # (MediaPipe / TFLite logging) to stderr so it can't corrupt the stream
+    replies = os.fdopen(os.dup(sys.stdout.fileno()), 'wb')
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    requests = sys.stdin.buffer
+
+    import cv2
+    import mediapipe as mp
+    from gestures import landmarks_to_array
+    from pose_roi import MODE_FULL, PoseROITracker
+    from pose_tuner import PoseTuner, build_pose, scale_to_width
+
+    ring = FrameRing((height, width, 3), slots, name=shm_name)
+    tuner = None
+    if tuning is not None:
+        tuner = PoseTuner(tuning['budget_ms'])
+        tuner.use(tuning)
+    pose = (build_pose(tuning['model_complexity']) if tuner else None) or mp.solutions.pose.Pose()
+    pose.process(np.zeros((64, 64, 3), dtype=np.uint8))  # Graph setup and model load before the first real frame
+    rgb_frame = np.empty((height, width, 3), dtype=np.uint8)
+    no_landmarks = bytes(LANDMARK_BYTES)
+    tracker = PoseROITracker() if use_roi else None
+
+    def infer(image):
+        return landmarks_to_array(pose.process(image).pose_landmarks)
+
+    try:
+        while True:
+            request = read_exact(requests, REQUEST.size)
+            if request is None:
+                break  # Game closed the pipe
+            slot, captured_at = REQUEST.unpack(request)
+
+            start = time.perf_counter()
+            frame = ring.frames[slot]
+            if tuner is not None:
+                frame = scale_to_width(frame, tuner.config['input_width'])
+            if tracker is not None:
+                landmarks, mode = tracker.detect(frame, infer)
+            elif frame.shape == rgb_frame.shape:
+                cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_frame)
+                landmarks, mode = infer(rgb_frame), MODE_FULL
+            else:
+                landmarks, mode = infer(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)), MODE_FULL
+            inference_ms = (time.perf_counter() - start) * 1000
+            if tuner is not None:
+                pose = tuner.after_inference(pose, inference_ms)
+
+            found = landmarks is not None
+            if tuner is not None:
+                tuned = (tuner.config['model_complexity'], tuner.config['input_width'], min(tuner.step_downs, 255))
+            else:
+                tuned = (0, 0, 0)
+            replies.write(REPLY.pack(slot, captured_at, inference_ms, found, mode, *tuned))
+            replies.write(landmarks.tobytes() if found else no_landmarks)
+            replies.flush()
+    except (BrokenPipeError, KeyboardInterrupt):
+        pass
+    finally:
+        pose.close()
+        ring.close()
+
+
+if __name__ == '__main__':
+    main(sys.argv)
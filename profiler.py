@@ -0,0 +1,198 @@
+"""
+Per-stage frame-time profiler for the game loop.
+
+The loop calls frame_start() once per frame and lap(name) after each stage;
+every lap records the nanoseconds since the previous lap (perf_counter_ns),
+so the stages add up to the whole frame. Stages inside the fixed-step
+simulation use step_lap(): a frame runs 0 to N steps, so their laps are
+summed into one sample per frame. Anything that isn't a slice of the frame
+(the pose thread's work, the capture age of the landmarks) is fed in with
+add() and reported apart from the stages. Each keeps its last `window`
+samples in a ring buffer for rolling p50/p95/p99.
+
+NullProfiler has the same methods doing nothing, so the loop is left
+uninstrumented when profiling is off.
+"""
+import csv
+import time
+
+import numpy as np
+import pygame
+
+STATS_EVERY = 30  # Frames between overlay percentile refreshes
+BAR_PX_PER_MS = 20
+BAR_MAX_PX = 300
+
+
+class StageTimes:
+    """Ring buffer of one stage's latest durations in nanoseconds"""
+
+    def __init__(self, window):
+        self.samples = [0] * window  # Plain list - a store is cheaper than into a NumPy array
+        self.window = window
+        self.count = 0
+
+    def add(self, ns):
+        self.samples[self.count % self.window] = ns
+        self.count += 1
+
+    def filled(self):
+        return np.array(self.samples[:min(self.count, self.window)], dtype=np.int64)
+
+
+class FrameProfiler:
+    """Rolling per-stage timings with an optional on-screen bar graph"""
+
+    def __init__(self, window=600):
+        self.window = window
+        self.stages = {}  # name -> StageTimes for the slices of the frame, in first-seen order
+        self.other = {}  # name -> StageTimes for add() timings, not part of the frame
+        self._step_totals = {}  # step_lap() stage -> ns this frame so far
+        self._previous = None  # Stage lapped last this frame
+        self.frames = 0
+        self.show_overlay = False
+        self._mark = time.perf_counter_ns()
+        self._stats = {}
+        self._other_stats = {}
+        self._font = None
+
+    def frame_start(self):
+        # The last frame's simulation stages, one sample each - 0 if it ran no steps
+        for name, total in self._step_totals.items():
+            self.stages[name].add(total)
+            self._step_totals[name] = 0
+        self.frames += 1
+        self._previous = None
+        self._mark = time.perf_counter_ns()
+
+    def _stage(self, stages, name):
+        stage = stages.get(name)
+        if stage is None:
+            stage = stages[name] = StageTimes(self.window)
+        return stage
+
+    def _frame_stage(self, name):
+        """The frame stage name - a new one goes right after the stage lapped before it, so rows follow the loop
+        even when a stage (the simulation's, on a frame with no steps) first shows up a few frames in"""
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = StageTimes(self.window)
+            names = list(self.stages)
+            at = names.index(self._previous) + 1 if self._previous in self.stages else 0
+            names.insert(at, name)
+            self.stages = {key: self.stages.get(key, stage) for key in names}
+        self._previous = name
+        return stage
+
+    def lap(self, name):
+        """Record the time since the previous lap (or frame_start) as stage name"""
+        now = time.perf_counter_ns()
+        self._frame_stage(name).add(now - self._mark)
+        self._mark = now
+
+    def step_lap(self, name):
+        """lap() for a stage inside a simulation step - added up over the frame's steps"""
+        now = time.perf_counter_ns()
+        self._frame_stage(name)
+        if name not in self._step_totals:
+            self._step_totals[name] = 0
+        self._step_totals[name] += now - self._mark
+        self._mark = now
+
+    def add(self, name, ns):
+        """Record a timing that isn't a slice of the frame (other threads, capture age)"""
+        self._stage(self.other, name).add(ns)
+
+    def toggle_overlay(self):
+        self.show_overlay = not self.show_overlay
+
+    def stats(self, stages=None):
+        """{stage: (count, mean, p50, p95, p99, max)} over the current window, in milliseconds.
+
+        stages defaults to the frame's; pass self.other for the add() timings.
+        """
+        stats = {}
+        for name, stage in list((self.stages if stages is None else stages).items()):
+            samples = stage.filled()
+            if len(samples) == 0:
+                continue
+            p50, p95, p99 = np.percentile(samples, [50, 95, 99]) / 1e6
+            stats[name] = (stage.count, samples.mean() / 1e6, p50, p95, p99, samples.max() / 1e6)
+        return stats
+
+    def draw(self, surface, x, y):
+        """Bar per stage: solid to p50, faint to p95, tick at p99"""
+        if not self.show_overlay:
+            return
+        if self._font is None:
+            self._font = pygame.font.Font(pygame.font.match_font('consolas,couriernew,dejavusansmono'), 16)
+        if self.frames % STATS_EVERY == 0 or not self._stats:
+            self._stats = self.stats()
+            self._other_stats = self.stats(self.other)
+
+        # The frame's stages, then a heading and the timings from outside the frame
+        rows = list(self._stats.items())
+        if self._other_stats:
+            rows.append(("not part of the frame:", None))
+            rows.extend(self._other_stats.items())
+        row_height = 20
+        panel = pygame.Surface((BAR_MAX_PX + 260, row_height * len(rows) + 10), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 160))
+        surface.blit(panel, (x, y))
+        for row, (name, stats) in enumerate(rows):
+            row_y = y + 5 + row * row_height
+            if stats is None:
+                surface.blit(self._font.render(name, True, (180, 180, 180)), (x + 5, row_y))
+                continue
+            count, mean, p50, p95, p99, worst = stats
+            bar_x = x + 250
+            pygame.draw.rect(surface, (90, 90, 160), (bar_x, row_y + 3, min(BAR_MAX_PX, int(p95 * BAR_PX_PER_MS)), 12))
+            pygame.draw.rect(surface, (120, 200, 255), (bar_x, row_y + 3, min(BAR_MAX_PX, int(p50 * BAR_PX_PER_MS)), 12))
+            tick_x = bar_x + min(BAR_MAX_PX, int(p99 * BAR_PX_PER_MS))
+            pygame.draw.line(surface, (255, 80, 80), (tick_x, row_y + 1), (tick_x, row_y + 16), 2)
+            label = self._font.render(f"{name:<18} {p50:5.2f} {p95:5.2f} {p99:5.2f}", True, (255, 255, 255))
+            surface.blit(label, (x + 5, row_y))
+
+    def write_csv(self, path):
+        with open(path, 'w', newline='') as file:
+            writer = csv.writer(file)
+            # kind: 'frame' for the slices of a frame, 'other' for timings outside it
+            writer.writerow(['stage', 'kind', 'samples', 'mean_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms'])
+            for kind, stages in (('frame', self.stages), ('other', self.other)):
+                for name, (count, mean, p50, p95, p99, worst) in self.stats(stages).items():
+                    writer.writerow([name, kind, count] + [f"{value:.3f}" for value in (mean, p50, p95, p99, worst)])
+
+    def report(self):
+        lines = [f"{'stage':<22}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"]
+        for name, (count, mean, p50, p95, p99, worst) in self.stats().items():
+            lines.append(f"{name:<22}{p50:>9.2f}{p95:>9.2f}{p99:>9.2f}")
+        other = self.stats(self.other)
+        if other:
+            lines.append("Not part of the frame:")
+            for name, (count, mean, p50, p95, p99, worst) in other.items():
+                lines.append(f"{name:<22}{p50:>9.2f}{p95:>9.2f}{p99:>9.2f}")
+        return "\n".join(lines)
+
+
+class NullProfiler:
+    """Stand-in used when profiling is off - every call is a no-op"""
+
+    show_overlay = False
+
+    def frame_start(self):
+        pass
+
+    def lap(self, name):
+        pass
+
+    def step_lap(self, name):
+        pass
+
+    def add(self, name, ns):
+        pass
+
+    def toggle_overlay(self):
+        pass
+
+    def draw(self, surface, x, y):
+        pass
@@ -0,0 +1,94 @@
+import numpy as np
+
+
+class ProjectilePool:
+    """Fixed-capacity projectile pool with preallocated NumPy slots.
+
+    Live projectiles are packed into slots [0, count); slots [count,
+    capacity) are the free list, so spawning takes the first free slot and
+    removal swaps the last live projectile into the hole - both O(1), with
+    no per-projectile objects allocated. Spawns beyond capacity are dropped
+    and counted.
+    """
+
+    def __init__(self, capacity, width, height):
+        self.capacity = capacity
+        self.width = width
+        self.height = height
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.prev_x = np.zeros(capacity)  # Position before the last advance, for interpolated drawing
+        self.prev_y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.count = 0
+        self.high_water = 0  # Most projectiles alive at once
+        self.dropped = 0  # Spawns refused because the pool was full
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, x, y, vx, vy):
+        """Put a projectile in the next free slot, returns False if the pool is full"""
+        if self.count == self.capacity:
+            self.dropped += 1
+            return False
+        i = self.count
+        self.x[i] = self.prev_x[i] = x
+        self.y[i] = self.prev_y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.count += 1
+        self.high_water = max(self.high_water, self.count)
+        return True
+
+    def swap_remove(self, i):
+        last = self.count - 1
+        if i != last:
+            self.x[i] = self.x[last]
+            self.y[i] = self.y[last]
+            self.prev_x[i] = self.prev_x[last]
+            self.prev_y[i] = self.prev_y[last]
+            self.vx[i] = self.vx[last]
+            self.vy[i] = self.vy[last]
+        self.count = last
+
+    def remove_where(self, mask):
+        """Swap-remove every live projectile whose entry in mask is True"""
+        # Highest index first, so a projectile moved into a hole is never one still to be removed
+        for i in np.flatnonzero(mask)[::-1]:
+            self.swap_remove(i)
+
+    def clear(self):
+        self.count = 0
+
+    def advance(self, gravity=0.0):
+        """Move every projectile by its velocity, applying gravity to vy first"""
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+        # Whole-pixel steps, truncated like the int(vx) / int(vy) moves on Rects did
+        self.x[:n] += np.trunc(self.vx[:n])
+        self.vy[:n] += gravity
+        self.y[:n] += np.trunc(self.vy[:n])
+
+    def overlaps(self, rect):
+        """Boolean mask of live projectiles overlapping a world-space Rect (Rect.colliderect test)"""
+        n = self.count
+        x = self.x[:n]
+        y = self.y[:n]
+        return (x < rect.right) & (x + self.width > rect.left) & (y < rect.bottom) & (y + self.height > rect.top)
+
+    def positions(self, alpha=1.0):
+        """Iterate (x, y) integer world positions of the live projectiles
+
+        alpha blends from the position before the last advance (0.0) to the current one (1.0).
+        """
+        n = self.count
+        x = self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha
+        y = self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha
+        for i in range(n):
+            yield round(x[i]), round(y[i])
+
+    def stats(self):
+        return {'active': self.count, 'high_water': self.high_water, 'capacity': self.capacity, 'dropped': self.dropped}
@@ -0,0 +1,99 @@
+"""
+Landmark recordings: per-frame pose landmarks and keyboard state written to a
+compact binary file, and read back for the "replay" pose backend.
+
+File layout (little endian):
+    header  - magic b'MARIOREC', format version, random seed the level was built with, screen size
+    frames  - FRAME record, then 33 x 4 float32 landmarks if FLAG_LANDMARKS is set
+
+Each frame also stores how many simulation steps the game ran after it, so
+a replay advances the simulation exactly as the recorded session did. A
+launcher session records every round in one file: the first frame of each
+later round carries FLAG_RESET, and replay resets the game there too.
+"""
+import struct
+
+import numpy as np
+
+from gestures import NUM_LANDMARKS
+
+MAGIC = b'MARIOREC'
+VERSION = 1
+HEADER = struct.Struct('<8sHQHH')  # magic, version, seed, screen width, screen height
+# Milliseconds since recording start, simulation steps run for this frame, flags, keyboard bits
+FRAME = struct.Struct('<dHBB')
+LANDMARK_BYTES = NUM_LANDMARKS * 4 * 4
+
+# Frame flags
+FLAG_LANDMARKS = 1  # Landmark block follows
+FLAG_RESTART = 2  # Game was restarted before this frame's steps
+FLAG_RESET = 4  # Launcher started a new round (GameSession.reset) before this frame
+
+# Keyboard bits - the game actions the keys were mapped to
+KEY_RIGHT = 1
+KEY_LEFT = 2
+KEY_JUMP = 4
+KEY_SHOOT = 8
+
+
+def pack_keys(move_right, move_left, jump, shoot):
+    return ((KEY_RIGHT if move_right else 0) | (KEY_LEFT if move_left else 0) |
+            (KEY_JUMP if jump else 0) | (KEY_SHOOT if shoot else 0))
+
+
+def unpack_keys(bits):
+    """Keyboard bits back to (move_right, move_left, jump, shoot)"""
+    return bool(bits & KEY_RIGHT), bool(bits & KEY_LEFT), bool(bits & KEY_JUMP), bool(bits & KEY_SHOOT)
+
+
+class LandmarkRecorder:
+    """Appends one record per game frame to a recording file"""
+
+    def __init__(self, path, seed, screen_size):
+        self.path = path
+        self.file = open(path, 'wb')
+        self.file.write(HEADER.pack(MAGIC, VERSION, seed, *screen_size))
+        self.frames = 0
+
+    def write(self, timestamp_ms, steps, landmarks, keys, restart=False, reset=False):
+        flags = ((FLAG_LANDMARKS if landmarks is not None else 0) | (FLAG_RESTART if restart else 0) |
+                 (FLAG_RESET if reset else 0))
+        self.file.write(FRAME.pack(timestamp_ms, steps, flags, keys))
+        if landmarks is not None:
+            self.file.write(np.ascontiguousarray(landmarks, dtype=np.float32).tobytes())
+        self.frames += 1
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+def read_header(file):
+    """Read and check the header of an open recording, returns (seed, (screen width, screen height))"""
+    magic, version, seed, width, height = HEADER.unpack(file.read(HEADER.size))
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Not a version {VERSION} landmark recording")
+    return seed, (width, height)
+
+
+def read_recording_info(path):
+    """Seed and screen size a recording was made with - the level layout depends on both"""
+    with open(path, 'rb') as file:
+        return read_header(file)
+
+
+def read_frames(file):
+    """Yield (timestamp_ms, steps, landmarks or None, keys, restart, reset) for each frame after the header"""
+    while True:
+        record = file.read(FRAME.size)
+        if len(record) < FRAME.size:
+            return
+        timestamp_ms, steps, flags, keys = FRAME.unpack(record)
+        landmarks = None
+        if flags & FLAG_LANDMARKS:
+            body = file.read(LANDMARK_BYTES)
+            if len(body) < LANDMARK_BYTES:
+                return  # Truncated last frame, e.g. the game was killed mid-write
+            landmarks = np.frombuffer(body, dtype=np.float32).reshape(NUM_LANDMARKS, 4)
+        yield timestamp_ms, steps, landmarks, keys, bool(flags & FLAG_RESTART), bool(flags & FLAG_RESET)
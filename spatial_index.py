@@ -0,0 +1,63 @@
+class PlatformIndex:
+    """Uniform grid over world x for platform collision queries.
+
+    Each platform dict is filed under every cell_width-wide column its rect
+    spans, so a query only looks at the few platforms in the columns it
+    touches - cost depends on how crowded the area is, not on how many
+    platforms exist. Platforms are static, so the grid only changes when the
+    world adds or retires them.
+    """
+
+    def __init__(self, cell_width=256):
+        self.cell_width = cell_width
+        self.cells = {}  # column -> list of platform dicts
+
+    def _columns(self, left, right):
+        return range(left // self.cell_width, (right - 1) // self.cell_width + 1)
+
+    def insert(self, platform):
+        rect = platform['rect']
+        for column in self._columns(rect.left, rect.right):
+            self.cells.setdefault(column, []).append(platform)
+
+    def remove(self, platform):
+        rect = platform['rect']
+        for column in self._columns(rect.left, rect.right):
+            cell = self.cells.get(column)
+            if cell is not None:
+                # By identity - list.remove() compares dicts field by field and could drop an equal twin
+                for index, other in enumerate(cell):
+                    if other is platform:
+                        cell.pop(index)
+                        break
+                if not cell:
+                    del self.cells[column]
+
+    def clear(self):
+        self.cells.clear()
+
+    def query(self, left, right):
+        """Platforms whose x-extent overlaps [left, right), each returned once"""
+        found = []
+        seen = set()
+        for column in self._columns(left, right):
+            for platform in self.cells.get(column, ()):
+                rect = platform['rect']
+                if rect.left < right and rect.right > left and id(platform) not in seen:
+                    seen.add(id(platform))
+                    found.append(platform)
+        return found
+
+    def landing_top(self, left, top, right, bottom):
+        """Top of the first platform the world-space box overlaps from above, or None.
+
+        Same test as Rect.colliderect plus "bottom not below the platform's
+        bottom", done on plain numbers so no Rects are built per query.
+        """
+        for column in self._columns(left, right):
+            for platform in self.cells.get(column, ()):
+                rect = platform['rect']
+                if (rect.left < right and rect.right > left and
+                        rect.top < bottom and rect.bottom > top and bottom <= rect.bottom):
+                    return rect.top
+        return None
@@ -0,0 +1,86 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class FontRegistry:
+    """pygame Font objects memoized by (name, size, bold).
+
+    name is a system font name for pygame.font.match_font, or None for
+    pygame's default font. match_font (an fc-list lookup on Linux) runs once
+    per (name, bold), and each Font is loaded once per size.
+    """
+
+    def __init__(self):
+        self._paths = {}
+        self._fonts = {}
+
+    def _path(self, name, bold):
+        if name is None:
+            return None
+        key = (name, bold)
+        if key not in self._paths:
+            self._paths[key] = pygame.font.match_font(name, bold=bold)
+        return self._paths[key]
+
+    def get(self, name, size, bold=False):
+        key = (name, size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = pygame.font.Font(self._path(name, bold), size)
+        return font
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by (font, text, color).
+
+    Text that stays the same between frames (labels, the score until it
+    changes) is rendered once and then only blitted. The translucent panels
+    behind HUD text are cached the same way, by size and color.
+    """
+
+    def __init__(self, fonts, max_entries=64):
+        self.fonts = fonts
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, text, name, size, color, bold=False):
+        """Anti-aliased text surface, rendered on first use"""
+        key = (name, size, bold, text, color)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.fonts.get(name, size, bold).render(text, True, color)
+        self._store(key, surface)
+        return surface
+
+    def panel(self, size, color):
+        """Filled SRCALPHA surface of size - color may have an alpha - made on first use"""
+        key = ('panel', tuple(size), color)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        surface.fill(color)
+        self._store(key, surface)
+        return surface
+
+    def _store(self, key, surface):
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'size': len(self._surfaces)}
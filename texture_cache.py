@@ -0,0 +1,65 @@
+import hashlib
+import os
+
+import pygame
+
+from atomic_file import atomic_write
+from textures import TEXTURE_GENERATOR_VERSION
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "textures")
+
+
+class TextureCache:
+    """On-disk cache of generated textures stored as raw RGB blobs.
+
+    Entries are keyed by a hash of (generator, size, base_color, seed,
+    generator version), so a cached texture is only reused when it would be
+    generated identically. Files written by an older generator version are
+    deleted the first time the cache is used.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, version=TEXTURE_GENERATOR_VERSION):
+        self.directory = directory
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            self._evict_stale()
+        except OSError as e:
+            print(f"Texture cache unavailable: {e}")
+
+    def _evict_stale(self):
+        current_tag = f"-v{self.version}-"
+        for filename in os.listdir(self.directory):
+            if filename.endswith(".rgb") and current_tag not in filename:
+                os.remove(os.path.join(self.directory, filename))
+
+    def _path(self, generator, width, height, base_color, seed):
+        key = repr((generator.__name__, width, height, tuple(base_color) if base_color else None, seed, self.version))
+        digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+        return os.path.join(self.directory, f"{generator.__name__}-v{self.version}-{digest}.rgb")
+
+    def get(self, generator, width, height, base_color=None, seed=0):
+        """Return generator's texture, loading it from disk when it has been made before"""
+        path = self._path(generator, width, height, base_color, seed)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            if len(data) == width * height * 3:
+                self.hits += 1
+                return pygame.image.frombuffer(data, (width, height), "RGB")
+        except OSError:
+            pass
+
+        self.misses += 1
+        if base_color is None:
+            texture = generator(width, height, seed=seed)
+        else:
+            texture = generator(width, height, base_color, seed=seed)
+
+        try:
+            atomic_write(path, pygame.image.tobytes(texture, "RGB"))
+        except OSError as e:
+            print(f"Could not write texture cache entry: {e}")
+        return texture
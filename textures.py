@@ -0,0 +1,96 @@
+import numpy as np
+import pygame
+
+# Texture generation for Jump King style blocks.
+# Everything is built as whole (width, height, 3) NumPy arrays - same x, y
+# axis order as pygame.surfarray - and written to the Surface in one blit.
+
+# Bump whenever a generator's output changes so cached textures get rebuilt
+TEXTURE_GENERATOR_VERSION = 1
+
+
+def _line_pixels(start, end):
+    """x and y index arrays for the pixels of a 1px line between two points"""
+    steps = max(abs(end[0] - start[0]), abs(end[1] - start[1])) + 1
+    xs = np.rint(np.linspace(start[0], end[0], steps)).astype(np.intp)
+    ys = np.rint(np.linspace(start[1], end[1], steps)).astype(np.intp)
+    return xs, ys
+
+
+def _to_surface(pixels):
+    texture = pygame.Surface(pixels.shape[:2])
+    pygame.surfarray.blit_array(texture, pixels.astype(np.uint8))
+    return texture
+
+
+def create_stone_texture(width, height, base_color=(120, 100, 80), seed=None):
+    """Create a stone texture similar to Jump King with better seamless tiling"""
+    rng = np.random.default_rng(seed)
+    base = np.array(base_color, dtype=np.int32)
+
+    # Position-based smoothing for seamless tiling, scaled per channel
+    position_noise = np.outer(np.sin(np.arange(width) * 0.4), np.cos(np.arange(height) * 0.3)) * 12
+    channel_scale = np.array([1.0, 0.8, 0.6])
+    random_noise = rng.integers([-15, -12, -10], [16, 13, 11], size=(width, height, 3))
+    total_noise = np.trunc(position_noise[:, :, None] * channel_scale + random_noise).astype(np.int32)
+    pixels = np.clip(base + total_noise, 0, 255)
+
+    # Add some stone patterns (less frequent for subtlety)
+    grain = rng.random((width, height)) < 0.08  # Stone grain
+    lighter = ~grain & (rng.random((width, height)) < 0.06)  # Lighter spots
+    pixels[grain] = np.maximum(pixels[grain] - [25, 20, 15], 0)
+    pixels[lighter] = np.minimum(pixels[lighter] + [30, 25, 20], 255)
+
+    # Add fewer, more subtle crack lines
+    crack_color = np.maximum(base - [25, 20, 15], 0)
+    for _ in range(rng.integers(1, 4)):
+        start_x = int(rng.integers(0, width))
+        start_y = int(rng.integers(0, height))
+        end_x = min(width - 1, max(0, start_x + int(rng.integers(-15, 16))))
+        end_y = min(height - 1, max(0, start_y + int(rng.integers(-8, 9))))
+        xs, ys = _line_pixels((start_x, start_y), (end_x, end_y))
+        pixels[xs, ys] = crack_color
+
+    return _to_surface(pixels)
+
+
+def create_grass_ground_texture(width, height, seed=None):
+    """Create grass-topped ground texture with better seamless tiling"""
+    rng = np.random.default_rng(seed)
+    dirt_color = np.array([101, 67, 33], dtype=np.int32)
+    pixels = np.empty((width, height, 3), dtype=np.int32)
+    pixels[:] = dirt_color
+
+    # Dirt variation below the grass line, smoother noise from position
+    noise_factor = (np.sin(np.arange(width) * 0.3)[:, None] + np.cos(np.arange(height) * 0.2)[None, :]) * 8
+    base_noise = rng.integers(-8, 9, size=(width, height))
+    total_noise = np.trunc(noise_factor + base_noise).astype(np.int32)
+    dirt = np.clip(dirt_color + total_noise[:, :, None], 0, 255)
+    pixels[:, 5:] = dirt[:, 5:]
+
+    # Create more natural grass top layer
+    grass_height = min(6, height)
+    grass_variation = np.outer(np.sin(np.arange(width) * 0.2), np.cos(np.arange(grass_height) * 0.4)) * 15
+    # Per-row (base colour, variation scale) - top grass, mid grass, grass/dirt transition
+    layer_base = np.array([[45, 120, 35]] * 2 + [[40, 100, 30]] * 2 + [[60, 80, 35]] * 2)[:grass_height]
+    layer_scale = np.array([[1.0, 0.8, 0.5]] * 2 + [[0.7, 0.6, 0.4]] * 2 + [[0.5, 0.4, 0.3]] * 2)[:grass_height]
+    base_green = layer_base + np.trunc(grass_variation[:, :, None] * layer_scale).astype(np.int32)
+
+    # Add subtle random variation
+    noise = rng.integers([-5, -8, -5], [6, 13, 6], size=(width, grass_height, 3))
+    grass = np.clip(base_green + noise, 0, 255)
+
+    # Add occasional grass blade highlights (less frequent for subtlety)
+    blades = rng.random((width, grass_height)) < 0.1
+    grass[blades, 1] = np.minimum(grass[blades, 1] + 20, 255)
+    grass[blades, 0] = np.maximum(grass[blades, 0] - 5, 0)
+    pixels[:, :grass_height] = grass
+
+    # Add some small dirt spots for realism
+    for _ in range(rng.integers(3, 8)):
+        spot_x = int(rng.integers(0, max(1, width - 2)))
+        spot_y = int(rng.integers(max(0, grass_height - 2), height))
+        spot_size = int(rng.integers(1, 3))
+        pixels[spot_x:spot_x + spot_size, spot_y:spot_y + spot_size] = dirt_color + rng.integers(-10, 11, size=3)
+
+    return _to_surface(pixels)
@@ -0,0 +1,147 @@
+import random
+
+import pygame
+
+from obstacles import OBSTACLE_SIZE, ObstacleStore
+from spatial_index import PlatformIndex
+
+CHUNK_WIDTH = 1000  # World pixels per chunk
+GENERATE_AHEAD = 2000  # Keep this much world generated ahead of the player
+RETIRE_BEHIND = 800  # Retire chunks once they are this far behind the left screen edge
+OBSTACLE_GAP = 400
+
+
+class World:
+    """Platforms and obstacles streamed in fixed-width chunks around the camera.
+
+    Chunks are generated ahead of the player and retired once they scroll
+    far enough off the left of the screen, so `platforms` and `obstacles`
+    only ever hold what is near the camera. Platform dicts (and their Rects)
+    from retired chunks are recycled for new ones, and retired obstacle
+    slots are reused by the ObstacleStore. platform_index is kept in step
+    with `platforms` for collision queries.
+
+    platforms: {'rect': Rect, 'texture_id': int, 'chunk': int}
+    obstacles: ObstacleStore
+    rng: the random.Random levels are generated from - seed it for a repeatable level
+    """
+
+    def __init__(self, screen_width, screen_height, ground_y, texture_count, rng=None):
+        self.rng = rng if rng is not None else random.Random()
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.ground_y = ground_y
+        self.texture_count = texture_count
+        self.platforms = []
+        self.obstacles = ObstacleStore()
+        self.platform_index = PlatformIndex()
+        self._platform_pool = []
+        self.reset()
+
+    def reset(self):
+        """Recycle everything and lay out a fresh starting area"""
+        self._platform_pool.extend(self.platforms)
+        # Clear in place - callers keep references to these
+        self.platforms.clear()
+        self.obstacles.clear()
+        self.platform_index.clear()
+        self.first_chunk = 0
+        self.next_chunk = 0
+
+        self._generate_initial_platforms()
+        self.next_platform_x = self.platforms[-1]['rect'].x + self.rng.randint(250, 800)
+        # First obstacle off-screen to the right, then one every OBSTACLE_GAP
+        self.next_obstacle_x = self.screen_width + 200
+        self.update(0, 0)
+
+    def update(self, camera_left, player_world_x):
+        """Generate chunks ahead of the player and retire the ones far behind the camera"""
+        # Always cover the whole screen plus a chunk, even on very wide displays
+        generate_until = max(player_world_x + GENERATE_AHEAD, camera_left + self.screen_width + CHUNK_WIDTH)
+        while self.next_chunk * CHUNK_WIDTH < generate_until:
+            self._generate_chunk(self.next_chunk)
+            self.next_chunk += 1
+
+        retired = False
+        while (self.first_chunk + 1) * CHUNK_WIDTH + RETIRE_BEHIND < camera_left:
+            self.first_chunk += 1
+            retired = True
+        if retired:
+            live = []
+            for platform in self.platforms:
+                if platform['chunk'] >= self.first_chunk:
+                    live.append(platform)
+                else:
+                    self.platform_index.remove(platform)
+                    self._platform_pool.append(platform)
+            self.platforms[:] = live
+            self.obstacles.retire_chunks_before(self.first_chunk)
+
+    def _generate_initial_platforms(self):
+        """Generate random initial platforms relative to ground"""
+        x_positions = [500, 1000, 1500]  # Base positions
+        for base_x in x_positions:
+            # Add some randomness to position and size
+            x = base_x + self.rng.randint(-100, 100)
+            # Platform Y positions relative to ground (150-300 pixels above ground for higher Mario jump)
+            y = (self.screen_height - 50) - self.rng.randint(150, 300)  # Higher platforms for bigger Mario
+            width = self.rng.choice([200, 250, 300, 350, 400])  # Larger platform widths
+            height = self.rng.choice([20, 25, 30])  # Slightly thicker platforms
+            self._add_platform(x, y, width, height, x // CHUNK_WIDTH)
+
+            # Sometimes add an extra platform nearby
+            if self.rng.random() < 0.4:  # 40% chance
+                extra_x = x + self.rng.randint(200, 400)
+                extra_y = y + self.rng.randint(-80, 80)  # More vertical variation
+                # Keep platforms reasonable distance from ground
+                extra_y = max(self.screen_height - 350, min(self.screen_height - 120, extra_y))  # Adjusted bounds
+                extra_width = self.rng.choice([180, 220, 250])  # Larger extra platforms
+                self._add_platform(extra_x, extra_y, extra_width, 20, extra_x // CHUNK_WIDTH)
+
+    def _generate_chunk(self, chunk):
+        chunk_end = (chunk + 1) * CHUNK_WIDTH
+
+        while self.next_obstacle_x < chunk_end:
+            self._add_obstacle(self.next_obstacle_x, chunk)
+            self.next_obstacle_x += OBSTACLE_GAP
+
+        while self.next_platform_x < chunk_end:
+            new_x = self.next_platform_x
+            # More varied vertical positioning (relative to ground) - higher for bigger Mario
+            new_y = self.rng.randint(self.screen_height - 350, self.screen_height - 120)
+            # Randomize platform width and height - larger for bigger Mario
+            platform_width = self.rng.choice([180, 220, 250, 300, 350, 400])  # Larger widths
+            platform_height = self.rng.choice([20, 25, 30])  # Thicker platforms
+            self._add_platform(new_x, new_y, platform_width, platform_height, chunk)
+            last_x = new_x
+
+            # Sometimes add a second platform nearby for interesting jumps
+            if self.rng.random() < 0.3:  # 30% chance
+                bonus_x = new_x + self.rng.randint(150, 300)
+                bonus_y = new_y + self.rng.randint(-100, 100)  # More vertical variation
+                bonus_y = max(self.screen_height - 400, min(self.screen_height - 120, bonus_y))  # Better bounds for higher platforms
+                bonus_width = self.rng.choice([150, 180, 220])  # Larger bonus platforms
+                self._add_platform(bonus_x, bonus_y, bonus_width, 20, chunk)
+                last_x = bonus_x
+
+            # Randomize horizontal spacing (much more varied gaps), from the last platform added
+            self.next_platform_x = last_x + self.rng.randint(250, 800)
+
+    def _add_platform(self, x, y, width, height, chunk):
+        texture_id = self.rng.randint(0, self.texture_count - 1)
+        if self._platform_pool:
+            platform = self._platform_pool.pop()
+            platform['rect'].update(x, y, width, height)
+            platform['texture_id'] = texture_id
+            platform['chunk'] = chunk
+        else:
+            platform = {'rect': pygame.Rect(x, y, width, height), 'texture_id': texture_id, 'chunk': chunk}
+        self.platforms.append(platform)
+        self.platform_index.insert(platform)
+
+    def _add_obstacle(self, x, chunk):
+        speed = self.rng.uniform(2, 4)
+        direction = self.rng.choice([-1, 1])
+        range_limit = self.rng.randint(100, 300)
+        self.obstacles.add(x, self.ground_y - OBSTACLE_SIZE, speed, direction,
+                           x - range_limit, x + range_limit, chunk)